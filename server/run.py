@@ -1,11 +1,13 @@
 import json
 import logging
 import os
+from contextlib import aclosing
 from pathlib import Path
 
 import uvicorn
 from fastapi import FastAPI, HTTPException, Depends, Header
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
 
@@ -119,7 +121,7 @@ async def chat(
 ):
     """Query the RAG system."""
     try:
-        response = rag_service.query(
+        response = await rag_service.query(
             query=request.query,
             vault_name=request.vault_name
         )
@@ -128,6 +130,29 @@ async def chat(
         logger.error(f"Error processing chat: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/chat/stream")
+async def chat_stream(
+    request: ChatRequest,
+    _: None = Depends(verify_api_key)
+):
+    """Query the RAG system, streaming the response as server-sent events."""
+    async def events():
+        # A disconnected client leaves the stream suspended mid-response;
+        # closing it stops generation
+        stream = rag_service.query_stream(
+            query=request.query,
+            vault_name=request.vault_name
+        )
+        try:
+            async with aclosing(stream):
+                async for token in stream:
+                    yield f"data: {json.dumps(token)}\n\n"
+        except Exception as e:
+            logger.error(f"Error processing chat: {str(e)}")
+            yield f"event: error\ndata: {json.dumps(str(e))}\n\n"
+    
+    return StreamingResponse(events(), media_type="text/event-stream")
+
 @app.get("/vaults")
 async def list_vaults(_: None = Depends(verify_api_key)):
     """List all registered vaults."""
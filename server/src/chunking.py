@@ -1,12 +1,18 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import re
 import os
 
+# Compiled once at import instead of looked up in re's cache on every call
+_SENTENCE_END_RE = re.compile(r'[.!?][\s]{1,2}')
+
 class ChunkingStrategy(ABC):
-    def __init__(self):
-        self.chunk_size = int(os.getenv("RAG_CHUNK_SIZE", "500"))
-        self.chunk_overlap = int(os.getenv("RAG_CHUNK_OVERLAP", "50"))
+    def __init__(self, chunk_size: Optional[int] = None, chunk_overlap: Optional[int] = None):
+        """Settings not passed explicitly are read from the environment."""
+        self.chunk_size = chunk_size if chunk_size is not None else int(os.getenv("RAG_CHUNK_SIZE", "500"))
+        self.chunk_overlap = (
+            chunk_overlap if chunk_overlap is not None else int(os.getenv("RAG_CHUNK_OVERLAP", "50"))
+        )
         
     @abstractmethod
     def chunk(self, text: str) -> List[Dict[str, Any]]:
@@ -15,13 +21,22 @@ class ChunkingStrategy(ABC):
         
     def _clean_text(self, text: str) -> str:
         """Clean text by removing extra whitespace."""
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        # Same result as collapsing \s+ runs and stripping: str.split() and
+        # re's \s use the same Unicode whitespace, without a regex pass
+        return ' '.join(text.split())
 
 class MarkdownChunker(ChunkingStrategy):
-    def __init__(self):
-        super().__init__()
-        self.preserve_markdown = os.getenv("RAG_PRESERVE_MARKDOWN", "1") == "1"
+    def __init__(
+        self,
+        chunk_size: Optional[int] = None,
+        chunk_overlap: Optional[int] = None,
+        preserve_markdown: Optional[bool] = None
+    ):
+        super().__init__(chunk_size, chunk_overlap)
+        self.preserve_markdown = (
+            preserve_markdown if preserve_markdown is not None
+            else os.getenv("RAG_PRESERVE_MARKDOWN", "1") == "1"
+        )
         
     def chunk(self, text: str) -> List[Dict[str, Any]]:
         """Split markdown text into semantic chunks."""
@@ -123,14 +138,14 @@ class MarkdownChunker(ChunkingStrategy):
         return chunks
 
 class SentenceChunker(ChunkingStrategy):
-    def __init__(self):
-        super().__init__()
-        self.sentence_end = r'[.!?][\s]{1,2}'
+    def __init__(self, chunk_size: Optional[int] = None, chunk_overlap: Optional[int] = None):
+        super().__init__(chunk_size, chunk_overlap)
+        self.sentence_end = _SENTENCE_END_RE
         
     def chunk(self, text: str) -> List[Dict[str, Any]]:
         """Split text into chunks at sentence boundaries."""
         chunks = []
-        sentences = re.split(self.sentence_end, text)
+        sentences = self.sentence_end.split(text)
         
         current_chunk = []
         current_length = 0
@@ -1,4 +1,5 @@
 """Embeddings package initialization."""
 from .embeddings_manager import EmbeddingsManager
+from .query_batcher import QueryBatcher
 
-__all__ = ["EmbeddingsManager"]
+__all__ = ["EmbeddingsManager", "QueryBatcher"]
@@ -1,4 +1,8 @@
 """Apple-specific embeddings manager using CoreML and Neural Engine."""
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import coremltools as ct
 import numpy as np
 from typing import List, Dict, Any, Optional, Tuple
@@ -44,6 +48,13 @@ class AppleEmbeddingsManager(EmbeddingsManager):
         self.tokenizer = None
         self.model_dir = Path(cache_dir) / "coreml_models" if cache_dir else None
         
+        # Tokenization and CoreML prediction block, so batches run off the
+        # event loop. Threads rather than processes: MLModel handles cannot
+        # be pickled, and both the Rust tokenizer and predict() release the
+        # GIL. A model is only used from one thread at a time
+        self._pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+        self._predict_lock = threading.Lock()
+        
         if self.model_dir:
             self.model_dir.mkdir(parents=True, exist_ok=True)
             
@@ -187,7 +198,7 @@ class AppleEmbeddingsManager(EmbeddingsManager):
         safe_name = "".join(c if c.isalnum() else "_" for c in model_name)
         return self.model_dir / f"{safe_name}.mlmodel"
     
-    def get_embeddings(
+    async def get_embeddings(
         self,
         chunks: List[Any],
         use_cache: bool = True,
@@ -205,7 +216,7 @@ class AppleEmbeddingsManager(EmbeddingsManager):
             Tuple of (embeddings array, chunk metadata list)
         """
         if not self.coreml_model or not self._is_apple_silicon():
-            return super().get_embeddings(chunks, use_cache, batch_size)
+            return await super().get_embeddings(chunks, use_cache, batch_size)
         
         if not chunks:
             return np.array([]), []
@@ -230,37 +241,15 @@ class AppleEmbeddingsManager(EmbeddingsManager):
         
         # Generate new embeddings for uncached texts
         if texts_to_embed:
-            new_embeddings = []
-            
-            # Process in batches
-            for i in range(0, len(texts_to_embed), batch_size):
-                batch_texts = texts_to_embed[i:i + batch_size]
-                
-                try:
-                    # Preprocess batch
-                    batch_inputs = [self._preprocess_text(text) for text in batch_texts]
-                    
-                    # Get embeddings using CoreML
-                    batch_predictions = []
-                    for inputs in batch_inputs:
-                        prediction = self.coreml_model.predict(inputs)
-                        embedding = prediction["output"]
-                        # Normalize embedding
-                        embedding = embedding / np.linalg.norm(embedding)
-                        batch_predictions.append(embedding)
-                    
-                    new_embeddings.extend(batch_predictions)
-                    
-                except Exception as e:
-                    logger.error(f"CoreML prediction error: {str(e)}")
-                    # Fall back to CPU if CoreML fails
-                    batch_embeddings = self.model.encode(
-                        batch_texts,
-                        convert_to_numpy=True,
-                        normalize_embeddings=True,
-                        show_progress_bar=False
-                    )
-                    new_embeddings.extend(batch_embeddings)
+            # Batches run concurrently on the worker pool
+            loop = asyncio.get_running_loop()
+            batch_results = await asyncio.gather(*(
+                loop.run_in_executor(
+                    self._pool, self._embed_batch, texts_to_embed[i:i + batch_size]
+                )
+                for i in range(0, len(texts_to_embed), batch_size)
+            ))
+            new_embeddings = [embedding for batch in batch_results for embedding in batch]
             
             # Cache new embeddings
             if use_cache:
@@ -271,7 +260,48 @@ class AppleEmbeddingsManager(EmbeddingsManager):
         
         return np.array(embeddings), metadata_list
     
-    def search(
+    def _embed_batch(self, batch_texts: List[str]) -> List[np.ndarray]:
+        """
+        Tokenize and embed a batch with CoreML, on a worker thread.
+        
+        Args:
+            batch_texts: Texts to embed
+            
+        Returns:
+            List of normalized embeddings
+        """
+        try:
+            batch_inputs = [self._preprocess_text(text) for text in batch_texts]
+            
+            batch_predictions = []
+            for inputs in batch_inputs:
+                with self._predict_lock:
+                    prediction = self.coreml_model.predict(inputs)
+                embedding = prediction["output"]
+                # Normalize embedding
+                embedding = embedding / np.linalg.norm(embedding)
+                batch_predictions.append(embedding)
+            return batch_predictions
+            
+        except Exception as e:
+            logger.error(f"CoreML prediction error: {str(e)}")
+            # Fall back to CPU if CoreML fails
+            return list(self.model.encode(
+                batch_texts,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False
+            ))
+    
+    def _embed_query(self, query: str) -> np.ndarray:
+        """Embed and normalize a search query with CoreML, on a worker thread."""
+        query_inputs = self._preprocess_text(query)
+        with self._predict_lock:
+            query_prediction = self.coreml_model.predict(query_inputs)
+        query_embedding = query_prediction["output"]
+        return query_embedding / np.linalg.norm(query_embedding)
+    
+    async def search(
         self,
         query: str,
         embeddings: np.ndarray,
@@ -291,27 +321,25 @@ class AppleEmbeddingsManager(EmbeddingsManager):
             List of results with metadata and similarity scores
         """
         if not self.coreml_model or not self._is_apple_silicon():
-            return super().search(query, embeddings, metadata, top_k)
+            return await super().search(query, embeddings, metadata, top_k)
         
         if len(embeddings) == 0:
             return []
         
         try:
-            # Preprocess query
-            query_inputs = self._preprocess_text(query)
-            
             # Generate query embedding using CoreML
-            query_prediction = self.coreml_model.predict(query_inputs)
-            query_embedding = query_prediction["output"]
-            
-            # Normalize query embedding
-            query_embedding = query_embedding / np.linalg.norm(query_embedding)
+            loop = asyncio.get_running_loop()
+            query_embedding = await loop.run_in_executor(self._pool, self._embed_query, query)
             
             # Calculate similarities on CPU (small operation)
             similarities = np.dot(embeddings, query_embedding)
             
-            # Get top k results
-            top_indices = np.argsort(similarities)[-top_k:][::-1]
+            # Partition out the top k results, then sort only those
+            k = min(top_k, len(similarities))
+            if k <= 0:
+                return []
+            top_indices = np.argpartition(-similarities, k - 1)[:k]
+            top_indices = top_indices[np.argsort(-similarities[top_indices], kind="stable")]
             
             results = []
             for idx in top_indices:
@@ -324,4 +352,4 @@ class AppleEmbeddingsManager(EmbeddingsManager):
             
         except Exception as e:
             logger.error(f"CoreML search error: {str(e)}")
-            return super().search(query, embeddings, metadata, top_k) 
\ No newline at end of file
+            return await super().search(query, embeddings, metadata, top_k) 
\ No newline at end of file
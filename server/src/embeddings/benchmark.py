@@ -2,6 +2,7 @@
 import time
 import logging
 import numpy as np
+import psutil
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from pathlib import Path
@@ -156,71 +157,85 @@ class EmbeddingsBenchmark:
         Returns:
             List of benchmark results
         """
-        results = []
         test_data = self.generate_test_data(num_samples)
         
+        try:
+            # One manager serves every batch size, so the model loads once
+            manager = EmbeddingsManagerFactory.create(
+                model_name=model_name,
+                cache_dir=self.cache_dir,
+                force_cpu=force_cpu,
+                compute_units=compute_units
+            )
+        except Exception as e:
+            logger.error(f"Error creating embeddings manager for {model_name}: {str(e)}")
+            return []
+        
+        # Batch sizes run one at a time: concurrent runs on the shared model
+        # would overlap and skew each other's timings and memory deltas
+        results = []
         for batch_size in batch_sizes:
             try:
-                # Create manager for this configuration
-                manager = EmbeddingsManagerFactory.create(
-                    model_name=model_name,
-                    cache_dir=self.cache_dir,
-                    force_cpu=force_cpu,
-                    compute_units=compute_units
-                )
-                
-                # Warm up
-                logger.info(f"Warming up with batch size {batch_size}")
-                warmup_data = test_data[:batch_size]
-                await manager.get_embeddings(warmup_data, use_cache=False, batch_size=batch_size)
-                
-                # Measure memory before test
-                import psutil
-                process = psutil.Process()
-                start_mem = process.memory_info().rss / 1024 / 1024  # MB
-                
-                # Run benchmark
-                logger.info(f"Running benchmark with batch size {batch_size}")
-                start_time = time.time()
-                embeddings, _ = await manager.get_embeddings(
-                    test_data,
-                    use_cache=False,
-                    batch_size=batch_size
-                )
-                end_time = time.time()
-                
-                # Calculate metrics
-                total_time = end_time - start_time
-                avg_latency = (total_time * 1000) / len(test_data)  # ms
-                
-                # Estimate tokens/sec (rough approximation)
-                total_chars = sum(len(chunk.content) for chunk in test_data)
-                approx_tokens = total_chars / 4  # rough estimate
-                throughput = approx_tokens / total_time
-                
-                # Measure memory after test
-                end_mem = process.memory_info().rss / 1024 / 1024  # MB
-                memory_used = end_mem - start_mem
-                
-                # Create result
-                result = BenchmarkResult(
-                    model_name=model_name,
-                    device=manager.device,
-                    batch_size=batch_size,
-                    num_samples=num_samples,
-                    avg_latency_ms=avg_latency,
-                    throughput=throughput,
-                    memory_mb=memory_used,
-                    compute_units=compute_units
-                )
-                results.append(result)
-                
+                results.append(await self._run_batch_size(
+                    manager, test_data, batch_size, model_name, compute_units
+                ))
             except Exception as e:
                 logger.error(f"Error benchmarking batch size {batch_size}: {str(e)}")
-                continue
         
         return results
     
+    async def _run_batch_size(
+        self,
+        manager: Any,
+        test_data: List[Chunk],
+        batch_size: int,
+        model_name: str,
+        compute_units: str
+    ) -> BenchmarkResult:
+        """Benchmark a single batch size."""
+        # Warm up
+        logger.info(f"Warming up with batch size {batch_size}")
+        warmup_data = test_data[:batch_size]
+        await manager.get_embeddings(warmup_data, use_cache=False, batch_size=batch_size)
+        
+        # Measure memory before test
+        process = psutil.Process()
+        start_mem = process.memory_info().rss / 1024 / 1024  # MB
+        
+        # Run benchmark
+        logger.info(f"Running benchmark with batch size {batch_size}")
+        start_time = time.time()
+        embeddings, _ = await manager.get_embeddings(
+            test_data,
+            use_cache=False,
+            batch_size=batch_size
+        )
+        end_time = time.time()
+        
+        # Calculate metrics
+        total_time = end_time - start_time
+        avg_latency = (total_time * 1000) / len(test_data)  # ms
+        
+        # Estimate tokens/sec (rough approximation)
+        total_chars = sum(len(chunk.content) for chunk in test_data)
+        approx_tokens = total_chars / 4  # rough estimate
+        throughput = approx_tokens / total_time
+        
+        # Measure memory after test
+        end_mem = process.memory_info().rss / 1024 / 1024  # MB
+        memory_used = end_mem - start_mem
+        
+        return BenchmarkResult(
+            model_name=model_name,
+            device=manager.device,
+            batch_size=batch_size,
+            num_samples=len(test_data),
+            avg_latency_ms=avg_latency,
+            throughput=throughput,
+            memory_mb=memory_used,
+            compute_units=compute_units
+        )
+    
     def get_optimal_config(
         self,
         max_memory_mb: Optional[float] = None,
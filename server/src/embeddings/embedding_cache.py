@@ -0,0 +1,107 @@
+"""Persistent embedding cache keyed by chunk content hash."""
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Stay well below SQLite's bound-parameter limit per statement
+_LOOKUP_BATCH = 500
+
+class EmbeddingCache:
+    """SQLite store of embedding vectors keyed by (content hash, provider, model)."""
+
+    def __init__(self, path: str):
+        """Open (and create if needed) the cache database.
+
+        Args:
+            path: Path to the SQLite database file
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS embeddings (
+                hash TEXT NOT NULL,
+                provider TEXT NOT NULL,
+                model TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                PRIMARY KEY (hash, provider, model)
+            )"""
+        )
+        self._conn.commit()
+
+    def lookup(
+        self,
+        hashes: Iterable[str],
+        provider: str,
+        model: str
+    ) -> Dict[str, np.ndarray]:
+        """Fetch cached vectors for the given content hashes.
+
+        Args:
+            hashes: Content hashes to look up
+            provider: Embedding provider name
+            model: Embedding model name
+
+        Returns:
+            Dict[str, np.ndarray]: float32 vectors for the hashes that were cached
+        """
+        hashes = list(dict.fromkeys(hashes))
+        found = {}
+        with self._lock:
+            for i in range(0, len(hashes), _LOOKUP_BATCH):
+                batch = hashes[i:i + _LOOKUP_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT hash, vector FROM embeddings "
+                    f"WHERE provider = ? AND model = ? AND hash IN ({placeholders})",
+                    [provider, model, *batch]
+                )
+                for content_hash, blob in rows:
+                    found[content_hash] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def write(
+        self,
+        vectors: Dict[str, np.ndarray],
+        provider: str,
+        model: str
+    ):
+        """Store vectors, replacing any existing entries for the same keys.
+
+        Args:
+            vectors: Mapping of content hash to embedding vector
+            provider: Embedding provider name
+            model: Embedding model name
+        """
+        if not vectors:
+            return
+        rows = [
+            (content_hash, provider, model, np.asarray(vector, dtype=np.float32).tobytes())
+            for content_hash, vector in vectors.items()
+        ]
+        with self._lock:
+            try:
+                self._conn.executemany(
+                    "INSERT INTO embeddings (hash, provider, model, vector) "
+                    "VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (hash, provider, model) DO UPDATE SET vector = excluded.vector",
+                    rows
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self._conn.rollback()
+                logger.error(f"Error writing embedding cache: {str(e)}")
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -1,7 +1,7 @@
 """Manages embeddings for text chunks using sentence-transformers."""
 from sentence_transformers import SentenceTransformer
 import numpy as np
-from typing import List, Dict, Any, Optional, Tuple, Union
+from typing import List, Dict, Any, Optional, Sequence, Tuple, Union
 import logging
 import os
 import json
@@ -16,6 +16,9 @@ import coremltools as ct
 
 logger = logging.getLogger(__name__)
 
+# Forward-pass batch size for bulk encoding
+ENCODE_BATCH_SIZE = 64
+
 class EmbeddingsManager:
     """Manages embeddings generation and caching."""
     
@@ -36,6 +39,8 @@ class EmbeddingsManager:
         self.cache_dir = cache_dir
         self.use_neural_engine = self._should_use_neural_engine()
         self.device = device if device else self._get_device()
+        # Cached for branching in the embedding path without formatting the device
+        self._device_type = torch.device(self.device).type
         self.model = SentenceTransformer(self.model_name, device=self.device)
         
         if self.use_neural_engine:
@@ -102,7 +107,7 @@ class EmbeddingsManager:
             batch_size: Batch size for processing
             
         Returns:
-            Tuple of (embeddings array, metadata list)
+            Tuple of (unit-normalized float32 embeddings array, metadata list)
         """
         if not texts:
             raise ValueError("Empty input")
@@ -125,17 +130,42 @@ class EmbeddingsManager:
                 batch_size=batch_size or 32
             )
             
-            # Convert to numpy and normalize
-            embeddings = embeddings.cpu().numpy()
+            # Convert to numpy and normalize once, here, so callers can score
+            # with a plain dot product
+            if self._device_type != "cpu":
+                embeddings = embeddings.cpu()
+            embeddings = embeddings.numpy().astype(np.float32, copy=False)
             norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-            normalized_embeddings = embeddings / norms
+            # Zero vectors stay zero instead of turning into NaN
+            norms[norms == 0] = 1
+            embeddings /= norms
             
-            return normalized_embeddings, metadata
+            return embeddings, metadata
             
         except Exception as e:
             logger.error(f"Error generating embeddings: {e}")
             raise
     
+    async def encode_batch(
+        self,
+        texts: List[Union[str, Chunk]],
+        batch_size: int = ENCODE_BATCH_SIZE
+    ) -> np.ndarray:
+        """Embed many texts or chunks in one model call.
+        
+        For bulk indexing: the model batches internally, and no per-text
+        metadata is returned.
+        
+        Args:
+            texts: List of texts or chunks to embed
+            batch_size: Texts per forward pass
+            
+        Returns:
+            np.ndarray: (N, d) unit-normalized float32 embeddings
+        """
+        embeddings, _ = await self.get_embeddings(texts, batch_size=batch_size)
+        return embeddings
+    
     def clear_cache(self):
         """Clear the embeddings cache."""
         cache_dir = Path(os.getenv("RAG_CACHE_DIR", "~/.cache/obsidian-rag")).expanduser()
@@ -150,7 +180,7 @@ class EmbeddingsManager:
         self,
         query: str,
         embeddings: np.ndarray,
-        texts: List[str],
+        texts: Sequence[Any],
         max_results: int = 5
     ) -> List[Dict[str, Any]]:
         """Search for similar texts.
@@ -164,27 +194,47 @@ class EmbeddingsManager:
         Returns:
             List[Dict]: Search results with similarity scores
         """
-        if len(embeddings) == 0:
-            return []
+        top_indices, similarities = await self.search_indices(query, embeddings, max_results)
         
-        # Get query embedding
-        query_embedding = await self.get_embeddings([query])
-        query_embedding = query_embedding[0]  # Get first (and only) embedding
+        # Only the hits are looked up in texts
+        return [
+            {"text": texts[idx], "similarity": float(similarity)}
+            for idx, similarity in zip(top_indices, similarities)
+        ]
+    
+    async def search_indices(
+        self,
+        query: str,
+        embeddings: np.ndarray,
+        max_results: int = 5
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the rows most similar to a query without materializing results.
         
-        # Calculate similarities
-        similarities = np.dot(embeddings, query_embedding)
+        Args:
+            query: Search query
+            embeddings: Pre-computed embeddings
+            max_results: Maximum number of results
+            
+        Returns:
+            Tuple of (row indices, similarities), best first
+        """
+        if len(embeddings) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
         
-        # Get top results
-        top_indices = np.argsort(similarities)[-max_results:][::-1]
+        # Get query embedding
+        query_embeddings, _ = await self.get_embeddings([query])
+        query_embedding = query_embeddings[0].astype(np.float32)
         
-        results = []
-        for idx in top_indices:
-            results.append({
-                "text": texts[idx],
-                "similarity": float(similarities[idx])
-            })
+        # Calculate similarities, upcasting float16 indices for the product
+        similarities = embeddings.astype(np.float32, copy=False) @ query_embedding
         
-        return results
+        # Partition out the top results, then sort only those
+        k = min(max_results, len(similarities))
+        if k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        top_indices = np.argpartition(-similarities, k - 1)[:k]
+        top_indices = top_indices[np.argsort(-similarities[top_indices], kind="stable")]
+        return top_indices, similarities[top_indices]
     
     async def run_benchmark(self) -> Dict[str, Any]:
         """Run performance benchmarks and return optimal settings."""
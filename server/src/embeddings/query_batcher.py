@@ -0,0 +1,95 @@
+"""Micro-batching of concurrent query embeddings."""
+import asyncio
+import logging
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .embeddings_manager import EmbeddingsManager
+
+logger = logging.getLogger(__name__)
+
+class QueryBatcher:
+    """Coalesces concurrent query embedding requests into batched calls.
+
+    Queries that arrive within ``max_wait`` seconds of each other are embedded
+    with a single ``get_embeddings`` call, so the model runs one batch instead
+    of many batch-of-one passes under concurrent load.
+    """
+
+    def __init__(
+        self,
+        embeddings_manager: EmbeddingsManager,
+        max_batch_size: int = 32,
+        max_wait: float = 0.01
+    ):
+        """Initialize the batcher.
+
+        Args:
+            embeddings_manager: Embeddings manager used to embed batches
+            max_batch_size: Maximum number of queries per batch
+            max_wait: Seconds to wait for more queries before flushing a batch
+        """
+        self.embeddings_manager = embeddings_manager
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def embed(self, text: str) -> np.ndarray:
+        """Embed a single query, batched with any concurrent queries.
+
+        Args:
+            text: Query text
+
+        Returns:
+            np.ndarray: Normalized query embedding
+        """
+        self._ensure_worker()
+        future = self._loop.create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    def _ensure_worker(self) -> None:
+        """Start the batching task on the running event loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Drain the queue in batches of up to ``max_batch_size`` queries."""
+        while True:
+            batch = [await self._queue.get()]
+            deadline = self._loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """Embed a batch and resolve each caller's future."""
+        try:
+            embeddings, _ = await self.embeddings_manager.get_embeddings(
+                [text for text, _ in batch]
+            )
+        except Exception as e:
+            logger.error(f"Error embedding query batch: {str(e)}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), embedding in zip(batch, embeddings):
+            # Callers may have been cancelled while the batch was running
+            if not future.done():
+                future.set_result(embedding)
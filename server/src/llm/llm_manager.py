@@ -1,7 +1,9 @@
 """LLM Manager for handling local language model inference with Apple Silicon optimizations."""
-from typing import Dict, Any, Optional
+from typing import AsyncIterator, Dict, Any, Optional
+import asyncio
 import logging
 import os
+import threading
 from pathlib import Path
 import json
 import platform
@@ -49,6 +51,10 @@ class LLMManager:
         if self.cache_dir:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
             
+        # One llama.cpp context decodes one prompt at a time; generation runs
+        # on worker threads, so concurrent requests queue on this lock
+        self._model_lock = asyncio.Lock()
+        
         # Load model with optimizations
         self.model = self._load_model()
         logger.info(f"Loaded model from {self.model_path}")
@@ -200,8 +206,7 @@ class LLMManager:
         prompt: str,
         system_prompt: str = "",
         temperature: Optional[float] = None,
-        max_tokens: Optional[int] = None,
-        stream: bool = False
+        max_tokens: Optional[int] = None
     ) -> str:
         """Generate a response for the given prompt.
         
@@ -210,7 +215,6 @@ class LLMManager:
             system_prompt: Optional system prompt for context
             temperature: Override default temperature
             max_tokens: Override default max tokens
-            stream: Whether to stream the response
             
         Returns:
             str: Generated response
@@ -223,43 +227,113 @@ class LLMManager:
             return cached
             
         try:
-            # Prepare the complete prompt
-            if system_prompt:
-                complete_prompt = f"{system_prompt}\n\n{prompt}"
-            else:
-                complete_prompt = prompt
-                
             # Generate response
+            async with self._model_lock:
+                response = await asyncio.to_thread(
+                    self.model,
+                    self._build_prompt(prompt, system_prompt),
+                    max_tokens=max_tokens or self.max_tokens,
+                    temperature=temperature or self.temperature,
+                    echo=False
+                )
+            generated_text = response["choices"][0]["text"].strip()
+            
+            # Cache the response
+            self._cache_response(cache_key, generated_text)
+            
+            return generated_text
+            
+        except Exception as e:
+            logger.error(f"Generation failed: {e}")
+            raise
+            
+    async def stream(
+        self,
+        prompt: str,
+        system_prompt: str = "",
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """Stream a response for the given prompt token by token.
+        
+        Args:
+            prompt: The user's prompt
+            system_prompt: Optional system prompt for context
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+            
+        Yields:
+            str: Generated text fragments as they are produced
+        """
+        # A cached response is replayed in one piece
+        cache_key = self._get_cache_key(prompt, system_prompt)
+        cached = self._get_cached_response(cache_key)
+        if cached:
+            logger.debug("Using cached response")
+            yield cached
+            return
+            
+        # Decoding runs on one worker thread under the model lock, which is
+        # held for the whole token loop since the context is mid-decode
+        # between tokens. Tokens are handed over through a queue, so the
+        # lock never waits on this generator's consumer: closing or
+        # cancelling the generator stops decoding after the current token
+        loop = asyncio.get_running_loop()
+        tokens: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+        
+        def decode():
             response = self.model(
-                complete_prompt,
+                self._build_prompt(prompt, system_prompt),
                 max_tokens=max_tokens or self.max_tokens,
                 temperature=temperature or self.temperature,
                 echo=False,
-                stream=stream
+                stream=True
             )
+            for chunk in response:
+                if stop.is_set():
+                    break
+                loop.call_soon_threadsafe(tokens.put_nowait, chunk["choices"][0]["text"])
+                
+        async def produce():
+            async with self._model_lock:
+                # Never cancelled, so the lock is only released once the
+                # worker thread is done with the model
+                await asyncio.to_thread(decode)
+                
+        def finished(task: asyncio.Task):
+            # Mark any error retrieved, in case the consumer is gone
+            if not task.cancelled():
+                task.exception()
+            tokens.put_nowait(None)
             
-            if stream:
-                # Handle streaming response
-                chunks = []
-                for chunk in response:
-                    text = chunk["choices"][0]["text"]
+        producer = asyncio.create_task(produce())
+        producer.add_done_callback(finished)
+        
+        try:
+            # Only keep the fragments around when they will be cached
+            chunks = [] if self.cache_dir else None
+            while (text := await tokens.get()) is not None:
+                if chunks is not None:
                     chunks.append(text)
-                    yield text
-                generated_text = "".join(chunks)
-            else:
-                # Handle regular response
-                generated_text = response["choices"][0]["text"].strip()
-            
-            # Cache the response
-            self._cache_response(cache_key, generated_text)
-            
-            if not stream:
-                return generated_text
-            
+                yield text
+            await producer
+                
+            if chunks is not None:
+                self._cache_response(cache_key, "".join(chunks).strip())
+                
         except Exception as e:
             logger.error(f"Generation failed: {e}")
             raise
+        finally:
+            stop.set()
             
+    def _build_prompt(self, prompt: str, system_prompt: str) -> str:
+        """Prepare the complete prompt."""
+        if system_prompt:
+            return f"{system_prompt}\n\n{prompt}"
+        return prompt
+        
     def get_stats(self) -> Dict[str, Any]:
         """Get model and hardware statistics."""
         import psutil
@@ -274,7 +348,7 @@ class LLMManager:
             "hardware": {
                 "metal_available": self._should_use_metal(),
                 "neural_engine_enabled": self.use_neural_engine,
-                "cpu_usage": psutil.cpu_percent(interval=1),
+                "cpu_usage": psutil.cpu_percent(interval=None),
                 "memory_usage": psutil.virtual_memory().percent
             },
             "cache": {
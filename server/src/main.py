@@ -1,5 +1,6 @@
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Optional
 import uvicorn
@@ -36,6 +37,15 @@ app.add_middleware(
 embeddings_manager = EmbeddingsManager()
 vault_manager = VaultManager(config_dir=os.getenv("RAG_CONFIG_DIR", "~/.config/obsidian-rag"))
 
+def get_vault_manager() -> VaultManager:
+    """Shared vault manager, so loaded indices persist across requests."""
+    return vault_manager
+
+@app.on_event("startup")
+async def prime_search_caches():
+    """Load vault indices before the first search arrives."""
+    await vault_manager.prime_caches()
+
 class SearchQuery(BaseModel):
     query: str
     max_results: int = 5
@@ -61,8 +71,8 @@ async def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
 
-@app.post("/search")
-async def search(query: SearchQuery, vault_manager: VaultManager = Depends()):
+@app.post("/search", response_class=ORJSONResponse)
+async def search(query: SearchQuery, vault_manager: VaultManager = Depends(get_vault_manager)):
     """Search through the vault using RAG."""
     try:
         results = await vault_manager.search(
@@ -70,13 +80,15 @@ async def search(query: SearchQuery, vault_manager: VaultManager = Depends()):
             max_results=query.max_results,
             vault_name=query.vault_name
         )
-        return {"results": results}
+        # Returned directly so results skip jsonable_encoder and are
+        # serialized in one orjson pass
+        return ORJSONResponse({"results": results})
     except Exception as e:
         logger.error(f"Search error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/index")
-async def index_documents(vault_name: str, vault_manager: VaultManager = Depends()):
+async def index_documents(vault_name: str, vault_manager: VaultManager = Depends(get_vault_manager)):
     """Index or reindex documents in a vault."""
     try:
         stats = await vault_manager.index_vault(vault_name)
@@ -89,7 +101,7 @@ async def index_documents(vault_name: str, vault_manager: VaultManager = Depends
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/vaults")
-async def list_vaults(vault_manager: VaultManager = Depends()):
+async def list_vaults(vault_manager: VaultManager = Depends(get_vault_manager)):
     """List all configured vaults."""
     try:
         vaults = await vault_manager.list_vaults()
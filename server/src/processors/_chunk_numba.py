@@ -0,0 +1,58 @@
+"""Compiled chunk boundary search for the sentence chunker."""
+import logging
+from typing import List, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Group kinds returned by pack_words()
+WORDS = 0
+LONG_WORD = 1
+
+def _pack_words(word_lengths: np.ndarray, max_size: int) -> List[Tuple[int, int, int]]:
+    """Greedily pack words into groups no longer than ``max_size``.
+
+    Each word costs its length plus one for the joining space. A word that
+    overflows on its own is emitted as a LONG_WORD group for the caller to
+    split by characters.
+
+    Args:
+        word_lengths: Length of each word
+        max_size: Maximum group size
+
+    Returns:
+        List of (first word, end word, kind) tuples in order
+    """
+    groups = []
+    group_start = 0
+    group_size = 0
+    for i in range(len(word_lengths)):
+        word_size = word_lengths[i] + 1
+        if group_size + word_size > max_size:
+            if group_size:
+                groups.append((group_start, i, WORDS))
+                group_size = 0
+            if word_size > max_size:
+                groups.append((i, i + 1, LONG_WORD))
+                group_start = i + 1
+            else:
+                group_start = i
+                group_size = word_size
+        else:
+            group_size += word_size
+    if group_size:
+        groups.append((group_start, len(word_lengths), WORDS))
+    return groups
+
+if NUMBA_AVAILABLE:
+    # Explicit signature compiles the kernel at import instead of first call
+    pack_words = njit("List(UniTuple(int64, 3))(int64[::1], int64)", cache=True)(_pack_words)
+else:
+    pack_words = _pack_words
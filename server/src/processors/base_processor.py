@@ -1,6 +1,7 @@
 """Base class for file processors."""
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import ClassVar, FrozenSet, List, Dict, Any
+from pathlib import Path
 from dataclasses import dataclass
 import logging
 
@@ -17,6 +18,9 @@ class ProcessedChunk:
 class BaseProcessor(ABC):
     """Base class for file processors."""
     
+    # Lower-case file extensions (with the dot) handled by this processor
+    SUPPORTED_EXTENSIONS: ClassVar[FrozenSet[str]] = frozenset()
+    
     def __init__(
         self,
         chunk_size: int = 500,
@@ -34,7 +38,6 @@ class BaseProcessor(ABC):
         self.chunk_overlap = chunk_overlap
         self.preserve_markdown = preserve_markdown
         
-    @abstractmethod
     def can_process(self, file_path: str) -> bool:
         """Check if this processor can handle the given file.
         
@@ -44,7 +47,7 @@ class BaseProcessor(ABC):
         Returns:
             bool: True if this processor can handle the file
         """
-        pass
+        return Path(file_path).suffix.lower() in self.SUPPORTED_EXTENSIONS
         
     @abstractmethod
     async def process(self, file_path: str) -> List[ProcessedChunk]:
@@ -3,6 +3,10 @@ from typing import List, Dict, Any, Optional
 import re
 from dataclasses import dataclass
 
+import numpy as np
+
+from ._chunk_numba import LONG_WORD, pack_words
+
 @dataclass
 class Chunk:
     """Represents a text chunk with metadata."""
@@ -168,7 +172,7 @@ class SentenceChunker(ChunkingStrategy):
             return []
             
         # Split text into sentences
-        sentences = [s.strip() for s in text.split(".") if s.strip()]
+        sentences = [s for s in map(str.strip, text.split(".")) if s]
         chunks = []
         current_chunk = []
         current_size = 0
@@ -191,46 +195,27 @@ class SentenceChunker(ChunkingStrategy):
                     current_chunk = []
                     current_size = 0
                 
-                # Split long sentence into smaller chunks
+                # Split long sentence into smaller chunks, finding the word
+                # groups in one compiled pass over the word lengths
                 words = sentence.split()
-                current_sentence = []
-                current_sentence_size = 0
+                word_lengths = np.fromiter(map(len, words), dtype=np.int64, count=len(words))
                 
-                for word in words:
-                    word_size = len(word) + 1  # +1 for space
-                    if current_sentence_size + word_size > max_chunk_size:
-                        if current_sentence:
-                            sentence_text = " ".join(current_sentence) + "."
+                for first, end, kind in pack_words(word_lengths, max_chunk_size):
+                    # Handle words longer than max_chunk_size
+                    if kind == LONG_WORD:
+                        word = words[first]
+                        for i in range(0, len(word), max_chunk_size):
+                            word_chunk = word[i:i+max_chunk_size]
                             chunks.append(Chunk(
-                                content=sentence_text,
+                                content=word_chunk,
                                 metadata=metadata.copy(),
                                 start_char=start_pos,
-                                end_char=start_pos + len(sentence_text)
+                                end_char=start_pos + len(word_chunk)
                             ))
-                            start_pos += len(sentence_text) + 1
-                            current_sentence = []
-                            current_sentence_size = 0
-                            
-                        # Handle words longer than max_chunk_size
-                        if word_size > max_chunk_size:
-                            for i in range(0, len(word), max_chunk_size):
-                                word_chunk = word[i:i+max_chunk_size]
-                                chunks.append(Chunk(
-                                    content=word_chunk,
-                                    metadata=metadata.copy(),
-                                    start_char=start_pos,
-                                    end_char=start_pos + len(word_chunk)
-                                ))
-                                start_pos += len(word_chunk)
-                        else:
-                            current_sentence.append(word)
-                            current_sentence_size = word_size
-                    else:
-                        current_sentence.append(word)
-                        current_sentence_size += word_size
-                
-                if current_sentence:
-                    sentence_text = " ".join(current_sentence) + "."
+                            start_pos += len(word_chunk)
+                        continue
+                        
+                    sentence_text = " ".join(words[first:end]) + "."
                     chunks.append(Chunk(
                         content=sentence_text,
                         metadata=metadata.copy(),
@@ -44,11 +44,22 @@ class FileProcessor:
             logger.error(f"Error processing file {file_path}: {str(e)}")
             return []
     
+    @staticmethod
+    def _read_text(file_path: Path) -> str:
+        """Read a text file as UTF-8 in one decode pass.
+        
+        Undecodable bytes are replaced rather than failing the whole file,
+        and line endings are normalized as text-mode reads would.
+        """
+        content = file_path.read_bytes().decode('utf-8', errors='replace')
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
+    
     def _process_markdown(self, file_path: Path) -> List[Chunk]:
         """Process markdown file."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self._read_text(file_path)
                 
             metadata = {
                 'source': str(file_path),
@@ -70,8 +81,7 @@ class FileProcessor:
     def _process_text(self, file_path: Path) -> List[Chunk]:
         """Process text file."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self._read_text(file_path)
                 
             metadata = {
                 'source': str(file_path),
@@ -9,13 +9,31 @@ from .base_processor import BaseProcessor, ProcessedChunk
 
 logger = logging.getLogger(__name__)
 
+# Patterns are compiled once at import rather than per processed file
+_FRONTMATTER_RE = re.compile(r'^---\n(.*?)\n---\n', re.DOTALL)
+_CODE_BLOCK_RE = re.compile(r'```.*?```', re.DOTALL)
+_INLINE_CODE_RE = re.compile(r'`.*?`')
+_IMAGE_RE = re.compile(r'!\[.*?\]\(.*?\)')
+_LINK_RE = re.compile(r'\[([^\]]+)\]\(.*?\)')
+_HEADER_MARK_RE = re.compile(r'#{1,6}\s+')
+_EMPHASIS_RE = re.compile(r'[*_]{1,2}(.*?)[*_]{1,2}')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_HEADER_LINE_RE = re.compile(r'(#{1,6}.*?)\n')
+_LIST_ITEM_RE = re.compile(r'(\n[*-]\s+.*?\n)(?=[^*\n-])')
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
+def _is_header(line: str) -> bool:
+    """Check for an ATX header (1-6 '#' then whitespace) without a regex."""
+    if not line.startswith('#'):
+        return False
+    level = len(line) - len(line.lstrip('#'))
+    return level <= 6 and line[level:level + 1].isspace()
+
 class MarkdownProcessor(BaseProcessor):
     """Processor for Markdown files."""
+
+    SUPPORTED_EXTENSIONS = frozenset({'.md', '.markdown'})
     
-    def can_process(self, file_path: str) -> bool:
-        """Check if this processor can handle the file."""
-        return Path(file_path).suffix.lower() in ['.md', '.markdown']
-        
     async def process(self, file_path: str) -> List[ProcessedChunk]:
         """Process a Markdown file into chunks."""
         file_path = Path(file_path)
@@ -56,7 +74,7 @@ class MarkdownProcessor(BaseProcessor):
         }
         
         # Extract YAML frontmatter
-        frontmatter_match = re.match(r'^---\n(.*?)\n---\n', content, re.DOTALL)
+        frontmatter_match = _FRONTMATTER_RE.match(content)
         if frontmatter_match:
             try:
                 import yaml
@@ -71,43 +89,43 @@ class MarkdownProcessor(BaseProcessor):
     def _remove_markdown(self, content: str) -> str:
         """Remove Markdown formatting while preserving content."""
         # Remove YAML frontmatter
-        content = re.sub(r'^---\n.*?\n---\n', '', content, flags=re.DOTALL)
+        content = _FRONTMATTER_RE.sub('', content)
         
         # Remove code blocks
-        content = re.sub(r'```.*?```', '', content, flags=re.DOTALL)
-        content = re.sub(r'`.*?`', '', content)
+        content = _CODE_BLOCK_RE.sub('', content)
+        content = _INLINE_CODE_RE.sub('', content)
         
         # Remove images and links
-        content = re.sub(r'!\[.*?\]\(.*?\)', '', content)
-        content = re.sub(r'\[([^\]]+)\]\(.*?\)', r'\1', content)
+        content = _IMAGE_RE.sub('', content)
+        content = _LINK_RE.sub(r'\1', content)
         
         # Remove headers
-        content = re.sub(r'#{1,6}\s+', '', content)
+        content = _HEADER_MARK_RE.sub('', content)
         
         # Remove emphasis
-        content = re.sub(r'[*_]{1,2}(.*?)[*_]{1,2}', r'\1', content)
+        content = _EMPHASIS_RE.sub(r'\1', content)
         
         # Remove HTML tags
-        content = re.sub(r'<[^>]+>', '', content)
+        content = _HTML_TAG_RE.sub('', content)
         
         return content
         
     def _preprocess_content(self, content: str) -> str:
         """Preprocess content for chunking."""
         # Remove YAML frontmatter if present
-        content = re.sub(r'^---\n.*?\n---\n', '', content, flags=re.DOTALL)
+        content = _FRONTMATTER_RE.sub('', content)
         
         # Normalize line endings
         content = content.replace('\r\n', '\n')
         
         # Add spacing around headers
-        content = re.sub(r'(#{1,6}.*?)\n', r'\1\n\n', content)
+        content = _HEADER_LINE_RE.sub(r'\1\n\n', content)
         
         # Ensure proper spacing around lists
-        content = re.sub(r'(\n[*-]\s+.*?\n)(?=[^*\n-])', r'\1\n', content)
+        content = _LIST_ITEM_RE.sub(r'\1\n', content)
         
         # Clean up extra whitespace
-        content = re.sub(r'\n{3,}', '\n\n', content)
+        content = _BLANK_LINES_RE.sub('\n\n', content)
         content = content.strip()
         
         return content
@@ -127,7 +145,8 @@ class MarkdownProcessor(BaseProcessor):
         
         for line in lines:
             # Start new chunk on headers
-            if re.match(r'^#{1,6}\s+', line):
+            # Most lines fail the first-character check without a call
+            if line[:1] == '#' and _is_header(line):
                 if current_chunk:
                     chunk_text = '\n'.join(current_chunk)
                     chunks.extend(self._split_into_chunks(chunk_text, metadata))
@@ -1,5 +1,7 @@
 """PDF file processor."""
+import asyncio
 import re
+import threading
 from typing import List, Dict, Any
 from pathlib import Path
 import logging
@@ -10,15 +12,29 @@ from .base_processor import BaseProcessor, ProcessedChunk
 
 logger = logging.getLogger(__name__)
 
+# PyMuPDF is not thread-safe, so documents are parsed one at a time
+_FITZ_LOCK = threading.Lock()
+
 class PDFProcessor(BaseProcessor):
     """Processor for PDF files."""
+
+    SUPPORTED_EXTENSIONS = frozenset({'.pdf'})
     
-    def can_process(self, file_path: str) -> bool:
-        """Check if this processor can handle the file."""
-        return Path(file_path).suffix.lower() == '.pdf'
-        
     async def process(self, file_path: str) -> List[ProcessedChunk]:
-        """Process a PDF file into chunks."""
+        """Process a PDF file into chunks.
+        
+        Text extraction and chunking are CPU-bound, so they run on a worker
+        thread to keep the event loop responsive.
+        """
+        return await asyncio.to_thread(self._process_file, file_path)
+        
+    def _process_file(self, file_path: str) -> List[ProcessedChunk]:
+        """Parse and chunk a PDF file on the calling thread."""
+        with _FITZ_LOCK:
+            return self._parse(file_path)
+            
+    def _parse(self, file_path: str) -> List[ProcessedChunk]:
+        """Extract and chunk a PDF's text; callers hold _FITZ_LOCK."""
         file_path = Path(file_path)
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
@@ -63,6 +79,8 @@ class PDFProcessor(BaseProcessor):
                                 font_properties["is_bold"]
                             )
                             
+                            # Shorter text carries over into the next chunk
+                            # rather than being dropped
                             if is_header and current_chunk:
                                 chunk_text = " ".join(current_chunk)
                                 if len(chunk_text) >= self.chunk_size // 2:
@@ -74,8 +92,8 @@ class PDFProcessor(BaseProcessor):
                                     chunks.extend(
                                         self._split_into_chunks(chunk_text, chunk_metadata)
                                     )
-                                current_chunk = []
-                                current_length = 0
+                                    current_chunk = []
+                                    current_length = 0
                                 
                             # Add text to current chunk
                             current_chunk.append(text)
@@ -95,7 +113,8 @@ class PDFProcessor(BaseProcessor):
                                 current_chunk = []
                                 current_length = 0
                                 
-                # Force chunk break at page boundaries
+                # Force chunk break at page boundaries, unless the page's
+                # text is too short to stand on its own
                 if current_chunk:
                     chunk_text = " ".join(current_chunk)
                     if len(chunk_text) >= self.chunk_size // 2:
@@ -107,21 +126,20 @@ class PDFProcessor(BaseProcessor):
                         chunks.extend(
                             self._split_into_chunks(chunk_text, chunk_metadata)
                         )
-                    current_chunk = []
-                    current_length = 0
+                        current_chunk = []
+                        current_length = 0
                     
             # Handle any remaining text
             if current_chunk:
                 chunk_text = " ".join(current_chunk)
-                if len(chunk_text) >= self.chunk_size // 2:
-                    chunk_metadata = metadata.copy()
-                    chunk_metadata.update({
-                        "page": doc.page_count,
-                        "position": len(chunks)
-                    })
-                    chunks.extend(
-                        self._split_into_chunks(chunk_text, chunk_metadata)
-                    )
+                chunk_metadata = metadata.copy()
+                chunk_metadata.update({
+                    "page": doc.page_count,
+                    "position": len(chunks)
+                })
+                chunks.extend(
+                    self._split_into_chunks(chunk_text, chunk_metadata)
+                )
                     
             doc.close()
             return chunks
@@ -90,10 +90,4 @@ class ProcessorFactory:
         Returns:
             List[str]: List of supported extensions (e.g. ['.md', '.pdf'])
         """
-        extensions = set()
-        for processor in self.processors:
-            # Call can_process with test paths
-            for ext in ['.md', '.markdown', '.pdf', '.doc', '.docx']:
-                if processor.can_process(f"test{ext}"):
-                    extensions.add(ext)
-        return sorted(list(extensions)) 
\ No newline at end of file
+        return sorted(set().union(*(p.SUPPORTED_EXTENSIONS for p in self.processors))) 
\ No newline at end of file
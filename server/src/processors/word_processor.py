@@ -1,50 +1,77 @@
 """Microsoft Word document processor."""
-import re
-from typing import List, Dict, Any
+import asyncio
+import zipfile
+from typing import List, Dict, Any, Iterator, Tuple
 from pathlib import Path
 import logging
 from datetime import datetime
-from docx import Document
-from docx.shared import Pt
-from docx.text.paragraph import Paragraph
+from lxml import etree
 
 from .base_processor import BaseProcessor, ProcessedChunk
 
 logger = logging.getLogger(__name__)
 
+# WordprocessingML element names
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_BODY = f"{_W}body"
+_P = f"{_W}p"
+_R = f"{_W}r"
+_T = f"{_W}t"
+_TAB = f"{_W}tab"
+_BR = f"{_W}br"
+_CR = f"{_W}cr"
+_VAL = f"{_W}val"
+
+# Core document properties (docProps/core.xml) mapped to metadata keys
+_CORE_PROPERTIES = {
+    "title": "{http://purl.org/dc/elements/1.1/}title",
+    "author": "{http://purl.org/dc/elements/1.1/}creator",
+    "subject": "{http://purl.org/dc/elements/1.1/}subject",
+    "keywords": "{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}keywords",
+    "doc_created": "{http://purl.org/dc/terms/}created",
+    "doc_modified": "{http://purl.org/dc/terms/}modified",
+}
+
 class WordProcessor(BaseProcessor):
-    """Processor for Microsoft Word documents."""
+    """Processor for Microsoft Word documents.
+    
+    Reads ``word/document.xml`` straight from the .docx archive and streams
+    body paragraphs with lxml instead of building a python-docx object graph.
+    """
+    
+    SUPPORTED_EXTENSIONS = frozenset({'.docx', '.doc'})
     
-    def can_process(self, file_path: str) -> bool:
-        """Check if this processor can handle the file."""
-        return Path(file_path).suffix.lower() in ['.docx', '.doc']
-        
     async def process(self, file_path: str) -> List[ProcessedChunk]:
-        """Process a Word document into chunks."""
+        """Process a Word document into chunks.
+        
+        Parsing and chunking are CPU-bound, so they run on a worker thread
+        to keep the event loop responsive.
+        """
+        return await asyncio.to_thread(self._process_file, file_path)
+        
+    def _process_file(self, file_path: str) -> List[ProcessedChunk]:
+        """Parse and chunk a Word document on the calling thread."""
         file_path = Path(file_path)
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
             
         try:
-            # Open document
-            doc = Document(file_path)
-            
             # Get document metadata
-            metadata = self._extract_metadata(doc, file_path)
+            metadata = self._extract_metadata(file_path)
             
             chunks = []
             current_chunk = []
             current_length = 0
+            paragraph_count = 0
             
             # Process each paragraph
-            for para_num, paragraph in enumerate(doc.paragraphs):
-                if not paragraph.text.strip():
+            for para_num, text, properties in self._iter_paragraphs(file_path):
+                paragraph_count = para_num + 1
+                if not text.strip():
                     continue
                     
-                # Get paragraph properties
-                properties = self._get_paragraph_properties(paragraph)
-                
-                # Start new chunk for headers
+                # Start new chunk for headers; shorter text carries
+                # over into the next chunk rather than being dropped
                 if properties["is_heading"] and current_chunk:
                     chunk_text = " ".join(current_chunk)
                     if len(chunk_text) >= self.chunk_size // 2:
@@ -56,11 +83,11 @@ class WordProcessor(BaseProcessor):
                         chunks.extend(
                             self._split_into_chunks(chunk_text, chunk_metadata)
                         )
-                    current_chunk = []
-                    current_length = 0
-                    
+                        current_chunk = []
+                        current_length = 0
+                        
                 # Add text to current chunk
-                text = paragraph.text.strip()
+                text = text.strip()
                 current_chunk.append(text)
                 current_length += len(text) + 1
                 
@@ -81,25 +108,64 @@ class WordProcessor(BaseProcessor):
             # Handle any remaining text
             if current_chunk:
                 chunk_text = " ".join(current_chunk)
-                if len(chunk_text) >= self.chunk_size // 2:
-                    chunk_metadata = metadata.copy()
-                    chunk_metadata.update({
-                        "paragraph": len(doc.paragraphs),
-                        "position": len(chunks)
-                    })
-                    chunks.extend(
-                        self._split_into_chunks(chunk_text, chunk_metadata)
-                    )
-                    
+                chunk_metadata = metadata.copy()
+                chunk_metadata.update({
+                    "paragraph": paragraph_count,
+                    "position": len(chunks)
+                })
+                chunks.extend(
+                    self._split_into_chunks(chunk_text, chunk_metadata)
+                )
+                
             return chunks
             
         except Exception as e:
             logger.error(f"Failed to process {file_path}: {e}")
             raise ValueError(f"Failed to process {file_path}: {e}")
             
+    def _iter_paragraphs(
+        self,
+        file_path: Path
+    ) -> Iterator[Tuple[int, str, Dict[str, Any]]]:
+        """Stream top-level body paragraphs from the archive's ``word/document.xml``.
+        
+        Yields:
+            Tuples of (paragraph index, paragraph text, paragraph properties)
+        """
+        with zipfile.ZipFile(file_path) as archive, archive.open("word/document.xml") as document_xml:
+            para_num = 0
+            for _, elem in etree.iterparse(
+                document_xml,
+                events=("end",),
+                tag=_P,
+                resolve_entities=False
+            ):
+                parent = elem.getparent()
+                # Paragraphs nested in tables or text boxes are not body paragraphs
+                if parent is None or parent.tag != _BODY:
+                    continue
+                    
+                yield para_num, self._get_paragraph_text(elem), self._get_paragraph_properties(elem)
+                para_num += 1
+                
+                # Release the parsed paragraph and everything before it
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del parent[0]
+                
+    def _get_paragraph_text(self, paragraph: etree._Element) -> str:
+        """Get the text of a paragraph, matching python-docx's ``Paragraph.text``."""
+        parts = []
+        for node in paragraph.iter(_T, _TAB, _BR, _CR):
+            if node.tag == _T:
+                parts.append(node.text or "")
+            elif node.getparent().tag == _R:
+                # Skip tab stop definitions in the paragraph properties
+                parts.append("\t" if node.tag == _TAB else "\n")
+        return "".join(parts)
+        
     def _extract_metadata(
         self,
-        doc: Document,
         file_path: Path
     ) -> Dict[str, Any]:
         """Extract metadata from Word document."""
@@ -112,24 +178,30 @@ class WordProcessor(BaseProcessor):
         }
         
         # Extract document properties
-        core_props = doc.core_properties
-        if core_props:
-            if core_props.title:
-                metadata["title"] = core_props.title
-            if core_props.author:
-                metadata["author"] = core_props.author
-            if core_props.subject:
-                metadata["subject"] = core_props.subject
-            if core_props.keywords:
-                metadata["keywords"] = core_props.keywords
-            if core_props.created:
-                metadata["doc_created"] = core_props.created.isoformat()
-            if core_props.modified:
-                metadata["doc_modified"] = core_props.modified.isoformat()
-                
+        with zipfile.ZipFile(file_path) as archive:
+            if "docProps/core.xml" not in archive.namelist():
+                return metadata
+            core_xml = archive.read("docProps/core.xml")
+            
+        core_props = etree.fromstring(
+            core_xml,
+            parser=etree.XMLParser(resolve_entities=False)
+        )
+        for key, tag in _CORE_PROPERTIES.items():
+            node = core_props.find(tag)
+            if node is None or not node.text or not node.text.strip():
+                continue
+            value = node.text.strip()
+            if key in ("doc_created", "doc_modified"):
+                try:
+                    value = datetime.fromisoformat(value.replace("Z", "+00:00")).isoformat()
+                except ValueError:
+                    pass
+            metadata[key] = value
+            
         return metadata
         
-    def _get_paragraph_properties(self, paragraph: Paragraph) -> Dict[str, Any]:
+    def _get_paragraph_properties(self, paragraph: etree._Element) -> Dict[str, Any]:
         """Get properties of a paragraph."""
         properties = {
             "is_heading": False,
@@ -140,22 +212,30 @@ class WordProcessor(BaseProcessor):
         }
         
         # Check style
-        if paragraph.style:
-            style_name = paragraph.style.name.lower()
+        style = paragraph.find(f"{_W}pPr/{_W}pStyle")
+        if style is not None:
+            style_name = (style.get(_VAL) or "").lower()
             if "heading" in style_name:
                 properties["is_heading"] = True
                 try:
                     properties["heading_level"] = int(style_name[-1])
-                except:
+                except ValueError:
                     pass
                     
         # Check runs for formatting
-        if paragraph.runs:
-            first_run = paragraph.runs[0]
-            if first_run.font:
-                if first_run.font.size:
-                    properties["font_size"] = first_run.font.size.pt
-                properties["is_bold"] = first_run.font.bold
-                properties["is_italic"] = first_run.font.italic
-                
-        return properties 
\ No newline at end of file
+        run_props = paragraph.find(f"{_R}/{_W}rPr")
+        if run_props is not None:
+            size = run_props.find(f"{_W}sz")
+            if size is not None and size.get(_VAL, "").isdigit():
+                properties["font_size"] = int(size.get(_VAL)) / 2  # half-points
+            properties["is_bold"] = self._get_toggle(run_props, "b")
+            properties["is_italic"] = self._get_toggle(run_props, "i")
+            
+        return properties 
+        
+    def _get_toggle(self, run_props: etree._Element, name: str):
+        """Read an on/off run property; None when not set, like python-docx."""
+        node = run_props.find(f"{_W}{name}")
+        if node is None:
+            return None
+        return node.get(_VAL, "true").lower() not in ("0", "false", "off")
@@ -1,17 +1,27 @@
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
+import asyncio
+import io
+from contextlib import aclosing
 import logging
 import os
 from pathlib import Path
-import json
 from datetime import datetime
+import orjson
 
 from ..processors.file_processor import FileProcessor
 from ..embeddings.embeddings_manager import EmbeddingsManager
 from ..llm.llm_manager import LLMManager
 from ..vault.vault_manager import VaultManager
+from .semantic_cache import SIMILARITY_THRESHOLD, SemanticCache
 
 logger = logging.getLogger(__name__)
 
+SYSTEM_PROMPT = """You are a helpful AI assistant answering questions based on the provided context.
+Use the following context to answer the question. If you cannot answer the question based on the context,
+say so clearly. Do not make up information."""
+
+NO_RESULTS_RESPONSE = "No relevant information found."
+
 class RAGService:
     """RAG service for Obsidian."""
     
@@ -36,6 +46,11 @@ class RAGService:
             config_dir=str(self.base_dir / "vault_config")
         )
         
+        # Responses to earlier near-identical queries against the same index
+        self.query_cache = SemanticCache(
+            threshold=float(os.getenv("RAG_QUERY_CACHE_THRESHOLD", str(SIMILARITY_THRESHOLD)))
+        )
+        
         # Initialize chunk storage
         self.chunks = {}
     
@@ -57,7 +72,9 @@ class RAGService:
         Returns:
             Dict: Vault configuration
         """
-        return self.vault_manager.add_vault(
+        # Config writes and watcher start/stop block, so keep them off the loop
+        return await asyncio.to_thread(
+            self.vault_manager.add_vault,
             name=name,
             path=path,
             file_types=file_types,
@@ -94,57 +111,124 @@ class RAGService:
         Raises:
             ValueError: If no vaults are configured
         """
-        vaults = await self.list_vaults()
-        if not vaults:
-            raise ValueError("No vaults configured")
+        await self._require_vaults()
         
-        # Get relevant chunks
-        results = await self.vault_manager.search(
-            query,
-            vault_name=vault_name,
-            max_results=max_results
-        )
+        # A paraphrase of an earlier query against the same index gets the
+        # earlier answer without retrieval or generation
+        scope = (vault_name, max_results)
+        version = await self.vault_manager.index_version()
+        embedding = await self.vault_manager.embed_query(query)
+        cached = self.query_cache.get(embedding, scope, version)
+        if cached is not None:
+            return self._copy_result(cached)
+        
+        results = await self._retrieve(query, vault_name, max_results)
         
         if not results:
-            return {
-                "response": "No relevant information found.",
+            result = {
+                "response": NO_RESULTS_RESPONSE,
                 "sources": []
             }
+        else:
+            # Generate response
+            response = await self.llm_manager.generate(
+                prompt=self._build_user_prompt(query, results),
+                system_prompt=SYSTEM_PROMPT
+            )
+            
+            result = {
+                "response": response,
+                "sources": [
+                    {
+                        "content": r["content"],
+                        "source": r["source"],
+                        "similarity": r["similarity"]
+                    }
+                    for r in results
+                ]
+            }
         
-        # Create prompt
-        context = "\n\n".join([
-            f"{r['content']}\n[Source: {r['source']}]"
-            for r in results
-        ])
+        # Cache a private copy so callers can't modify the cached entry
+        self.query_cache.put(embedding, scope, version, self._copy_result(result))
+        return result
+    
+    async def query_stream(
+        self,
+        query: str,
+        vault_name: Optional[str] = None,
+        max_results: int = 5
+    ) -> AsyncIterator[str]:
+        """Query the RAG system, streaming the response as it is generated.
         
-        system_prompt = """You are a helpful AI assistant answering questions based on the provided context.
-Use the following context to answer the question. If you cannot answer the question based on the context,
-say so clearly. Do not make up information."""
+        Args:
+            query: User's question
+            vault_name: Optional vault to restrict search to
+            max_results: Maximum number of results
+            
+        Yields:
+            str: Response text fragments
+            
+        Raises:
+            ValueError: If no vaults are configured
+        """
+        await self._require_vaults()
+        results = await self._retrieve(query, vault_name, max_results)
         
-        user_prompt = f"""Context:
-{context}
-
-Question: {query}
-
-Answer:"""
+        if not results:
+            yield NO_RESULTS_RESPONSE
+            return
         
-        # Generate response
-        response = await self.llm_manager.generate(
-            prompt=user_prompt,
-            system_prompt=system_prompt
+        # Close the generation stream as soon as this stream is closed, so
+        # the model stops decoding for a consumer that has gone away
+        stream = self.llm_manager.stream(
+            prompt=self._build_user_prompt(query, results),
+            system_prompt=SYSTEM_PROMPT
         )
-        
-        return {
-            "response": response,
-            "sources": [
-                {
-                    "content": r["content"],
-                    "source": r["source"],
-                    "similarity": r["similarity"]
-                }
-                for r in results
-            ]
-        }
+        async with aclosing(stream):
+            async for token in stream:
+                yield token
+    
+    async def _retrieve(
+        self,
+        query: str,
+        vault_name: Optional[str],
+        max_results: int
+    ) -> List[Dict[str, Any]]:
+        """Get the chunks relevant to a query."""
+        return await self.vault_manager.search(
+            query,
+            vault_name=vault_name,
+            max_results=max_results
+        )
+    
+    @staticmethod
+    def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a query result down to its source dicts."""
+        return {**result, "sources": [dict(source) for source in result["sources"]]}
+    
+    async def _require_vaults(self):
+        """Raise ValueError if no vaults are configured."""
+        vaults = await self.list_vaults()
+        if not vaults:
+            raise ValueError("No vaults configured")
+    
+    def _build_user_prompt(self, query: str, results: List[Dict[str, Any]]) -> str:
+        """Create the user prompt from the query and retrieved chunks."""
+        # Write everything into one growing buffer instead of joining
+        # a temporary string per result
+        buf = io.StringIO()
+        buf.write("Context:\n")
+        for i, r in enumerate(results):
+            if i:
+                buf.write("\n\n")
+            buf.write(r["content"])
+            buf.write("\n[Source: ")
+            buf.write(str(r["source"]))
+            buf.write("]")
+        buf.write("\n\nQuestion: ")
+        buf.write(query)
+        buf.write("\n\nAnswer:")
+        return buf.getvalue()
     
     async def list_vaults(self) -> List[Dict[str, Any]]:
         """List registered vaults.
@@ -160,7 +244,7 @@ Answer:"""
         Args:
             vault_name: Name of the vault to enable
         """
-        self.vault_manager.enable_vault(vault_name)
+        await asyncio.to_thread(self.vault_manager.enable_vault, vault_name)
     
     async def disable_vault(self, vault_name: str):
         """Disable a vault.
@@ -168,7 +252,7 @@ Answer:"""
         Args:
             vault_name: Name of the vault to disable
         """
-        self.vault_manager.disable_vault(vault_name)
+        await asyncio.to_thread(self.vault_manager.disable_vault, vault_name)
     
     async def remove_vault(self, vault_name: str):
         """Remove a vault.
@@ -176,7 +260,7 @@ Answer:"""
         Args:
             vault_name: Name of the vault to remove
         """
-        self.vault_manager.remove_vault(vault_name)
+        await asyncio.to_thread(self.vault_manager.remove_vault, vault_name)
     
     def _setup_vault_handler(self):
         """Set up handler for vault file changes."""
@@ -212,8 +296,8 @@ Answer:"""
         chunks_file = self.chunks_dir / "chunks.json"
         if chunks_file.exists():
             try:
-                with open(chunks_file, "r") as f:
-                    self.chunks = json.load(f)
+                with open(chunks_file, "rb") as f:
+                    self.chunks = orjson.loads(f.read())
             except Exception as e:
                 logger.error(f"Error loading chunks: {str(e)}")
                 self.chunks = {}
@@ -222,8 +306,8 @@ Answer:"""
         """Save chunks to disk."""
         chunks_file = self.chunks_dir / "chunks.json"
         try:
-            with open(chunks_file, "w") as f:
-                json.dump(self.chunks, f, indent=2)
+            with open(chunks_file, "wb") as f:
+                f.write(orjson.dumps(self.chunks, option=orjson.OPT_INDENT_2))
         except Exception as e:
             logger.error(f"Error saving chunks: {str(e)}")
             
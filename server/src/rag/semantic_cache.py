@@ -0,0 +1,113 @@
+"""Semantic cache of RAG responses keyed by query embedding."""
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Default number of cached responses and cosine similarity for a hit
+CACHE_SIZE = 1024
+SIMILARITY_THRESHOLD = 0.95
+
+class SemanticCache:
+    """LRU cache that returns a stored response for near-duplicate queries.
+
+    Query embeddings live in one preallocated matrix, so a lookup is a
+    single matrix-vector product over the occupied slots. Entries are
+    only compared within the same scope (e.g. vault and result count),
+    and the whole cache is dropped whenever the index version changes.
+    """
+
+    def __init__(self, size: int = CACHE_SIZE, threshold: float = SIMILARITY_THRESHOLD):
+        """Create an empty cache.
+
+        Args:
+            size: Maximum number of cached responses
+            threshold: Minimum cosine similarity for a query to match
+        """
+        self.size = size
+        self.threshold = threshold
+        self._embeddings: Optional[np.ndarray] = None
+        # Scope of each slot as a small int, -1 for free slots
+        self._scope_ids: Dict[Hashable, int] = {}
+        self._slot_scopes = np.full(size, -1, dtype=np.int64)
+        self._responses: list = [None] * size
+        # Occupied slots, least recently used first
+        self._lru: "OrderedDict[int, None]" = OrderedDict()
+        self._version: Any = None
+
+    def get(
+        self,
+        embedding: np.ndarray,
+        scope: Hashable,
+        version: Any
+    ) -> Optional[Dict[str, Any]]:
+        """Find the cached response for a similar query.
+
+        Args:
+            embedding: (d,) unit-normalized query embedding
+            scope: Key the cached query must share with this one
+            version: Current index version; a change clears the cache
+
+        Returns:
+            Optional[Dict]: Cached response, or None on a miss
+        """
+        self._check_version(version)
+        scope_id = self._scope_ids.get(scope)
+        if scope_id is None or self._embeddings.shape[1] != len(embedding):
+            return None
+
+        scores = self._embeddings @ embedding
+        # Free slots and other scopes can never match
+        scores[self._slot_scopes != scope_id] = -np.inf
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+
+        self._lru.move_to_end(best)
+        return self._responses[best]
+
+    def put(
+        self,
+        embedding: np.ndarray,
+        scope: Hashable,
+        version: Any,
+        response: Dict[str, Any]
+    ):
+        """Cache a response, evicting the least recently used one if full.
+
+        Args:
+            embedding: (d,) unit-normalized query embedding
+            scope: Key later queries must share to match
+            version: Index version the response was computed against
+            response: Response to return for matching queries
+        """
+        self._check_version(version)
+        if self._embeddings is None or self._embeddings.shape[1] != len(embedding):
+            self._embeddings = np.zeros((self.size, len(embedding)), dtype=np.float32)
+            self.clear()
+
+        # Slots only free up through clear(), so they fill in order
+        if len(self._lru) < self.size:
+            slot = len(self._lru)
+        else:
+            slot, _ = self._lru.popitem(last=False)
+
+        self._embeddings[slot] = embedding
+        self._slot_scopes[slot] = self._scope_ids.setdefault(scope, len(self._scope_ids))
+        self._responses[slot] = response
+        self._lru[slot] = None
+
+    def clear(self):
+        """Drop every cached response."""
+        self._scope_ids.clear()
+        self._slot_scopes.fill(-1)
+        self._responses = [None] * self.size
+        self._lru.clear()
+
+    def _check_version(self, version: Any):
+        if version != self._version:
+            self.clear()
+            self._version = version
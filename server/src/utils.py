@@ -1,3 +1,4 @@
+import functools
 import logging
 import os
 import platform
@@ -30,29 +31,32 @@ def setup_logging() -> logging.Logger:
 
 def get_platform_info() -> Dict[str, Any]:
     """Get detailed platform and system information."""
-    cpu_info = {
-        "physical_cores": psutil.cpu_count(logical=False),
-        "total_cores": psutil.cpu_count(logical=True),
-        "frequency": psutil.cpu_freq()._asdict() if psutil.cpu_freq() else None,
-        "usage": psutil.cpu_percent(interval=1, percpu=True)
+    info = _static_platform_info()
+    dynamic = _dynamic_platform_info()
+    
+    return {
+        **info,
+        "cpu": {**info["cpu"], **dynamic["cpu"]},
+        "memory": dynamic["memory"],
+        "gpu": {**info["gpu"], **dynamic["gpu"]}
     }
+
+@functools.lru_cache(maxsize=1)
+def _static_platform_info() -> Dict[str, Any]:
+    """Platform details that do not change while the server runs."""
+    # Prime the CPU usage counters so later non-blocking reads have a baseline
+    psutil.cpu_percent(interval=None, percpu=True)
     
-    memory = psutil.virtual_memory()
-    memory_info = {
-        "total": memory.total,
-        "available": memory.available,
-        "percent": memory.percent
+    cpu_info = {
+        "physical_cores": psutil.cpu_count(logical=False),
+        "total_cores": psutil.cpu_count(logical=True)
     }
     
     gpu_info = {}
     if torch.cuda.is_available():
         gpu_info = {
             "name": torch.cuda.get_device_name(0),
-            "count": torch.cuda.device_count(),
-            "memory": {
-                "allocated": torch.cuda.memory_allocated(0),
-                "cached": torch.cuda.memory_reserved(0)
-            }
+            "count": torch.cuda.device_count()
         }
     elif hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
         gpu_info = {
@@ -69,6 +73,36 @@ def get_platform_info() -> Dict[str, Any]:
         "processor": platform.processor(),
         "python_version": platform.python_version(),
         "torch_version": torch.__version__,
+        "cpu": cpu_info,
+        "gpu": gpu_info
+    }
+
+def _dynamic_platform_info() -> Dict[str, Any]:
+    """Current CPU, memory and GPU usage, read without blocking."""
+    cpu_freq = psutil.cpu_freq()
+    cpu_info = {
+        "frequency": cpu_freq._asdict() if cpu_freq else None,
+        # Usage since the previous call instead of sleeping for a 1s sample
+        "usage": psutil.cpu_percent(interval=None, percpu=True)
+    }
+    
+    memory = psutil.virtual_memory()
+    memory_info = {
+        "total": memory.total,
+        "available": memory.available,
+        "percent": memory.percent
+    }
+    
+    gpu_info = {}
+    if torch.cuda.is_available():
+        gpu_info = {
+            "memory": {
+                "allocated": torch.cuda.memory_allocated(0),
+                "cached": torch.cuda.memory_reserved(0)
+            }
+        }
+        
+    return {
         "cpu": cpu_info,
         "memory": memory_info,
         "gpu": gpu_info
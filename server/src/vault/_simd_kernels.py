@@ -0,0 +1,169 @@
+"""Fused similarity + top-k kernels for vault search."""
+import logging
+from typing import Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import simsimd
+    SIMSIMD_AVAILABLE = True
+except ImportError:
+    simsimd = None
+    SIMSIMD_AVAILABLE = False
+
+# Rows scored per parallel work item
+_BLOCK_SIZE = 256
+
+# Above this k the sorted-insertion buffers stop paying off
+_MAX_FUSED_K = 64
+
+# Rows dequantized per block when scoring int8 rows without SimSIMD
+_DEQUANT_BLOCK = 65_536
+
+# Reordering and contracting the dot product lets LLVM vectorize it. Full
+# fastmath would also assume no infinities, but the buffers are seeded
+# with -inf
+_FASTMATH = {"contract", "reassoc", "arcp"}
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=_FASTMATH, cache=True)
+    def _block_topk(embeddings, query, k):
+        """Score rows block by block, keeping each block's k best in sorted buffers."""
+        n, d = embeddings.shape
+        n_blocks = (n + _BLOCK_SIZE - 1) // _BLOCK_SIZE
+        indices = np.full((n_blocks, k), -1, dtype=np.int64)
+        scores = np.full((n_blocks, k), -np.inf, dtype=np.float32)
+
+        for block in prange(n_blocks):
+            start = block * _BLOCK_SIZE
+            end = min(start + _BLOCK_SIZE, n)
+            for row in range(start, end):
+                score = np.float32(0.0)
+                for j in range(d):
+                    score += embeddings[row, j] * query[j]
+
+                if score <= scores[block, k - 1]:
+                    continue
+
+                # Shift lower scores down to keep the buffer sorted
+                pos = k - 1
+                while pos > 0 and scores[block, pos - 1] < score:
+                    scores[block, pos] = scores[block, pos - 1]
+                    indices[block, pos] = indices[block, pos - 1]
+                    pos -= 1
+                scores[block, pos] = score
+                indices[block, pos] = row
+
+        return indices.ravel(), scores.ravel()
+
+def warm_up():
+    """Compile (or load from Numba's cache) the search kernel for float32 inputs.
+
+    Only the argument types matter for compilation, so a 1x1 matrix is enough.
+    """
+    if NUMBA_AVAILABLE:
+        _block_topk(np.zeros((1, 1), dtype=np.float32), np.zeros(1, dtype=np.float32), 1)
+
+def search_dtype() -> np.dtype:
+    """Dtype to hold the in-memory search matrix in.
+
+    float16 halves memory and bandwidth but NumPy has no BLAS path for it,
+    so it is only used when SimSIMD can score it natively.
+    """
+    return np.dtype(np.float16 if SIMSIMD_AVAILABLE else np.float32)
+
+def quantize_int8(rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Quantize rows to int8 with one symmetric scale per row.
+
+    Args:
+        rows: (N, d) or (d,) float rows
+
+    Returns:
+        Tuple of (int8 rows, float32 scales) such that
+        ``rows ~= int8_rows * scales[..., None]``
+    """
+    rows = np.asarray(rows, dtype=np.float32)
+    scales = np.abs(rows).max(axis=-1) / 127
+    # All-zero rows keep a scale of 1 so they dequantize to zero
+    scales = np.where(scales == 0, 1, scales)
+    quantized = np.rint(rows / scales[..., None]).astype(np.int8)
+    return quantized, scales.astype(np.float32)
+
+def _int8_scores(embeddings: np.ndarray, scales: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """Approximate dot products of int8 rows against a float query."""
+    if SIMSIMD_AVAILABLE:
+        query_i8, query_scale = quantize_int8(query)
+        dots = np.asarray(
+            simsimd.cdist(query_i8.reshape(1, -1), embeddings, metric="dot"), dtype=np.float32
+        )[0]
+        return dots * (scales * query_scale)
+
+    # NumPy has no int8 matmul that accumulates wider, so dequantize in blocks
+    scores = np.empty(len(embeddings), dtype=np.float32)
+    query = np.asarray(query, dtype=np.float32)
+    for start in range(0, len(embeddings), _DEQUANT_BLOCK):
+        block = embeddings[start:start + _DEQUANT_BLOCK].astype(np.float32)
+        scores[start:start + len(block)] = (block @ query) * scales[start:start + len(block)]
+    return scores
+
+def top_k(
+    embeddings: np.ndarray,
+    query: np.ndarray,
+    k: int,
+    scales: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Find the k rows with the highest dot product against a query.
+
+    int8 matrices (with ``scales``) and float16 matrices are scored with
+    SimSIMD's batched dot product. Otherwise uses a fused Numba kernel for
+    small k when Numba is installed, and a BLAS product plus
+    ``np.argpartition`` otherwise.
+
+    Args:
+        embeddings: (N, d) embedding matrix, int8 if ``scales`` is given
+        query: (d,) query vector
+        k: Number of results
+        scales: (N,) per-row scales from quantize_int8()
+
+    Returns:
+        Tuple of (row indices, scores), best first
+    """
+    k = min(k, len(embeddings))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+    # Strided or Fortran-order inputs would defeat the kernels' row-wise
+    # vector loads; both calls are no-ops for row slices of a C matrix
+    embeddings = np.ascontiguousarray(embeddings)
+    query = np.ascontiguousarray(query)
+
+    if scales is not None:
+        scores = _int8_scores(embeddings, scales, query)
+        indices = np.arange(len(scores))
+    elif SIMSIMD_AVAILABLE and embeddings.dtype == np.float16:
+        query = query.astype(np.float16).reshape(1, -1)
+        scores = np.asarray(simsimd.cdist(query, embeddings, metric="dot"), dtype=np.float32)[0]
+        indices = np.arange(len(scores))
+    elif NUMBA_AVAILABLE and k <= _MAX_FUSED_K:
+        query = query.astype(embeddings.dtype, copy=False)
+        indices, scores = _block_topk(embeddings, query, k)
+        valid = indices >= 0
+        indices, scores = indices[valid], scores[valid]
+    else:
+        scores = embeddings @ query
+        indices = np.arange(len(scores))
+
+    # Merge candidates: one partition plus a sort of just the k survivors
+    if len(scores) > k:
+        best = np.argpartition(-scores, k - 1)[:k]
+        indices, scores = indices[best], scores[best]
+    order = np.argsort(-scores, kind="stable")
+    return indices[order], scores[order]
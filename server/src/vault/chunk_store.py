@@ -0,0 +1,96 @@
+"""Optional Arrow-backed chunk metadata for vault search."""
+import logging
+from pathlib import Path
+from typing import Any, List, Sequence
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow as pa
+    ARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    ARROW_AVAILABLE = False
+
+# Feather (Arrow IPC file) written next to chunks.json
+CHUNKS_FILENAME = "chunks.feather"
+
+# orjson options for chunk metadata: frontmatter can have non-string keys,
+# and processors may emit NumPy scalars
+JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+def _schema():
+    # Metadata keys differ between processors, so everything besides content
+    # and source is kept as a JSON string to give every batch one schema
+    return pa.schema([
+        ("content", pa.string()),
+        ("source", pa.string()),
+        ("metadata", pa.string()),
+    ])
+
+class ArrowChunkWriter:
+    """Streams chunk dicts into an uncompressed Arrow IPC file.
+
+    The file is left uncompressed so readers can memory-map it and
+    materialize single rows without decoding whole columns.
+    """
+
+    def __init__(self, path: Path):
+        """Open the file for writing.
+
+        Args:
+            path: Destination path
+        """
+        self.path = path
+        self._sink = pa.OSFile(str(path), "wb")
+        self._writer = pa.ipc.new_file(self._sink, _schema())
+
+    def add(self, chunks: List[dict]):
+        """Append a batch of chunk dicts."""
+        if not chunks:
+            return
+        contents = []
+        sources = []
+        metadata = []
+        for chunk in chunks:
+            contents.append(chunk["content"])
+            sources.append(chunk.get("source"))
+            metadata.append(
+                orjson.dumps({k: v for k, v in chunk.items() if k != "content"}, option=JSON_OPTIONS).decode()
+            )
+        self._writer.write_batch(pa.record_batch([contents, sources, metadata], schema=_schema()))
+
+    def close(self):
+        """Finish the file."""
+        self._writer.close()
+        self._sink.close()
+
+def open_chunks(path: Path) -> Any:
+    """Memory-map a chunks file written by ArrowChunkWriter.
+
+    Returns:
+        pyarrow.Table: Zero-copy view of the file
+    """
+    # The table's buffers keep the mapping alive after this returns
+    return pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+
+def take_chunks(table: Any, indices: Sequence[int]) -> List[dict]:
+    """Materialize the chunk dicts for the given rows only.
+
+    Args:
+        table: Table returned by open_chunks()
+        indices: Row indices
+
+    Returns:
+        List[dict]: Chunk dicts in the order of ``indices``
+    """
+    rows = table.take(pa.array(indices, type=pa.int64()))
+    return [
+        {"content": content, **orjson.loads(metadata)}
+        for content, metadata in zip(
+            rows.column("content").to_pylist(),
+            rows.column("metadata").to_pylist()
+        )
+    ]
@@ -0,0 +1,156 @@
+"""Optional FAISS indices for vault search."""
+import logging
+import os
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    faiss = None
+    FAISS_AVAILABLE = False
+
+# Index file written next to embeddings.npy
+INDEX_FILENAME = "index.faiss"
+
+# Rows used to train quantizers, and rows upcast per add() call
+_TRAIN_SAMPLE = 100_000
+_ADD_BLOCK = 65_536
+
+# Above this many rows "auto" builds an HNSW graph instead of a flat scan
+HNSW_THRESHOLD = 100_000
+_HNSW_M = 32
+_HNSW_EF_CONSTRUCTION = 200
+_MIN_EF_SEARCH = 64
+
+# Product quantization: 8-bit codes over subvectors of about 8 dimensions.
+# Each codebook trains 256 centroids, which FAISS wants ~39 points apiece for
+_PQ_NBITS = 8
+_PQ_SUBVECTOR_DIM = 8
+_PQ_MIN_ROWS = 256 * 39
+# PQ scores are coarse, so this many candidates per result are re-scored
+# against the stored embeddings
+_PQ_RERANK_FACTOR = 10
+
+def resolve_index_type(index_type: str, num_rows: int) -> str:
+    """Pick the concrete index type for "auto" based on the row count."""
+    if index_type == "auto":
+        return "hnsw" if num_rows > HNSW_THRESHOLD else "sq8"
+    if index_type == "pq" and num_rows < _PQ_MIN_ROWS:
+        # Too few rows to train the codebooks
+        return "sq8"
+    return index_type
+
+def build_index(embeddings: np.ndarray, index_type: str = "auto") -> Any:
+    """Build an inner-product index over unit-normalized rows.
+
+    Rows are added in blocks, so ``embeddings`` can be a memory-mapped
+    float16 matrix without being upcast in full.
+
+    Args:
+        embeddings: (N, d) embedding matrix
+        index_type: "flat" for exact float32 search, "sq8" for 8-bit
+            scalar quantization (4x smaller, negligible recall loss on
+            normalized vectors), "pq" for product quantization (about one
+            byte per 8 dimensions, re-ranked against the stored rows at
+            search time), "hnsw" for a graph index with sublinear search
+            cost, or "auto" for "hnsw" above HNSW_THRESHOLD rows and "sq8"
+            otherwise
+
+    Returns:
+        faiss.Index: Index containing all rows
+    """
+    dim = embeddings.shape[1]
+    index_type = resolve_index_type(index_type, len(embeddings))
+    if index_type == "flat":
+        index = faiss.IndexFlatIP(dim)
+    elif index_type == "sq8":
+        index = faiss.IndexScalarQuantizer(
+            dim, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT
+        )
+        # Per-dimension ranges come from (a sample of) the rows themselves
+        index.train(_as_vectors(embeddings[:_TRAIN_SAMPLE]))
+    elif index_type == "pq":
+        index = faiss.IndexPQ(
+            dim, _pq_subquantizers(dim), _PQ_NBITS, faiss.METRIC_INNER_PRODUCT
+        )
+        index.train(_as_vectors(embeddings[:_TRAIN_SAMPLE]))
+    elif index_type == "hnsw":
+        index = faiss.IndexHNSWFlat(dim, _HNSW_M, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = _HNSW_EF_CONSTRUCTION
+    else:
+        raise ValueError(f"Unknown FAISS index type: {index_type}")
+
+    for start in range(0, len(embeddings), _ADD_BLOCK):
+        index.add(_as_vectors(embeddings[start:start + _ADD_BLOCK]))
+    return index
+
+def _pq_subquantizers(dim: int) -> int:
+    """Number of PQ subvectors: the largest divisor of dim up to dim / 8."""
+    for m in range(max(dim // _PQ_SUBVECTOR_DIM, 1), 0, -1):
+        if dim % m == 0:
+            return m
+    return 1
+
+def _as_vectors(rows: np.ndarray) -> np.ndarray:
+    """Copy rows into the contiguous unit-norm float32 layout FAISS expects."""
+    vectors = np.array(rows, dtype=np.float32, order="C")
+    faiss.normalize_L2(vectors)
+    return vectors
+
+def write_index(index: Any, path: Path):
+    """Write an index through a temp file and rename it into place."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    faiss.write_index(index, str(tmp_path))
+    os.replace(tmp_path, path)
+
+def read_index(path: Path) -> Any:
+    """Read an index, memory-mapping it where the index type supports it."""
+    try:
+        return faiss.read_index(str(path), faiss.IO_FLAG_MMAP)
+    except RuntimeError:
+        return faiss.read_index(str(path))
+
+def search_index(
+    index: Any,
+    query: np.ndarray,
+    k: int,
+    embeddings: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Search an index with a single query vector.
+
+    Args:
+        index: FAISS index
+        query: (d,) unit-normalized query vector
+        k: Number of results
+        embeddings: (N, d) stored rows, used to re-rank PQ candidates
+            with exact scores
+
+    Returns:
+        Tuple of (row indices, scores), best first
+    """
+    params = None
+    rerank = isinstance(index, faiss.IndexPQ) and embeddings is not None
+    candidates = k * _PQ_RERANK_FACTOR if rerank else k
+    if isinstance(index, faiss.IndexHNSW):
+        # Widen the graph search with k; passed per call so concurrent
+        # searches never share mutable index state
+        params = faiss.SearchParametersHNSW(efSearch=max(_MIN_EF_SEARCH, k * 8))
+    query = np.ascontiguousarray(query, dtype=np.float32)
+    scores, indices = index.search(query.reshape(1, -1), candidates, params=params)
+    # FAISS pads with -1 when the index holds fewer than k rows
+    valid = indices[0] >= 0
+    indices, scores = indices[0][valid], scores[0][valid]
+
+    if rerank:
+        # Gathers only the candidate rows from the (memory-mapped) matrix
+        order = np.sort(indices)
+        exact = np.asarray(embeddings[order], dtype=np.float32) @ query
+        best = np.argsort(-exact, kind="stable")[:k]
+        indices, scores = order[best], exact[best]
+    return indices, scores
@@ -0,0 +1,292 @@
+"""Streaming writer for vault index files."""
+import logging
+import os
+import struct
+from pathlib import Path
+from typing import Any, List, Optional
+
+import numpy as np
+import orjson
+
+from . import chunk_store, faiss_index, usearch_index
+from ._simd_kernels import quantize_int8
+
+logger = logging.getLogger(__name__)
+
+# Space reserved for the .npy header, patched once the row count is known
+_NPY_HEADER_SIZE = 128
+
+# int8 copy of embeddings.npy and its per-row scales
+INT8_FILENAME = "embeddings_i8.npy"
+SCALES_FILENAME = "scales.npy"
+
+# Rows quantized per block on commit
+_QUANTIZE_BLOCK = 65_536
+
+class IndexWriter:
+    """Appends embedding rows and chunk metadata to a vault index batch by batch.
+
+    ``embeddings.npy`` and ``chunks.json`` are written to temp files as rows
+    arrive, so the full matrix and chunk list never have to be held in
+    memory. The ANN index (``index.faiss`` or ``index.usearch``) and the
+    optional int8 copy are built from the finished, memory-mapped temp
+    matrix by prepare(), and commit() then swaps every file into place.
+    """
+
+    def __init__(
+        self,
+        index_dir: Path,
+        dtype=np.float16,
+        faiss_index_type: Optional[str] = None,
+        use_int8: bool = False
+    ):
+        """Open temp files for a new index.
+
+        Args:
+            index_dir: Directory holding the vault's index files
+            dtype: Storage dtype of embeddings.npy
+            faiss_index_type: FAISS index to build alongside (see
+                faiss_index.build_index), "usearch" for a USearch HNSW
+                index, or None for no ANN index. Without FAISS, "auto"
+                and "hnsw" fall back to USearch for large indices
+            use_int8: Also write an int8 copy of the embeddings with
+                per-row scales, unless an ANN index is built
+        """
+        self.index_dir = index_dir
+        self.dtype = np.dtype(dtype)
+        self.faiss_index_type = faiss_index_type
+        self.use_int8 = use_int8
+        self.rows = 0
+        self.dim = 0
+        # Temp files ready to rename and live files to drop, set by prepare()
+        self._finished = False
+        self._staged: Optional[List[str]] = None
+        self._stale: List[str] = []
+
+        self._embeddings = open(self._tmp_path("embeddings.npy"), "wb")
+        self._embeddings.write(b"\0" * _NPY_HEADER_SIZE)
+        self._chunks = open(self._tmp_path("chunks.json"), "wb")
+        self._chunks.write(b"[")
+        self._arrow = (
+            chunk_store.ArrowChunkWriter(self._tmp_path(chunk_store.CHUNKS_FILENAME))
+            if chunk_store.ARROW_AVAILABLE else None
+        )
+
+    def add(self, embeddings: np.ndarray, chunks: List[dict]) -> int:
+        """Append rows and their chunk metadata.
+
+        Args:
+            embeddings: (N, d) embeddings, unit-normalized
+            chunks: N chunk dicts
+
+        Returns:
+            int: Index of the first appended row
+        """
+        start = self.rows
+        if not chunks:
+            return start
+
+        rows = np.ascontiguousarray(embeddings, dtype=self.dtype)
+        if self.rows == 0:
+            self.dim = rows.shape[1]
+
+        self._embeddings.write(rows.tobytes())
+        for chunk in chunks:
+            if self.rows:
+                self._chunks.write(b",")
+            self._chunks.write(orjson.dumps(chunk, option=chunk_store.JSON_OPTIONS))
+            self.rows += 1
+        if self._arrow is not None:
+            self._arrow.add(chunks)
+        return start
+
+    def prepare(self):
+        """Finish all files and build the derived ones next to the live index.
+
+        The int8 copy and the ANN index are built from the temp embeddings
+        into temp files too, so a failed build leaves the previous index
+        intact. On failure every temp file is removed.
+        """
+        if self._staged is not None:
+            return
+        try:
+            self._finish()
+            self._staged = self._build_derived()
+        except BaseException:
+            self.abort()
+            raise
+
+    def commit(self):
+        """Prepare the index if needed, then move every file into place.
+
+        The renames only start once all files are built, so an interrupted
+        commit can at worst leave a mix of old and new files, never a
+        half-written one.
+        """
+        self.prepare()
+        for name in self._staged:
+            os.replace(self._tmp_path(name), self.index_dir / name)
+        for name in self._stale:
+            path = self.index_dir / name
+            if path.exists():
+                path.unlink()
+
+    def _finish(self):
+        """Patch the .npy header and close the streamed temp files."""
+        header = repr({
+            "descr": np.lib.format.dtype_to_descr(self.dtype),
+            "fortran_order": False,
+            "shape": (self.rows, self.dim)
+        })
+        header = header.ljust(_NPY_HEADER_SIZE - 11) + "\n"
+        self._embeddings.seek(0)
+        self._embeddings.write(np.lib.format.magic(1, 0))
+        self._embeddings.write(struct.pack("<H", len(header)))
+        self._embeddings.write(header.encode("latin1"))
+        self._embeddings.close()
+        self._chunks.write(b"]")
+        self._chunks.close()
+        if self._arrow is not None:
+            self._arrow.close()
+        self._finished = True
+
+    def _build_derived(self) -> List[str]:
+        """Build the int8 copy and ANN index from the temp embeddings.
+
+        Returns:
+            List[str]: Names of the finished temp files, in rename order;
+            files the new index must not keep are recorded in ``_stale``
+        """
+        staged = ["embeddings.npy", "chunks.json"]
+        if self._arrow is not None:
+            staged.append(chunk_store.CHUNKS_FILENAME)
+        else:
+            self._stale.append(chunk_store.CHUNKS_FILENAME)
+
+        # Record the concrete type, since "auto" depends on the row count
+        self.faiss_index_type = self._resolve_ann_type()
+        embeddings = None
+        if self.rows:
+            embeddings = np.load(str(self._tmp_path("embeddings.npy")), mmap_mode="r")
+
+        # Search only scans the int8 copy of vaults without an ANN index
+        self.use_int8 = self.use_int8 and bool(self.rows) and not self.faiss_index_type
+        if self.use_int8:
+            self._write_int8(embeddings)
+            staged += [INT8_FILENAME, SCALES_FILENAME]
+        else:
+            # Stale int8 files would disagree with embeddings.npy
+            self._stale += [INT8_FILENAME, SCALES_FILENAME]
+
+        index_files = [faiss_index.INDEX_FILENAME, usearch_index.INDEX_FILENAME]
+        if self.faiss_index_type:
+            index = build_ann_index(embeddings, self.faiss_index_type)
+            name = ann_index_filename(self.faiss_index_type)
+            if self.faiss_index_type == "usearch":
+                usearch_index.write_index(index, self._tmp_path(name))
+            else:
+                faiss_index.write_index(index, self._tmp_path(name))
+            staged.append(name)
+            index_files.remove(name)
+        # Never leave an index that disagrees with embeddings.npy
+        self._stale += index_files
+        return staged
+
+    def _resolve_ann_type(self) -> Optional[str]:
+        """Concrete ANN index type to build, or None for none."""
+        return resolve_ann_type(self.faiss_index_type, self.rows)
+
+    def abort(self):
+        """Discard the partially written files."""
+        if not self._finished:
+            handles = [self._embeddings, self._chunks]
+            if self._arrow is not None:
+                handles.append(self._arrow)
+            for handle in handles:
+                handle.close()
+        names = [
+            "embeddings.npy", "chunks.json", chunk_store.CHUNKS_FILENAME,
+            INT8_FILENAME, SCALES_FILENAME,
+            faiss_index.INDEX_FILENAME, usearch_index.INDEX_FILENAME
+        ]
+        for name in names:
+            try:
+                self._tmp_path(name).unlink()
+            except FileNotFoundError:
+                pass
+
+    def _write_int8(self, embeddings: np.ndarray):
+        """Quantize embeddings block by block into temp int8 files."""
+        quantized = np.lib.format.open_memmap(
+            self._tmp_path(INT8_FILENAME), mode="w+", dtype=np.int8, shape=embeddings.shape
+        )
+        scales = np.empty(len(embeddings), dtype=np.float32)
+        for start in range(0, len(embeddings), _QUANTIZE_BLOCK):
+            end = start + _QUANTIZE_BLOCK
+            quantized[start:end], scales[start:end] = quantize_int8(embeddings[start:end])
+        quantized.flush()
+        del quantized
+        with open(self._tmp_path(SCALES_FILENAME), "wb") as f:
+            np.save(f, scales)
+
+    def _tmp_path(self, name: str) -> Path:
+        return self.index_dir / f"{name}.tmp"
+
+def resolve_ann_type(index_type: Optional[str], num_rows: int) -> Optional[str]:
+    """Concrete ANN index type to build for a number of rows, or None for none.
+
+    Args:
+        index_type: Requested type, as for IndexWriter's faiss_index_type
+        num_rows: Rows in the index
+    """
+    if not index_type or not num_rows:
+        return None
+    if index_type == "usearch":
+        return "usearch" if usearch_index.USEARCH_AVAILABLE else None
+    index_type = faiss_index.resolve_index_type(index_type, num_rows)
+    if faiss_index.FAISS_AVAILABLE:
+        return index_type
+    # Without FAISS, large indices still get a graph index from USearch
+    if index_type == "hnsw" and usearch_index.USEARCH_AVAILABLE:
+        return "usearch"
+    return None
+
+def build_ann_index(embeddings: np.ndarray, ann_type: str) -> Any:
+    """Build a FAISS or USearch index of a resolved type over the rows."""
+    if ann_type == "usearch":
+        return usearch_index.build_index(embeddings)
+    return faiss_index.build_index(embeddings, ann_type)
+
+def ann_index_filename(ann_type: str) -> str:
+    """Name of the index file an ANN index of a resolved type is saved as."""
+    return usearch_index.INDEX_FILENAME if ann_type == "usearch" else faiss_index.INDEX_FILENAME
+
+def write_ann_index(index_dir: Path, ann_type: Optional[str], index: Any):
+    """Move a built ANN index into place and remove any other index file.
+
+    Args:
+        index_dir: Directory holding the vault's index files
+        ann_type: Resolved type of ``index``, or None to only remove files
+        index: Index from build_ann_index(), or None
+    """
+    faiss_path = index_dir / faiss_index.INDEX_FILENAME
+    usearch_path = index_dir / usearch_index.INDEX_FILENAME
+    built_path = None
+    if index is not None:
+        if ann_type == "usearch":
+            usearch_index.write_index(index, usearch_path)
+            built_path = usearch_path
+        else:
+            faiss_index.write_index(index, faiss_path)
+            built_path = faiss_path
+    for path in (faiss_path, usearch_path):
+        # Never leave an index that disagrees with embeddings.npy
+        if path != built_path and path.exists():
+            path.unlink()
+
+def remove_int8(index_dir: Path):
+    """Remove a vault's int8 copy and scales, if any."""
+    for name in (INT8_FILENAME, SCALES_FILENAME):
+        path = index_dir / name
+        if path.exists():
+            path.unlink()
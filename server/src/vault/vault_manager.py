@@ -1,33 +1,126 @@
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
-from typing import Dict, List, Callable, Optional, Any
+from typing import Dict, List, Callable, Optional, Any, Awaitable, Iterator, Set, Tuple
 import os
-import json
+import hashlib
 import logging
 from pathlib import Path
-import threading
 import time
 import asyncio
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from src.embeddings.embeddings_manager import EmbeddingsManager
+from src.embeddings.query_batcher import QueryBatcher
+from src.embeddings.embedding_cache import EmbeddingCache
 from src.processors.file_processor import FileProcessor
 from src.processors.chunking import Chunk
 import numpy as np
+import orjson
 from ..config import Config
+from ._simd_kernels import search_dtype, top_k, warm_up
+from . import chunk_store, faiss_index, usearch_index
+from .index_writer import (
+    INT8_FILENAME,
+    SCALES_FILENAME,
+    IndexWriter,
+    build_ann_index,
+    remove_int8,
+    resolve_ann_type,
+    write_ann_index
+)
 
 logger = logging.getLogger(__name__)
 
+# Files scanned and processed concurrently while indexing
+MAX_CONCURRENT_FILES = 32
+
+# Chunks per embedding call, and batches buffered ahead of the embedder
+EMBED_BATCH_SIZE = 512
+EMBED_QUEUE_SIZE = 4
+
+# Seconds without further watcher updates before a vault's ANN index is
+# rebuilt in the background; updates in between are scored densely
+ANN_REBUILD_DELAY = 10.0
+
+# Files per queued batch, so unchanged files reusing their rows share
+# one queue round-trip and write hop
+WRITE_BATCH_FILES = 1024
+
+# Recent query embeddings kept for repeat searches
+QUERY_CACHE_SIZE = 1024
+
+# Directories never worth descending into when indexing a vault
+SKIP_DIRS = frozenset({".git", ".obsidian", ".trash", "node_modules", "__pycache__"})
+
+def iter_vault_files(root: str, file_types: List[str]) -> Iterator[str]:
+    """Lazily yield paths of files with the given extensions under a vault.
+
+    Args:
+        root: Vault root directory
+        file_types: File extensions to include, without the leading dot
+
+    Yields:
+        str: Path of each matching file
+    """
+    for entry in iter_vault_entries(root, file_types):
+        yield entry.path
+
+def iter_vault_entries(root: str, file_types: List[str]) -> Iterator[os.DirEntry]:
+    """Lazily yield directory entries of files with the given extensions.
+
+    Walks the tree iteratively with ``os.scandir``, pruning hidden and
+    ``SKIP_DIRS`` directories instead of statting everything inside them.
+    Entries cache their stat results, so callers can check modification
+    times without another lookup by path.
+
+    Args:
+        root: Vault root directory
+        file_types: File extensions to include, without the leading dot
+
+    Yields:
+        os.DirEntry: Entry of each matching file
+    """
+    suffixes = tuple(f".{file_type}" for file_type in file_types)
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in SKIP_DIRS or entry.name.startswith("."):
+                            continue
+                        stack.append(entry.path)
+                    elif entry.name.endswith(suffixes) and entry.is_file():
+                        yield entry
+        except OSError as e:
+            logger.error(f"Error scanning directory {directory}: {str(e)}")
+
 class VaultEventHandler(FileSystemEventHandler):
     """Handles file system events for a vault."""
     
-    def __init__(self, on_change: Callable[[str], None]):
+    def __init__(
+        self,
+        on_change: Callable[[List[str]], Awaitable[None]],
+        get_loop: Callable[[], Optional[asyncio.AbstractEventLoop]],
+        delay: float = 1.0
+    ):
         """
         Initialize the event handler.
         
         Args:
-            on_change: Callback function to handle file changes
+            on_change: Coroutine function receiving each debounced batch of paths
+            get_loop: Returns the event loop to debounce on, or None if there
+                is none yet (events are then dropped)
+            delay: Seconds the vault must be quiet before a batch is flushed
         """
         self.on_change = on_change
-        self._debounce_timers: Dict[str, threading.Timer] = {}
+        self.get_loop = get_loop
+        self.delay = delay
+        self._pending: Set[str] = set()
+        self._last_event = 0.0
+        self._flush_task: Optional[asyncio.Task] = None
         
     def on_modified(self, event):
         if not event.is_directory:
@@ -40,24 +133,57 @@ class VaultEventHandler(FileSystemEventHandler):
     def on_deleted(self, event):
         if not event.is_directory:
             self._debounce_file_event(event.src_path)
+    
+    def on_moved(self, event):
+        if not event.is_directory:
+            self._debounce_file_event(event.src_path)
+            self._debounce_file_event(event.dest_path)
             
-    def _debounce_file_event(self, file_path: str, delay: float = 1.0):
-        """Debounce file events to prevent multiple rapid updates."""
-        if file_path in self._debounce_timers:
-            self._debounce_timers[file_path].cancel()
+    def _debounce_file_event(self, file_path: str):
+        """Hand an event from the observer thread to the event loop."""
+        loop = self.get_loop()
+        if loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(self._enqueue, file_path)
+        
+    def _enqueue(self, file_path: str):
+        """Add a path to the pending batch, starting the flush task if idle."""
+        loop = asyncio.get_running_loop()
+        self._pending.add(file_path)
+        self._last_event = loop.time()
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._debounced_flush())
             
-        timer = threading.Timer(delay, self.on_change, args=[file_path])
-        self._debounce_timers[file_path] = timer
-        timer.start()
+    async def _debounced_flush(self):
+        """Deliver pending paths in batches once the vault has been quiet."""
+        loop = asyncio.get_running_loop()
+        while self._pending:
+            # Every new event pushes the flush back by another delay
+            remaining = self._last_event + self.delay - loop.time()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+                continue
+                
+            batch, self._pending = self._pending, set()
+            try:
+                await self.on_change(sorted(batch))
+            except Exception as e:
+                logger.error(f"Error handling file changes: {str(e)}")
 
 class VaultManager:
     """Manages Obsidian vaults and file watching."""
     
-    def __init__(self, config_dir: Optional[str] = None):
+    def __init__(
+        self,
+        config_dir: Optional[str] = None,
+        embeddings_manager: Optional[EmbeddingsManager] = None
+    ):
         """Initialize vault manager.
         
         Args:
             config_dir: Directory for configuration files
+            embeddings_manager: Existing embeddings manager to share, so
+                its model is not loaded again
         """
         if config_dir is None:
             config_dir = "~/.config/obsidian-rag"
@@ -69,11 +195,51 @@ class VaultManager:
         os.environ["RAG_CACHE_DIR"] = str(self.config_dir / "embeddings_cache")
         
         # Initialize components
-        self.embeddings_manager = EmbeddingsManager()
+        self.embeddings_manager = embeddings_manager or EmbeddingsManager()
+        self.query_batcher = QueryBatcher(self.embeddings_manager)
+        self._query_cache: "OrderedDict[Tuple[str, str], np.ndarray]" = OrderedDict()
+        self.embedding_cache = EmbeddingCache(str(self.config_dir / "embedding_cache.db"))
+        self.faiss_index_type = os.getenv("RAG_FAISS_INDEX", "auto")
+        # Keep an int8 copy of each index and search it in place of float16
+        self.use_int8 = os.getenv("RAG_INT8_EMBEDDINGS", "1") == "1"
         self.file_processor = FileProcessor()
         self.vaults: Dict[str, Dict[str, Any]] = {}
         self.observers: Dict[str, Observer] = {}
         
+        # Search index over all vaults, built on first search: one global row
+        # numbering, with per-vault dense matrices (memory-mapped where the
+        # stored dtype can be scored directly) or FAISS indices
+        self._dense_indices: Dict[str, Tuple[np.ndarray, Optional[np.ndarray]]] = {}
+        self._global_vault_ids: Optional[np.ndarray] = None
+        # Per-vault chunk metadata: a list of dicts, or a memory-mapped Arrow table
+        self._vault_chunks: Dict[str, Any] = {}
+        self._global_vault_names: List[str] = []
+        self._global_offsets: Dict[str, Tuple[int, int]] = {}
+        # Per-vault ANN index with the stored embeddings it re-ranks against
+        self._ann_indices: Dict[str, Tuple[Any, np.ndarray]] = {}
+        # Per-vault loaded index, keyed by the stat signature of its files so
+        # indices rewritten by another process are picked up on next search
+        self._index_cache: Dict[str, Tuple[Optional[tuple], Optional[dict]]] = {}
+        self._loaded_signatures: Optional[Dict[str, Optional[tuple]]] = None
+        # Guards the search index state for quick reads and swaps only;
+        # loads run outside it, one at a time under _load_lock
+        self._index_lock = threading.RLock()
+        self._load_lock = threading.Lock()
+        # Bumped by every invalidation, so a load racing one is redone
+        self._search_generation = 0
+        
+        # Event loop that watcher threads hand index updates to, captured
+        # from the first indexing or search call
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._index_locks: Dict[str, asyncio.Lock] = {}
+        # Pending background ANN rebuild per vault
+        self._ann_rebuilds: Dict[str, asyncio.Task] = {}
+        # Scan threads sized to the indexing window; the default executor
+        # caps at cpu_count + 4 workers, which would throttle I/O waits
+        self._scan_pool = ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_FILES, thread_name_prefix="vault-scan"
+        )
+        
         # Load existing vaults
         self._load_vaults()
     
@@ -136,6 +302,7 @@ class VaultManager:
             config_path.unlink()
             
         del self.vaults[name]
+        self._invalidate_search_index(name)
     
     def get_vault(self, name: str) -> Optional[dict]:
         """Get vault configuration by name."""
@@ -175,13 +342,37 @@ class VaultManager:
         """Save vault configuration to disk."""
         config_path = self.config_dir / f"{name}.json"
         try:
-            with open(config_path, "w") as f:
-                json.dump(config, f, indent=2)
+            with open(config_path, "wb") as f:
+                f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
         except Exception as e:
             logger.error(f"Error saving vault config {name}: {str(e)}")
     
     async def index_vault(self, name: str) -> dict:
         """Index a vault's contents."""
+        return await self._reindex(name)
+    
+    async def update_files(self, name: str, file_paths: List[str]) -> dict:
+        """Re-index only the given files of an already indexed vault.
+        
+        Files that are not listed are taken from the previous index without
+        being read or stat'ed; listed files that no longer exist are dropped.
+        
+        Args:
+            name: Vault name
+            file_paths: Created, modified or deleted file paths
+            
+        Returns:
+            dict: Indexing statistics
+        """
+        return await self._reindex(name, changed=set(file_paths))
+    
+    async def _reindex(self, name: str, changed: Optional[Set[str]] = None) -> dict:
+        """Rebuild a vault's index, reusing rows of files that did not change.
+        
+        Args:
+            name: Vault name
+            changed: Files known to have changed; None rescans the whole vault
+        """
         if name not in self.vaults:
             raise ValueError(f"Vault '{name}' not found")
             
@@ -191,38 +382,408 @@ class VaultManager:
         if not vault_path.exists():
             raise ValueError(f"Vault path does not exist: {vault_path}")
             
-        # Process files
-        chunks = []
-        processed_files = 0
-        total_files = 0
+        self._loop = asyncio.get_running_loop()
+        async with self._index_locks.setdefault(name, asyncio.Lock()):
+            return await self._write_index(name, vault_config, changed)
+    
+    async def _write_index(
+        self,
+        name: str,
+        vault_config: dict,
+        changed: Optional[Set[str]]
+    ) -> dict:
+        """Process, embed and persist a vault's index files."""
+        vault_path = Path(vault_config["path"])
+        index_dir = self.config_dir / "indices" / name
+        index_dir.mkdir(parents=True, exist_ok=True)
+        previous_state, previous_embeddings, previous_chunks = self._load_index_state(index_dir)
+        if changed is not None and not previous_state:
+            # Nothing to carry unlisted files over from, so rescan them all
+            changed = None
+        
+        # (path, (mtime_ns, size)) pairs; a None stat means stat it when scanning
+        if changed is None:
+            file_paths = self._walk_with_stats(vault_path, vault_config["file_types"])
+        else:
+            changed = {
+                path for path in changed
+                if self._is_vault_file(vault_path, path, vault_config["file_types"])
+            }
+            # Trust the watcher: files without events are unchanged
+            file_paths = [
+                (path, (entry["mtime_ns"], entry["size"]))
+                for path, entry in previous_state.items() if path not in changed
+            ]
+            file_paths.extend((path, None) for path in sorted(changed) if os.path.isfile(path))
+        
+        # Rebuilding an ANN index (an HNSW graph especially) costs far more
+        # than a watcher update itself, so updates commit without one and
+        # leave it to a background rebuild once the changes settle
+        defer_ann = changed is not None and bool(self.faiss_index_type)
+        
+        # Store as float16: halves disk and memory bandwidth, and unit vectors
+        # keep their cosine ranking at 16-bit precision. Files go to temp
+        # paths and are swapped in, so the previous embeddings stay mapped
+        writer = IndexWriter(
+            index_dir,
+            np.float16,
+            faiss_index_type=None if defer_ann else self.faiss_index_type,
+            use_int8=self.use_int8
+        )
+        file_state = {}
+        stats = {"processed_files": 0, "unchanged_files": 0, "total_files": 0}
+        batches: asyncio.Queue = asyncio.Queue(maxsize=EMBED_QUEUE_SIZE)
+        
+        loop = asyncio.get_running_loop()
         
-        for file_type in vault_config["file_types"]:
-            for file_path in vault_path.rglob(f"*.{file_type}"):
-                total_files += 1
+        def scan(file_path: str, stat_key: Optional[Tuple[int, int]]) -> asyncio.Future:
+            entry = previous_state.get(file_path)
+            if entry and stat_key == (entry["mtime_ns"], entry["size"]):
+                # Unchanged since the last run: reuse its rows without a thread hop
+                future = loop.create_future()
+                future.set_result((stat_key, entry["hash"], None))
+                return future
+            # Hashing, reading and parsing are dominated by I/O waits
+            return loop.run_in_executor(
+                self._scan_pool, self._scan_file, file_path, entry, stat_key
+            )
+        
+        async def produce():
+            """Scan files in a sliding window and queue reused rows and new chunks."""
+            window = deque()
+            batch = []
+            batch_size = 0
+            
+            async def collect():
+                nonlocal batch, batch_size
+                file_path, task = window.popleft()
+                stats["total_files"] += 1
                 try:
-                    file_chunks = self.file_processor.process_file(str(file_path))
-                    chunks.extend(file_chunks)
-                    processed_files += 1
+                    stat_key, digest, file_chunks = await task
                 except Exception as e:
                     logger.error(f"Error processing file {file_path}: {str(e)}")
+                    return
+                    
+                file_state[file_path] = {"hash": digest, "mtime_ns": stat_key[0], "size": stat_key[1]}
+                stats["processed_files"] += 1
+                if file_chunks is None:
+                    stats["unchanged_files"] += 1
+                else:
+                    batch_size += len(file_chunks)
+                batch.append((file_path, file_chunks))
+                if batch_size >= EMBED_BATCH_SIZE or len(batch) >= WRITE_BATCH_FILES:
+                    await batches.put(batch)
+                    batch, batch_size = [], 0
+                    
+            try:
+                for file_path, stat_key in file_paths:
+                    window.append((file_path, scan(file_path, stat_key)))
+                    if len(window) >= MAX_CONCURRENT_FILES:
+                        await collect()
+                while window:
+                    await collect()
+                if batch:
+                    await batches.put(batch)
+                await batches.put(None)
+            finally:
+                for _, task in window:
+                    task.cancel()
         
-        # Generate embeddings
-        embeddings, _ = await self.embeddings_manager.get_embeddings(chunks)
+        async def consume():
+            """Embed queued chunks and append every file's rows to the index."""
+            while (batch := await batches.get()) is not None:
+                new_chunks = [chunk for _, file_chunks in batch if file_chunks for chunk in file_chunks]
+                new_embeddings = await self._embed_chunks(new_chunks) if new_chunks else None
+                
+                offset = 0
+                pending = []
+                for file_path, file_chunks in batch:
+                    if file_chunks is None:
+                        entry = previous_state[file_path]
+                        rows = previous_embeddings[entry["start"]:entry["end"]]
+                        dicts = previous_chunks[entry["start"]:entry["end"]]
+                    else:
+                        rows = new_embeddings[offset:offset + len(file_chunks)] if file_chunks else None
+                        dicts = [{"content": c.content, **c.metadata} for c in file_chunks]
+                        offset += len(file_chunks)
+                    pending.append((file_path, rows, dicts))
+                    
+                # Reading reused rows and writing the batch is disk-bound
+                await asyncio.to_thread(write_batch, pending)
         
-        # Save index with content included
-        index_dir = self.config_dir / "indices" / name
-        index_dir.mkdir(parents=True, exist_ok=True)
+        def write_batch(pending: List[Tuple[str, Any, List[dict]]]):
+            for file_path, rows, dicts in pending:
+                row_start = writer.add(rows, dicts)
+                file_state[file_path].update(start=row_start, end=row_start + len(dicts))
         
-        np.save(str(index_dir / "embeddings.npy"), embeddings)
-        with open(index_dir / "chunks.json", "w") as f:
-            json.dump([{"content": c.content, **c.metadata} for c in chunks], f)
+        tasks = [asyncio.create_task(produce()), asyncio.create_task(consume())]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in tasks:
+                if task.done():
+                    task.result()
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            writer.abort()
+            raise
+        
+        # Finishing the files and building the ANN index can take seconds
+        await asyncio.to_thread(self._commit_index, writer, index_dir, file_state)
+        self._invalidate_search_index(name)
+        if defer_ann and writer.rows:
+            self._schedule_ann_rebuild(name)
         
         return {
-            "processed_files": processed_files,
-            "total_files": total_files,
-            "total_chunks": len(chunks)
+            "processed_files": stats["processed_files"],
+            "unchanged_files": stats["unchanged_files"],
+            "total_files": stats["total_files"],
+            "total_chunks": writer.rows
         }
     
+    @staticmethod
+    def _is_vault_file(vault_path: Path, file_path: str, file_types: List[str]) -> bool:
+        """Check a path is one iter_vault_files() would index."""
+        try:
+            relative = Path(file_path).relative_to(vault_path)
+        except ValueError:
+            return False
+        if any(part in SKIP_DIRS or part.startswith(".") for part in relative.parts[:-1]):
+            return False
+        return relative.suffix[1:] in file_types
+    
+    async def _embed_chunks(self, chunks: List[Chunk]) -> np.ndarray:
+        """Embed chunks, reusing cached vectors for previously seen content.
+        
+        Returns:
+            np.ndarray: (N, d) float32 unit-normalized embeddings in chunk order
+        """
+        provider = type(self.embeddings_manager).__name__
+        model = self.embeddings_manager.model_name
+        hashes = [hashlib.sha256(c.content.encode("utf-8")).hexdigest() for c in chunks]
+        vectors = await asyncio.to_thread(self.embedding_cache.lookup, hashes, provider, model)
+        
+        # Embed each distinct uncached content once
+        uncached = {}
+        for content_hash, chunk in zip(hashes, chunks):
+            if content_hash not in vectors and content_hash not in uncached:
+                uncached[content_hash] = chunk
+                
+        if uncached:
+            # Rows come back unit-normalized, so the dot product in search()
+            # is a cosine similarity
+            embeddings = await self.embeddings_manager.encode_batch(list(uncached.values()))
+            embeddings = np.asarray(embeddings, dtype=np.float32)
+            computed = dict(zip(uncached, embeddings))
+            await asyncio.to_thread(self.embedding_cache.write, computed, provider, model)
+            vectors.update(computed)
+            
+        return np.stack([vectors[content_hash] for content_hash in hashes])
+    
+    def _load_index_state(self, index_dir: Path) -> Tuple[Dict[str, dict], Optional[np.ndarray], List[dict]]:
+        """Load the per-file state, embeddings and chunks of a previous index.
+        
+        Returns:
+            Tuple of (file state, embeddings, chunks); empty if there is no
+            usable previous index
+        """
+        try:
+            with open(index_dir / "state.json", "rb") as f:
+                state = orjson.loads(f.read())
+            with open(index_dir / "chunks.json", "rb") as f:
+                chunks = orjson.loads(f.read())
+            embeddings = np.load(str(index_dir / "embeddings.npy"), mmap_mode="r")
+        except FileNotFoundError:
+            return {}, None, []
+        except Exception as e:
+            logger.error(f"Error loading previous index state from {index_dir}: {str(e)}")
+            return {}, None, []
+            
+        if len(embeddings) != len(chunks):
+            logger.warning(f"Previous index in {index_dir} is inconsistent, rebuilding")
+            return {}, None, []
+            
+        # Rows from another model (or unnormalized ones) live in a different
+        # embedding space and must not be mixed with new rows
+        meta = self._read_meta(index_dir)
+        if (
+            meta.get("model") != self.embeddings_manager.model_name
+            or not meta.get("normalized")
+            or (len(embeddings) and meta.get("dim") != embeddings.shape[1])
+        ):
+            logger.warning(f"Previous index in {index_dir} was built differently, re-embedding")
+            return {}, None, []
+            
+        return state, embeddings, chunks
+    
+    def _scan_file(
+        self,
+        file_path: str,
+        entry: Optional[dict],
+        stat_key: Optional[Tuple[int, int]] = None
+    ) -> Tuple[Tuple[int, int], str, Optional[List[Chunk]]]:
+        """Check a file against its previous index entry and process it if changed.
+        
+        Args:
+            file_path: File to check
+            entry: The file's previous index state, if any
+            stat_key: (mtime_ns, size) from the directory walk, if known
+        
+        Returns:
+            Tuple of ((mtime_ns, size), content hash, chunks); chunks is None
+            when the previous index rows can be reused
+        """
+        if stat_key is None:
+            stat_key = self._stat_key(os.stat(file_path))
+        
+        # Only hash files whose mtime or size changed since the last run
+        if entry and (entry["mtime_ns"], entry["size"]) == stat_key:
+            return stat_key, entry["hash"], None
+            
+        digest = self._hash_file(file_path)
+        if entry and digest == entry["hash"]:
+            return stat_key, digest, None
+            
+        return stat_key, digest, self.file_processor.process_file(file_path)
+    
+    def _commit_index(self, writer: IndexWriter, index_dir: Path, file_state: Dict[str, dict]):
+        """Move a finished index into place and record its state and metadata."""
+        writer.prepare()
+        # state.json's row ranges point into the old embeddings.npy. Drop it
+        # before the swap, so an interrupted commit forces a full rescan
+        # instead of reusing the wrong rows, and write it last
+        state_path = index_dir / "state.json"
+        if state_path.exists():
+            state_path.unlink()
+        writer.commit()
+        self._atomic_write(index_dir / "meta.json", lambda f: f.write(orjson.dumps({
+            "model": self.embeddings_manager.model_name,
+            "dtype": str(writer.dtype),
+            "dim": writer.dim,
+            "normalized": True,
+            "faiss_index": writer.faiss_index_type,
+            "int8": writer.use_int8
+        })))
+        self._atomic_write(index_dir / "state.json", lambda f: f.write(orjson.dumps(file_state)))
+    
+    def _schedule_ann_rebuild(self, name: str):
+        """(Re)start the delayed background rebuild of a vault's ANN index."""
+        task = self._ann_rebuilds.get(name)
+        if task is not None and not task.done():
+            task.cancel()
+        self._ann_rebuilds[name] = asyncio.create_task(self._rebuild_ann_index(name))
+    
+    async def _rebuild_ann_index(self, name: str):
+        """Build a vault's ANN index from its committed embeddings.
+        
+        The build runs without the vault's index lock, so watcher updates
+        are not held up by it. The index is only swapped in if
+        embeddings.npy is still the file it was built from; otherwise the
+        update that replaced it has scheduled a rebuild of its own.
+        """
+        await asyncio.sleep(ANN_REBUILD_DELAY)
+        index_dir = self.config_dir / "indices" / name
+        try:
+            built = await asyncio.to_thread(self._build_ann, index_dir)
+            if built is None:
+                return
+                
+            ann_type, index, stamp = built
+            async with self._index_locks.setdefault(name, asyncio.Lock()):
+                if name not in self.vaults or self._embeddings_stamp(index_dir) != stamp:
+                    return
+                await asyncio.to_thread(self._install_ann, index_dir, ann_type, index)
+            self._invalidate_search_index(name)
+        except Exception as e:
+            logger.error(f"Error rebuilding ANN index for vault {name}: {str(e)}")
+    
+    def _build_ann(self, index_dir: Path) -> Optional[Tuple[str, Any, Tuple[int, int]]]:
+        """Build an ANN index over a vault's embeddings.npy.
+        
+        Returns:
+            Tuple of (index type, index, embeddings.npy stamp), or None if
+            the vault gets no ANN index
+        """
+        stamp = self._embeddings_stamp(index_dir)
+        embeddings = np.load(str(index_dir / "embeddings.npy"), mmap_mode="r")
+        ann_type = resolve_ann_type(self.faiss_index_type, len(embeddings))
+        if ann_type is None:
+            return None
+        return ann_type, build_ann_index(embeddings, ann_type), stamp
+    
+    def _install_ann(self, index_dir: Path, ann_type: str, index: Any):
+        """Move a rebuilt ANN index into place and record it in meta.json."""
+        write_ann_index(index_dir, ann_type, index)
+        # Vaults with an ANN index never scan their int8 copy
+        remove_int8(index_dir)
+        meta = self._read_meta(index_dir)
+        meta.update(faiss_index=ann_type, int8=False)
+        self._atomic_write(index_dir / "meta.json", lambda f: f.write(orjson.dumps(meta)))
+    
+    @staticmethod
+    def _embeddings_stamp(index_dir: Path) -> Tuple[int, int]:
+        """Identify the current embeddings.npy; it is replaced, never edited."""
+        stat = os.stat(index_dir / "embeddings.npy")
+        return stat.st_ino, stat.st_mtime_ns
+    
+    def _walk_with_stats(
+        self,
+        vault_path: Path,
+        file_types: List[str]
+    ) -> Iterator[Tuple[str, Optional[Tuple[int, int]]]]:
+        """Walk a vault, pairing each file with its stat key from the walk."""
+        for entry in iter_vault_entries(str(vault_path), file_types):
+            try:
+                yield entry.path, self._stat_key(entry.stat())
+            except OSError:
+                # Let the per-file scan stat it again and report the error
+                yield entry.path, None
+    
+    @staticmethod
+    def _stat_key(stat: os.stat_result) -> Tuple[int, int]:
+        """Modification time and size used to detect file changes."""
+        return stat.st_mtime_ns, stat.st_size
+    
+    @staticmethod
+    def _hash_file(file_path: str) -> str:
+        """Hash a file's contents for change detection."""
+        with open(file_path, "rb") as f:
+            return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _atomic_write(path: Path, write: Callable[[Any], None]):
+        """Write a file through a temp file and rename it into place."""
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            write(f)
+        os.replace(tmp_path, path)
+    
+    async def prime_caches(self):
+        """Load every vault's index ahead of the first search.
+        
+        Vaults are loaded concurrently on worker threads, then combined
+        into the search index, so the first query skips the cold-start I/O.
+        The Numba search kernel is compiled alongside, so it skips the JIT
+        too.
+        """
+        self._loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            asyncio.to_thread(warm_up),
+            *(asyncio.to_thread(self._prime_vault_index, name) for name in list(self.vaults))
+        )
+        await asyncio.to_thread(self._ensure_search_index)
+    
+    def _prime_vault_index(self, name: str):
+        """Load one vault's index into the per-vault cache."""
+        index_dir = self.config_dir / "indices" / name
+        # Taken before loading, so a concurrent rewrite still invalidates it
+        signature = self._index_signature(index_dir)
+        if signature is None:
+            return
+        entry = self._load_vault_index(name, index_dir)
+        with self._index_lock:
+            self._index_cache[name] = (signature, entry)
+    
     async def search(
         self,
         query: str,
@@ -230,63 +791,427 @@ class VaultManager:
         max_results: int = 5
     ) -> List[dict]:
         """Search for content in vault(s)."""
+        if vault_name and vault_name not in self.vaults:
+            raise ValueError(f"Vault '{vault_name}' not found")
+            
+        self._loop = asyncio.get_running_loop()
+        # Embed first: the query batcher waits out its batching window, and a
+        # reindex finishing meanwhile swaps the search index underneath
+        query_embedding = await self.embed_query(query)
+        
+        # Score against one consistent snapshot. Reloads and invalidation
+        # replace these containers rather than mutating them, so holding
+        # references keeps them intact for the rest of this search
+        (
+            ann_indices, dense_indices, offsets, vault_chunks, vault_ids, vault_names
+        ) = await self._search_snapshot()
+            
+        # Restrict to the requested vault, or search everything
+        if vault_name:
+            if vault_name not in offsets:
+                return []
+            names = [vault_name]
+        else:
+            names = list(offsets)
+            
+        if not names or max_results <= 0:
+            return []
+            
+        # Search each vault's index and merge the per-vault hits
+        rows = []
+        scores = []
+        for name in names:
+            if name in ann_indices:
+                indices, distances = self._search_ann(
+                    *ann_indices[name], query_embedding, max_results
+                )
+            else:
+                # One fused scoring + top-k pass over the vault's rows
+                matrix, scales = dense_indices[name]
+                indices, distances = top_k(matrix, query_embedding, max_results, scales)
+            rows.append(indices + offsets[name][0])
+            scores.append(distances)
+        top_rows = np.concatenate(rows)
+        top_scores = np.concatenate(scores)
+        if len(names) > 1:
+            order = np.argsort(-top_scores, kind="stable")[:max_results]
+            top_rows, top_scores = top_rows[order], top_scores[order]
+        
+        hits = self._get_chunks(top_rows, vault_ids, vault_names, offsets, vault_chunks)
         results = []
+        for row, score, chunk in zip(top_rows, top_scores, hits):
+            result = {
+                "content": chunk["content"],
+                "similarity": float(score),
+                "vault": vault_names[vault_ids[row]]
+            }
+            # Add any additional metadata from the chunk
+            result.update({
+                k: v for k, v in chunk.items()
+                if k not in ["content", "similarity"]
+            })
+            results.append(result)
+        
+        return results
+    
+    async def embed_query(self, query: str) -> np.ndarray:
+        """Embed a search query, reusing recent embeddings of the same text.
+        
+        Returns:
+            np.ndarray: Read-only unit-normalized float32 query vector
+        """
+        key = (query, self.embeddings_manager.model_name)
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            self._query_cache.move_to_end(key)
+            return cached
+            
+        # Concurrent searches share one embedding batch
+        embedding = np.array(await self.query_batcher.embed(query), dtype=np.float32)
+        embedding.setflags(write=False)
+        
+        self._query_cache[key] = embedding
+        if len(self._query_cache) > QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+        return embedding
+    
+    @staticmethod
+    def _get_chunks(
+        rows: np.ndarray,
+        vault_ids: np.ndarray,
+        vault_names: List[str],
+        offsets: Dict[str, Tuple[int, int]],
+        vault_chunks: Dict[str, Any]
+    ) -> List[dict]:
+        """Materialize chunk dicts for global rows, in the order given.
+        
+        Takes the search index state explicitly, so a search reads the same
+        snapshot it scored against.
+        """
+        chunks = [None] * len(rows)
+        by_vault: Dict[str, List[Tuple[int, int]]] = {}
+        for i, row in enumerate(rows):
+            name = vault_names[vault_ids[row]]
+            by_vault.setdefault(name, []).append((i, int(row) - offsets[name][0]))
+            
+        for name, hits in by_vault.items():
+            chunk_table = vault_chunks[name]
+            local_rows = [local for _, local in hits]
+            if isinstance(chunk_table, list):
+                found = [chunk_table[local] for local in local_rows]
+            else:
+                found = chunk_store.take_chunks(chunk_table, local_rows)
+            for (i, _), chunk in zip(hits, found):
+                chunks[i] = chunk
+        return chunks
+    
+    async def index_version(self) -> tuple:
+        """Opaque version of the search index, changing whenever any vault's
+        index files do.
+        
+        Reloads the search index if needed, like search() does.
+        """
+        while True:
+            await self._search_snapshot()
+            signatures = self._loaded_signatures
+            if signatures is not None:
+                return tuple(sorted(signatures.items()))
+    
+    async def _search_snapshot(self) -> tuple:
+        """Current search index state, reloading it on a worker thread if stale.
+        
+        Checking for changes costs a few stat calls per vault, so it runs on
+        every search. Loading reads embeddings, chunks and ANN indices from
+        disk and never runs on the event loop, which only takes the lock to
+        copy references.
+        
+        Returns:
+            Tuple of (ANN indices, dense indices, row offsets, chunks,
+            vault ids, vault names)
+        """
+        while True:
+            if self._current_signatures() != self._loaded_signatures:
+                await asyncio.to_thread(self._ensure_search_index)
+            with self._index_lock:
+                # Retry if invalidated between the load and this snapshot
+                if self._loaded_signatures is not None:
+                    return (
+                        self._ann_indices,
+                        self._dense_indices,
+                        self._global_offsets,
+                        self._vault_chunks,
+                        self._global_vault_ids,
+                        self._global_vault_names
+                    )
+    
+    def _current_signatures(self) -> Dict[str, Optional[tuple]]:
+        """Index file signature of every vault, from _index_signature()."""
+        return {
+            name: self._index_signature(self.config_dir / "indices" / name)
+            for name in list(self.vaults)
+        }
+    
+    def _ensure_search_index(self):
+        """Reload the search index if any vault's index files changed on disk.
+        
+        Blocks on disk I/O, so call it from a worker thread. The index lock
+        is only held to read the cache and to install the loaded state.
+        """
+        with self._load_lock:
+            while True:
+                generation = self._search_generation
+                signatures = self._current_signatures()
+                if signatures == self._loaded_signatures:
+                    return
+                state = self._load_search_index(signatures)
+                with self._index_lock:
+                    if generation == self._search_generation:
+                        self._install_search_index(signatures, state)
+                        return
+                # Invalidated while loading, so the state may be stale
+    
+    @staticmethod
+    def _index_signature(index_dir: Path) -> Optional[tuple]:
+        """Stat signature of a vault's index files, or None if it has no index."""
+        signature = []
+        for filename in (
+            "embeddings.npy",
+            "chunks.json",
+            "meta.json",
+            chunk_store.CHUNKS_FILENAME,
+            faiss_index.INDEX_FILENAME,
+            usearch_index.INDEX_FILENAME,
+            INT8_FILENAME,
+            SCALES_FILENAME
+        ):
+            try:
+                stat = os.stat(index_dir / filename)
+            except FileNotFoundError:
+                continue
+            # Index files are swapped in with os.replace, so the inode changes too
+            signature.append((filename, stat.st_ino, stat.st_mtime_ns, stat.st_size))
+        return tuple(signature) or None
+    
+    def _load_search_index(self, signatures: Dict[str, Optional[tuple]]) -> dict:
+        """Load every vault's index for search, without installing it.
         
-        # Determine which vaults to search
-        search_vaults = [vault_name] if vault_name else self.vaults.keys()
+        Vaults whose index files are unchanged since they were last loaded
+        reuse the cached embeddings, chunks and ANN index. Vaults with a
+        FAISS or USearch index are searched through it, and the others by
+        scoring their int8 copy or (memory-mapped) embeddings. Rows are
+        numbered globally across vaults, with a vault-id column.
         
-        for name in search_vaults:
-            if name not in self.vaults:
-                if vault_name:  # Only raise error if specific vault was requested
-                    raise ValueError(f"Vault '{name}' not found")
+        Args:
+            signatures: Index file signature per vault, from _index_signature()
+            
+        Returns:
+            dict: State for _install_search_index()
+        """
+        embeddings = []
+        int8_rows = []
+        vault_ids = []
+        vault_chunks = {}
+        total_rows = 0
+        vault_names = []
+        offsets = {}
+        ann_indices = {}
+        index_cache = {}
+        with self._index_lock:
+            previous_cache = dict(self._index_cache)
+        
+        for name, signature in signatures.items():
+            if signature is None:
                 continue
                 
-            index_dir = self.config_dir / "indices" / name
-            if not index_dir.exists():
+            cached = previous_cache.get(name)
+            if cached is not None and cached[0] == signature:
+                entry = cached[1]
+            else:
+                entry = self._load_vault_index(name, self.config_dir / "indices" / name)
+            # Failed loads are cached too, and retried once the files change
+            index_cache[name] = (signature, entry)
+            if entry is None:
                 continue
                 
-            try:
-                # Load index
-                embeddings = np.load(str(index_dir / "embeddings.npy"))
-                with open(index_dir / "chunks.json") as f:
-                    chunks = json.load(f)
-                
-                # Extract texts for search
-                texts = [chunk["content"] for chunk in chunks]
+            num_rows = len(entry["embeddings"])
+            if entry["ann"] is not None:
+                ann_indices[name] = (entry["ann"], entry["embeddings"])
                 
-                # Search
-                vault_results = await self.embeddings_manager.search(
-                    query,
-                    embeddings,
-                    texts,
-                    max_results=max_results
-                )
+            offsets[name] = (total_rows, total_rows + num_rows)
+            vault_ids.append(np.full(num_rows, len(vault_names), dtype=np.int32))
+            vault_names.append(name)
+            embeddings.append(entry["embeddings"])
+            int8_rows.append(entry["int8"])
+            vault_chunks[name] = entry["chunks"]
+            total_rows += num_rows
+        
+        # Vaults with an ANN index never need their dense matrix
+        dense_indices = {}
+        for name, vault_embeddings, quantized in zip(vault_names, embeddings, int8_rows):
+            if name in ann_indices:
+                continue
+            if quantized is not None:
+                # int8 copy: a quarter of float32's bytes per scan
+                dense_indices[name] = quantized
+            else:
+                dense_indices[name] = (self._as_search_matrix(vault_embeddings), None)
+        return {
+            "index_cache": index_cache,
+            "ann_indices": ann_indices,
+            "dense_indices": dense_indices,
+            "vault_ids": np.concatenate(vault_ids) if vault_ids else np.empty(0, dtype=np.int32),
+            "vault_chunks": vault_chunks,
+            "vault_names": vault_names,
+            "offsets": offsets
+        }
+    
+    def _install_search_index(self, signatures: Dict[str, Optional[tuple]], state: dict):
+        """Swap in state from _load_search_index(); callers hold the index lock."""
+        self._index_cache = state["index_cache"]
+        self._ann_indices = state["ann_indices"]
+        self._dense_indices = state["dense_indices"]
+        self._global_vault_ids = state["vault_ids"]
+        self._vault_chunks = state["vault_chunks"]
+        self._global_vault_names = state["vault_names"]
+        self._global_offsets = state["offsets"]
+        self._loaded_signatures = signatures
+    
+    @staticmethod
+    def _search_ann(
+        index: Any,
+        embeddings: np.ndarray,
+        query: np.ndarray,
+        k: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Search a FAISS or USearch index, returning (row indices, scores)."""
+        if usearch_index.USEARCH_AVAILABLE and isinstance(index, usearch_index.Index):
+            return usearch_index.search_index(index, query, k)
+        return faiss_index.search_index(index, query, k, embeddings)
+    
+    @staticmethod
+    def _as_search_matrix(embeddings: np.ndarray) -> np.ndarray:
+        """Matrix to score for a vault's memory-mapped embeddings.
+        
+        The mapping itself is scored when the kernel handles its dtype, so
+        only pages the scan touches are resident and the page cache is
+        shared across processes. Otherwise it is copied once into the
+        kernel's dtype (float32 for BLAS).
+        """
+        dtype = search_dtype()
+        if embeddings.dtype == dtype and embeddings.flags.c_contiguous:
+            return embeddings
+        return np.ascontiguousarray(embeddings, dtype=dtype)
+    
+    def _load_vault_index(self, name: str, index_dir: Path) -> Optional[dict]:
+        """Load one vault's embeddings, chunks, ANN index and int8 copy.
+        
+        Returns:
+            Optional[dict]: Loaded index, or None if it is empty or unreadable
+        """
+        try:
+            vault_embeddings = np.load(str(index_dir / "embeddings.npy"), mmap_mode="r")
+            chunks = self._load_chunks(index_dir, len(vault_embeddings))
+        except Exception as e:
+            logger.error(f"Error loading index for vault {name}: {str(e)}")
+            return None
+            
+        num_rows = len(vault_embeddings)
+        if num_rows == 0:
+            return None
+            
+        if not self._read_meta(index_dir).get("normalized"):
+            # Written before rows were stored unit-normalized, so search can't
+            # score them with a plain dot product. Normalize a copy in memory
+            # and skip the ANN and int8 files, which were built from raw rows
+            logger.warning(f"Index for vault {name} is not normalized; reindex to memory-map it")
+            rows = np.asarray(vault_embeddings, dtype=np.float32)
+            rows /= np.linalg.norm(rows, axis=1, keepdims=True) + 1e-12
+            return {"embeddings": rows, "chunks": chunks, "ann": None, "int8": None}
+            
+        index = None
+        faiss_path = index_dir / faiss_index.INDEX_FILENAME
+        usearch_path = index_dir / usearch_index.INDEX_FILENAME
+        if faiss_index.FAISS_AVAILABLE and faiss_path.exists():
+            try:
+                index = faiss_index.read_index(faiss_path)
+                if index.ntotal != num_rows:
+                    index = None
+            except Exception as e:
+                logger.error(f"Error loading FAISS index for vault {name}: {str(e)}")
+                index = None
+        elif usearch_index.USEARCH_AVAILABLE and usearch_path.exists():
+            try:
+                index = usearch_index.read_index(usearch_path)
+                if len(index) != num_rows:
+                    index = None
+            except Exception as e:
+                logger.error(f"Error loading USearch index for vault {name}: {str(e)}")
+                index = None
                 
-                # Add vault name and metadata to results
-                for i, result in enumerate(vault_results):
-                    result["vault"] = name
-                    result["content"] = result.pop("text")  # Rename text to content
-                    # Add any additional metadata from the chunk
-                    result.update({
-                        k: v for k, v in chunks[i].items()
-                        if k not in ["content", "similarity"]
-                    })
+        int8_rows = None
+        if index is None and self.use_int8 and (index_dir / INT8_FILENAME).exists():
+            try:
+                quantized = np.load(str(index_dir / INT8_FILENAME), mmap_mode="r")
+                scales = np.load(str(index_dir / SCALES_FILENAME), mmap_mode="r")
+                if len(quantized) == num_rows and len(scales) == num_rows:
+                    int8_rows = (quantized, scales)
+            except Exception as e:
+                logger.error(f"Error loading int8 embeddings for vault {name}: {str(e)}")
                 
-                results.extend(vault_results)
+        return {"embeddings": vault_embeddings, "chunks": chunks, "ann": index, "int8": int8_rows}
+    
+    @staticmethod
+    def _read_meta(index_dir: Path) -> dict:
+        """Read a vault's meta.json, or an empty dict if it is missing or unreadable."""
+        try:
+            with open(index_dir / "meta.json", "rb") as f:
+                return orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+    
+    def _load_chunks(self, index_dir: Path, num_rows: int) -> Any:
+        """Load a vault's chunk metadata for search.
+        
+        Prefers the memory-mapped Arrow file, which only materializes the
+        rows that are hit, and falls back to parsing chunks.json.
+        """
+        arrow_path = index_dir / chunk_store.CHUNKS_FILENAME
+        if chunk_store.ARROW_AVAILABLE and arrow_path.exists():
+            table = chunk_store.open_chunks(arrow_path)
+            if table.num_rows == num_rows:
+                return table
                 
-            except Exception as e:
-                logger.error(f"Error searching vault {name}: {str(e)}")
+        with open(index_dir / "chunks.json", "rb") as f:
+            chunks = orjson.loads(f.read())
+        if len(chunks) != num_rows:
+            raise ValueError(f"chunks.json has {len(chunks)} rows, expected {num_rows}")
+        return chunks
+    
+    def _invalidate_search_index(self, name: Optional[str] = None):
+        """Drop the search index so the next search rebuilds it.
         
-        # Sort by similarity and limit results
-        results.sort(key=lambda x: x["similarity"], reverse=True)
-        return results[:max_results]
+        Args:
+            name: Vault whose cached index to drop as well; other vaults'
+                cached indices are reused by the rebuild
+        """
+        with self._index_lock:
+            self._search_generation += 1
+            if name is not None:
+                self._index_cache.pop(name, None)
+            self._dense_indices = {}
+            self._global_vault_ids = None
+            self._vault_chunks = {}
+            self._global_vault_names = []
+            self._global_offsets = {}
+            self._ann_indices = {}
+            self._loaded_signatures = None
     
     def _load_vaults(self):
         """Load vault configurations from disk."""
         for config_file in self.config_dir.glob("*.json"):
             try:
-                with open(config_file, "r") as f:
-                    vault_config = json.load(f)
+                with open(config_file, "rb") as f:
+                    vault_config = orjson.loads(f.read())
                     
                 name = vault_config["name"]
                 self.vaults[name] = vault_config
@@ -306,7 +1231,8 @@ class VaultManager:
         try:
             observer = Observer()
             handler = VaultEventHandler(
-                on_change=lambda path: logger.info(f"File changed: {path}")
+                on_change=lambda paths: self._on_files_changed(name, paths),
+                get_loop=lambda: self._loop
             )
             
             observer.schedule(handler, config["path"], recursive=True)
@@ -317,8 +1243,20 @@ class VaultManager:
         except Exception as e:
             logger.error(f"Error starting vault watcher for {name}: {str(e)}")
             
+    async def _on_files_changed(self, name: str, file_paths: List[str]):
+        """Apply a debounced batch of file events as one index update."""
+        logger.info(f"Files changed in {name}: {len(file_paths)}")
+        
+        # Nothing to update until the vault has been indexed
+        index_state = self.config_dir / "indices" / name / "state.json"
+        if name not in self.vaults or not index_state.exists():
+            return
+            
+        await self.update_files(name, file_paths)
+            
     def __del__(self):
-        """Clean up observers on deletion."""
+        """Clean up observers and scan threads on deletion."""
         for observer in self.observers.values():
             observer.stop()
-            observer.join() 
\ No newline at end of file
+            observer.join()
+        self._scan_pool.shutdown(wait=False) 
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""Shared test fixtures."""
+import functools
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+# Core ML only runs on macOS and every test that touches it mocks the
+# conversion, so stand in for the package before any src.embeddings import
+# instead of loading protobuf and its model schemas
+sys.modules.setdefault("coremltools", MagicMock(name="coremltools"))
+
+@functools.lru_cache(maxsize=1)
+def _docx_blob() -> bytes:
+    """Build the sample Word document once per process."""
+    import io
+    from docx import Document
+    doc = Document()
+    doc.add_heading('Test Document', 0)
+    doc.add_paragraph('This is a test paragraph.')
+    doc.add_heading('Section 1', 1)
+    doc.add_paragraph('Another paragraph.')
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+@functools.lru_cache(maxsize=1)
+def _pdf_blob() -> bytes:
+    """Build the sample PDF once per process."""
+    import fitz
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((50, 50), "Test Document")
+    page.insert_text((50, 100), "This is a test paragraph.")
+    blob = doc.tobytes()
+    doc.close()
+    return blob
+
+@pytest.fixture(scope="session")
+def docx_blob():
+    """Bytes of a small Word document with headings and paragraphs."""
+    return _docx_blob()
+
+@pytest.fixture(scope="session")
+def pdf_blob():
+    """Bytes of a one-page PDF with two lines of text."""
+    return _pdf_blob()
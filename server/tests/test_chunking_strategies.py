@@ -1,22 +1,21 @@
 """Tests for chunking strategies."""
 import pytest
-import os
 from src.chunking import MarkdownChunker, SentenceChunker
 
-@pytest.fixture
-def markdown_chunker():
+# (chunk_size, chunk_overlap) settings every chunker test runs with
+CHUNK_SETTINGS = [(100, 20), (200, 40)]
+
+@pytest.fixture(params=CHUNK_SETTINGS, ids=lambda s: f"size{s[0]}")
+def markdown_chunker(request):
     """Create a markdown chunker with test settings."""
-    os.environ["RAG_CHUNK_SIZE"] = "100"
-    os.environ["RAG_CHUNK_OVERLAP"] = "20"
-    os.environ["RAG_PRESERVE_MARKDOWN"] = "1"
-    return MarkdownChunker()
+    chunk_size, chunk_overlap = request.param
+    return MarkdownChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap, preserve_markdown=True)
 
-@pytest.fixture
-def sentence_chunker():
+@pytest.fixture(params=CHUNK_SETTINGS, ids=lambda s: f"size{s[0]}")
+def sentence_chunker(request):
     """Create a sentence chunker with test settings."""
-    os.environ["RAG_CHUNK_SIZE"] = "100"
-    os.environ["RAG_CHUNK_OVERLAP"] = "20"
-    return SentenceChunker()
+    chunk_size, chunk_overlap = request.param
+    return SentenceChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
 
 def test_markdown_chunker_headers(markdown_chunker):
     """Test markdown chunking with headers."""
@@ -29,12 +28,9 @@ This is paragraph 3."""
     
     chunks = markdown_chunker.chunk(text)
     assert len(chunks) == 6  # Each header and paragraph is a separate chunk
-    assert chunks[0]["text"] == "# Header 1"
-    assert "paragraph 1" in chunks[1]["text"]
-    assert chunks[2]["text"] == "## Header 2"
-    assert "paragraph 2" in chunks[3]["text"]
-    assert chunks[4]["text"] == "### Header 3"
-    assert "paragraph 3" in chunks[5]["text"]
+    texts = [chunk["text"] for chunk in chunks]
+    assert texts[::2] == ["# Header 1", "## Header 2", "### Header 3"]
+    assert all(f"paragraph {n}" in text for n, text in enumerate(texts[1::2], 1))
 
 def test_markdown_chunker_long_paragraphs(markdown_chunker):
     """Test markdown chunking with long paragraphs."""
@@ -42,7 +38,7 @@ def test_markdown_chunker_long_paragraphs(markdown_chunker):
     
     chunks = markdown_chunker.chunk(text)
     assert len(chunks) > 1
-    assert all(chunk["length"] <= int(os.getenv("RAG_CHUNK_SIZE")) for chunk in chunks)
+    assert max(chunk["length"] for chunk in chunks) <= markdown_chunker.chunk_size
 
 def test_markdown_chunker_overlap(markdown_chunker):
     """Test markdown chunking with overlap."""
@@ -53,11 +49,11 @@ def test_markdown_chunker_overlap(markdown_chunker):
     assert len(chunks) > 1
     
     # Check for overlap between consecutive chunks
-    for i in range(len(chunks) - 1):
-        words_in_first = set(chunks[i]["text"].split())
-        words_in_second = set(chunks[i + 1]["text"].split())
-        overlap = words_in_first & words_in_second
-        assert len(overlap) > 0, f"No overlap found between chunks {i} and {i+1}"
+    previous_words = set(chunks[0]["text"].split())
+    for i in range(1, len(chunks)):
+        words = set(chunks[i]["text"].split())
+        assert previous_words & words, f"No overlap found between chunks {i-1} and {i}"
+        previous_words = words
 
 def test_sentence_chunker_basic(sentence_chunker):
     """Test basic sentence chunking."""
@@ -75,7 +71,7 @@ def test_sentence_chunker_long_text(sentence_chunker):
     
     chunks = sentence_chunker.chunk(text)
     assert len(chunks) > 1
-    assert all(chunk["length"] <= int(os.getenv("RAG_CHUNK_SIZE")) for chunk in chunks)
+    assert max(chunk["length"] for chunk in chunks) <= sentence_chunker.chunk_size
 
 def test_sentence_chunker_overlap(sentence_chunker):
     """Test sentence chunking with overlap."""
@@ -83,10 +79,24 @@ def test_sentence_chunker_overlap(sentence_chunker):
     
     chunks = sentence_chunker.chunk(text)
     assert len(chunks) > 1
-    # Check for overlap
-    first_chunk_sentences = set(chunks[0]["text"].split('.'))
-    second_chunk_sentences = set(chunks[1]["text"].split('.'))
-    assert len(first_chunk_sentences & second_chunk_sentences) > 0
+    
+    # Sentence ends are stripped from chunk text, but every sentence here
+    # is two words, so chunks split back into sentences by word pairs
+    def sentences(chunk):
+        words = chunk["text"].split()
+        return [" ".join(words[i:i + 2]) for i in range(0, len(words), 2)]
+    
+    # Each chunk starts with the previous chunk's trailing sentences, as
+    # many as fit in chunk_overlap characters
+    for i in range(1, len(chunks)):
+        previous, current = sentences(chunks[i - 1]), sentences(chunks[i])
+        carried = []
+        for sentence in reversed(previous):
+            if sum(map(len, carried)) + len(sentence) > sentence_chunker.chunk_overlap:
+                break
+            carried.insert(0, sentence)
+        assert carried, f"No overlap found between chunks {i-1} and {i}"
+        assert current[:len(carried)] == carried
 
 def test_empty_input():
     """Test both chunkers with empty input."""
@@ -111,10 +121,10 @@ def test_single_line():
     assert markdown_chunks[0]["text"] == text.strip()
     assert sentence_chunks[0]["text"] == text.strip()
 
-def test_chunker_configuration():
+def test_chunker_configuration(monkeypatch):
     """Test chunker configuration through environment variables."""
-    os.environ["RAG_CHUNK_SIZE"] = "200"
-    os.environ["RAG_CHUNK_OVERLAP"] = "40"
+    monkeypatch.setenv("RAG_CHUNK_SIZE", "200")
+    monkeypatch.setenv("RAG_CHUNK_OVERLAP", "40")
     
     markdown_chunker = MarkdownChunker()
     sentence_chunker = SentenceChunker()
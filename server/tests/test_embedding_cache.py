@@ -0,0 +1,40 @@
+"""Tests for the persistent embedding cache."""
+import pytest
+import numpy as np
+from src.embeddings.embedding_cache import EmbeddingCache
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create an embedding cache for testing."""
+    cache = EmbeddingCache(str(tmp_path / "cache.db"))
+    yield cache
+    cache.close()
+
+def test_lookup_returns_written_vectors(cache):
+    """Test vectors round-trip as float32 and misses are omitted."""
+    vector = np.array([0.6, 0.8], dtype=np.float32)
+    cache.write({"abc": vector}, "provider", "model")
+    
+    found = cache.lookup(["abc", "missing"], "provider", "model")
+    assert list(found) == ["abc"]
+    assert found["abc"].dtype == np.float32
+    np.testing.assert_array_equal(found["abc"], vector)
+
+def test_entries_are_scoped_by_model(cache):
+    """Test vectors from one model are never returned for another."""
+    cache.write({"abc": np.ones(2)}, "provider", "model-a")
+    cache.write({"abc": np.zeros(2)}, "provider", "model-a")
+    
+    assert cache.lookup(["abc"], "provider", "model-b") == {}
+    np.testing.assert_array_equal(cache.lookup(["abc"], "provider", "model-a")["abc"], np.zeros(2))
+
+def test_cache_persists_across_instances(tmp_path):
+    """Test vectors survive reopening the database."""
+    path = str(tmp_path / "cache.db")
+    first = EmbeddingCache(path)
+    first.write({"abc": np.ones(3)}, "provider", "model")
+    first.close()
+    
+    second = EmbeddingCache(path)
+    assert "abc" in second.lookup(["abc"], "provider", "model")
+    second.close()
@@ -7,9 +7,9 @@ import os
 from unittest.mock import MagicMock, patch
 from src.embeddings import EmbeddingsManager
 
-@pytest.fixture
-def mock_sentence_transformer(monkeypatch):
-    """Mock SentenceTransformer for testing."""
+@pytest.fixture(scope="module")
+def mock_sentence_transformer():
+    """Mock SentenceTransformer, shared by the tests in this module."""
     mock = MagicMock()
     mock.encode.return_value = torch.tensor([[1.0, 0.0], [0.0, 1.0]])
     
@@ -17,12 +17,13 @@ def mock_sentence_transformer(monkeypatch):
         def __init__(self, *args, **kwargs):
             self.encode = mock.encode
     
-    monkeypatch.setattr("sentence_transformers.SentenceTransformer", MockSentenceTransformer)
-    return mock
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("src.embeddings.embeddings_manager.SentenceTransformer", MockSentenceTransformer)
+        yield mock
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def embeddings_manager(mock_sentence_transformer):
-    """Create an embeddings manager for testing."""
+    """Create an embeddings manager, shared by the tests in this module."""
     with patch("platform.system", return_value="Linux"), \
          patch("torch.cuda.is_available", return_value=False):
         return EmbeddingsManager()
@@ -34,7 +35,7 @@ def test_init():
         manager = EmbeddingsManager()
         assert manager.model_name == "all-MiniLM-L6-v2"  # Default model
         assert isinstance(manager.device, torch.device)
-        assert str(manager.device) == "cpu"
+        assert manager.device.type == "cpu"
 
 def test_device_selection():
     """Test device selection logic."""
@@ -47,26 +48,38 @@ def test_device_selection():
         mock_machine.return_value = "arm64"
         mock_cuda.return_value = False
         manager = EmbeddingsManager()
-        assert str(manager.device) == "mps"
+        assert manager.device.type == "mps"
         
         # Test CPU fallback
         mock_system.return_value = "Linux"
         mock_cuda.return_value = False
         manager = EmbeddingsManager()
-        assert str(manager.device) == "cpu"
+        assert manager.device.type == "cpu"
 
 @pytest.mark.asyncio
 async def test_get_embeddings(embeddings_manager):
     """Test embedding generation."""
     texts = ["test text 1", "test text 2"]
-    embeddings = await embeddings_manager.get_embeddings(texts)
+    embeddings, metadata = await embeddings_manager.get_embeddings(texts)
     
     assert isinstance(embeddings, np.ndarray)
+    assert len(metadata) == len(texts)
     assert embeddings.shape == (2, 2)  # Mock returns 2D embeddings
     
-    # Check normalization
-    norms = np.linalg.norm(embeddings, axis=1)
-    np.testing.assert_allclose(norms, 1.0)
+    # Check normalization; squared norms double the relative error of norms
+    squared_norms = np.einsum("ij,ij->i", embeddings, embeddings)
+    np.testing.assert_allclose(squared_norms, 1.0, rtol=2e-7)
+
+@pytest.mark.asyncio
+async def test_encode_batch(embeddings_manager):
+    """Test bulk encoding returns the embedding matrix in one model call."""
+    with patch.object(embeddings_manager, "model") as model:
+        model.encode.return_value = torch.tensor([[3.0, 4.0], [0.0, 2.0]])
+        embeddings = await embeddings_manager.encode_batch(["test text 1", "test text 2"], batch_size=64)
+    
+    np.testing.assert_allclose(embeddings, [[0.6, 0.8], [0.0, 1.0]], rtol=1e-6)
+    model.encode.assert_called_once()
+    assert model.encode.call_args.kwargs["batch_size"] == 64
 
 @pytest.mark.asyncio
 async def test_empty_input(embeddings_manager):
@@ -79,8 +92,12 @@ async def test_error_handling(embeddings_manager, mock_sentence_transformer):
     """Test error handling during embedding generation."""
     mock_sentence_transformer.encode.side_effect = RuntimeError("Mock error")
     
-    with pytest.raises(RuntimeError, match="Mock error"):
-        await embeddings_manager.get_embeddings(["test"])
+    try:
+        with pytest.raises(RuntimeError, match="Mock error"):
+            await embeddings_manager.get_embeddings(["test"])
+    finally:
+        # The mock is shared with the rest of the module
+        mock_sentence_transformer.encode.reset_mock(side_effect=True)
 
 @pytest.mark.asyncio
 async def test_neural_engine_optimization(monkeypatch):
@@ -1,8 +1,10 @@
 """Tests for file processor."""
 import os
+import shutil
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch
+from types import SimpleNamespace as NS
+from unittest.mock import patch
 from src.processors.file_processor import FileProcessor
 from src.processors.chunking import MarkdownChunker
 
@@ -28,11 +30,10 @@ def processor():
     """Create file processor for testing."""
     return FileProcessor(chunking_strategy=MarkdownChunker())
 
-@pytest.fixture
-def test_files(tmp_path):
-    """Create test files."""
-    # Create test files
-    test_dir = tmp_path
+@pytest.fixture(scope="session")
+def master_files(tmp_path_factory):
+    """Create the canonical test files once per session."""
+    test_dir = tmp_path_factory.mktemp("master")
     
     # Empty file
     empty_file = test_dir / "empty.txt"
@@ -47,11 +48,28 @@ def test_files(tmp_path):
     txt_file.write_text("This is a test text file.\nWith multiple lines.")
     
     return {
-        'empty': str(empty_file),
-        'markdown': str(md_file),
-        'text': str(txt_file)
+        'empty': empty_file,
+        'markdown': md_file,
+        'text': txt_file
     }
 
+def _link_or_copy(source: Path, dest: Path):
+    """Hardlink source to dest, copying where hardlinks are unsupported."""
+    try:
+        os.link(source, dest)
+    except OSError:
+        shutil.copyfile(source, dest)
+
+@pytest.fixture
+def test_files(tmp_path, master_files):
+    """Give each test its own directory of test files, linked to the masters."""
+    files = {}
+    for kind, source in master_files.items():
+        dest = tmp_path / source.name
+        _link_or_copy(source, dest)
+        files[kind] = str(dest)
+    return files
+
 def test_process_markdown(processor, test_files):
     """Test processing markdown files."""
     chunks = processor.process_file(test_files['markdown'])
@@ -73,13 +91,12 @@ def test_process_text(processor, test_files):
 @patch('src.processors.file_processor.Document')
 def test_process_docx(mock_document, processor, tmp_path):
     """Test processing Word documents."""
-    # Mock Document class
-    mock_doc = Mock()
-    mock_doc.paragraphs = [
-        Mock(text="Paragraph 1"),
-        Mock(text="Paragraph 2"),
-        Mock(text="Paragraph 3")
-    ]
+    # Stand-in for the Document class; only .paragraphs[].text is read
+    mock_doc = NS(paragraphs=[
+        NS(text="Paragraph 1"),
+        NS(text="Paragraph 2"),
+        NS(text="Paragraph 3")
+    ])
     mock_document.return_value = mock_doc
     
     # Create dummy docx file
@@ -96,19 +113,14 @@ def test_process_docx(mock_document, processor, tmp_path):
 @patch('src.processors.file_processor.Presentation')
 def test_process_pptx(mock_presentation, processor, tmp_path):
     """Test processing PowerPoint presentations."""
-    # Mock Presentation class
-    mock_pres = Mock()
-    mock_shape1 = Mock()
-    mock_shape1.text = "Slide 1 content"
-    mock_shape2 = Mock()
-    mock_shape2.text = "Slide 2 content"
-    
-    mock_slide1 = Mock()
-    mock_slide1.shapes = [mock_shape1]
-    mock_slide2 = Mock()
-    mock_slide2.shapes = [mock_shape2]
-    
-    mock_pres.slides = [mock_slide1, mock_slide2]
+    # Stand-in for the Presentation class; only slides, shapes and text are read
+    mock_shape1 = NS(text="Slide 1 content")
+    mock_shape2 = NS(text="Slide 2 content")
+    
+    mock_slide1 = NS(shapes=[mock_shape1])
+    mock_slide2 = NS(shapes=[mock_shape2])
+    
+    mock_pres = NS(slides=[mock_slide1, mock_slide2])
     mock_presentation.return_value = mock_pres
     
     # Create dummy pptx file
@@ -125,14 +137,11 @@ def test_process_pptx(mock_presentation, processor, tmp_path):
 @patch('src.processors.file_processor.PdfReader')
 def test_process_pdf(mock_pdfreader, processor, tmp_path):
     """Test processing PDF documents."""
-    # Mock PdfReader class
-    mock_reader = Mock()
-    mock_page1 = Mock()
-    mock_page1.extract_text.return_value = "Page 1 content"
-    mock_page2 = Mock()
-    mock_page2.extract_text.return_value = "Page 2 content"
-    
-    mock_reader.pages = [mock_page1, mock_page2]
+    # Stand-in for the PdfReader class; only pages[].extract_text() is called
+    mock_page1 = NS(extract_text=lambda: "Page 1 content")
+    mock_page2 = NS(extract_text=lambda: "Page 2 content")
+    
+    mock_reader = NS(pages=[mock_page1, mock_page2])
     mock_pdfreader.return_value = mock_reader
     
     # Create dummy pdf file
@@ -153,7 +162,8 @@ def test_custom_chunking_config(tmp_path):
     
     # Create test file
     test_file = tmp_path / "test.txt"
-    test_file.write_text("A " * 300)  # Create content larger than chunk size
+    test_file.write_bytes(b"A " * 300)  # Create content larger than chunk size
+    assert os.path.getsize(test_file) == 600
     
     chunks = processor.process_file(str(test_file))
     
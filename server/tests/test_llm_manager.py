@@ -0,0 +1,59 @@
+"""Tests for LLM management."""
+import asyncio
+import time
+import pytest
+from unittest.mock import patch
+from src.llm.llm_manager import LLMManager
+
+class FakeModel:
+    """Stands in for a llama.cpp model, decoding one token every 10 ms."""
+
+    def __init__(self, num_tokens=50):
+        self.num_tokens = num_tokens
+        self.decoded = 0
+
+    def __call__(self, prompt, stream=False, **kwargs):
+        if not stream:
+            return {"choices": [{"text": "done"}]}
+        return self._tokens()
+
+    def _tokens(self):
+        for i in range(self.num_tokens):
+            time.sleep(0.01)
+            self.decoded += 1
+            yield {"choices": [{"text": f"{i} "}]}
+
+@pytest.fixture
+def llm_manager(tmp_path):
+    """Create an LLM manager around a fake model."""
+    model_path = tmp_path / "model.gguf"
+    model_path.touch()
+    with patch.object(LLMManager, "_load_model", return_value=FakeModel()), \
+         patch.object(LLMManager, "_log_hardware_info"):
+        return LLMManager(str(model_path))
+
+@pytest.mark.asyncio
+async def test_stream(llm_manager):
+    """Test streaming yields every decoded token in order."""
+    llm_manager.model.num_tokens = 3
+    tokens = [token async for token in llm_manager.stream("prompt")]
+    assert tokens == ["0 ", "1 ", "2 "]
+
+@pytest.mark.asyncio
+async def test_closed_stream_releases_model(llm_manager):
+    """Test closing a stream early stops decoding and frees the model."""
+    stream = llm_manager.stream("prompt")
+    assert await stream.__anext__() == "0 "
+    await stream.aclose()
+
+    assert await asyncio.wait_for(llm_manager.generate("other prompt"), 1) == "done"
+    assert llm_manager.model.decoded < llm_manager.model.num_tokens
+
+@pytest.mark.asyncio
+async def test_abandoned_stream_does_not_deadlock(llm_manager):
+    """Test a stream that is never resumed or closed frees the model once decoded."""
+    stream = llm_manager.stream("prompt")
+    await stream.__anext__()
+
+    assert await asyncio.wait_for(llm_manager.generate("other prompt"), 5) == "done"
+    await stream.aclose()
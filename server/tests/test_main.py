@@ -3,7 +3,7 @@ import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import patch, MagicMock
 import numpy as np
-from src.main import app
+from src.main import app, get_vault_manager
 from src.vault.vault_manager import VaultManager
 
 @pytest.fixture
@@ -41,13 +41,16 @@ def mock_vault_manager():
     
     return mock
 
-@pytest.fixture
-def client(mock_vault_manager):
-    """Create test client."""
-    # Override the vault manager dependency
-    app.dependency_overrides[VaultManager] = lambda: mock_vault_manager
-    client = TestClient(app)
-    yield client
+@pytest.fixture(scope="module")
+def client():
+    """Create test client, shared by the tests in this module."""
+    return TestClient(app)
+
+@pytest.fixture(autouse=True)
+def _override_vault_manager(mock_vault_manager):
+    """Point the app at this test's mock vault manager."""
+    app.dependency_overrides[get_vault_manager] = lambda: mock_vault_manager
+    yield
     # Clear dependency overrides after test
     app.dependency_overrides.clear()
 
@@ -85,7 +88,8 @@ def test_health_check(client):
     assert response.status_code == 200
     assert response.json() == {"status": "healthy"}
 
-def test_search(client, mock_vault_manager):
+@pytest.mark.parametrize("num_results", [1, 100, 10000])
+def test_search(client, mock_vault_manager, num_results):
     """Test search endpoint."""
     # Mock successful search
     mock_vault_manager.search.return_value = [
@@ -94,7 +98,7 @@ def test_search(client, mock_vault_manager):
             "similarity": 0.9,
             "source": "test.md"
         }
-    ]
+    ] * num_results
     
     response = client.post(
         "/search",
@@ -106,7 +110,8 @@ def test_search(client, mock_vault_manager):
     assert response.status_code == 200
     data = response.json()
     assert "results" in data
-    assert len(data["results"]) > 0
+    assert len(data["results"]) == num_results
+    assert data["results"][0] == {"content": "Test content", "similarity": 0.9, "source": "test.md"}
 
 def test_index(client, mock_vault_manager):
     """Test index endpoint."""
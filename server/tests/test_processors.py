@@ -1,5 +1,6 @@
 """Tests for file processors."""
 import os
+import threading
 import pytest
 from pathlib import Path
 from datetime import datetime
@@ -10,9 +11,11 @@ from src.processors.pdf_processor import PDFProcessor
 from src.processors.word_processor import WordProcessor
 from src.processors.processor_factory import ProcessorFactory
 
-@pytest.fixture
-def test_files(tmp_path):
-    """Create test files for testing."""
+@pytest.fixture(scope="session")
+def test_files(tmp_path_factory, docx_blob, pdf_blob):
+    """Create test files for testing, once per session since tests only read them."""
+    tmp_path = tmp_path_factory.mktemp("proc_files")
+    
     # Create markdown file
     md_file = tmp_path / "test.md"
     md_file.write_text("""---
@@ -36,23 +39,11 @@ Another paragraph with some **bold** and *italic* text.
     
     # Create Word file
     docx_file = tmp_path / "test.docx"
-    from docx import Document
-    doc = Document()
-    doc.add_heading('Test Document', 0)
-    doc.add_paragraph('This is a test paragraph.')
-    doc.add_heading('Section 1', 1)
-    doc.add_paragraph('Another paragraph.')
-    doc.save(str(docx_file))
+    docx_file.write_bytes(docx_blob)
     
     # Create PDF file
     pdf_file = tmp_path / "test.pdf"
-    import fitz
-    doc = fitz.open()
-    page = doc.new_page()
-    page.insert_text((50, 50), "Test Document")
-    page.insert_text((50, 100), "This is a test paragraph.")
-    doc.save(str(pdf_file))
-    doc.close()
+    pdf_file.write_bytes(pdf_blob)
     
     return {
         'markdown': md_file,
@@ -60,72 +51,94 @@ Another paragraph with some **bold** and *italic* text.
         'pdf': pdf_file
     }
 
-def test_markdown_processor(test_files):
-    """Test markdown processor."""
-    processor = MarkdownProcessor()
+# Processors are stateless, so one instance per type serves every case
+_PROCESSORS = {
+    'markdown': MarkdownProcessor(),
+    'word': WordProcessor(),
+    'pdf': PDFProcessor()
+}
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("kind,expected_metadata,expected_text", [
+    (
+        'markdown',
+        {'type': 'markdown', 'title': 'Test Document', 'author': 'Test Author'},
+        ['Heading 1', 'test paragraph', 'List item']
+    ),
+    ('word', {'type': 'word'}, ['Test Document', 'test paragraph', 'Section 1']),
+    ('pdf', {'type': 'pdf'}, ['Test Document', 'test paragraph'])
+])
+async def test_processor(test_files, kind, expected_metadata, expected_text):
+    """Test each file processor on its own file type."""
+    processor = _PROCESSORS[kind]
     
     # Test file type detection
-    assert processor.can_process(test_files['markdown'])
-    assert not processor.can_process(test_files['word'])
-    assert not processor.can_process(test_files['pdf'])
+    assert [processor.can_process(path) for path in test_files.values()] == [
+        other == kind for other in test_files
+    ]
     
     # Test processing
-    chunks = processor.process(test_files['markdown'])
+    chunks = await processor.process(test_files[kind])
     assert len(chunks) > 0
     
     # Check metadata
-    assert chunks[0].metadata['type'] == 'markdown'
-    assert chunks[0].metadata['title'] == 'Test Document'
-    assert chunks[0].metadata['author'] == 'Test Author'
+    metadata = chunks[0].metadata
+    assert {key: metadata.get(key) for key in expected_metadata} == expected_metadata
     
     # Check content
     text = ' '.join(chunk.content for chunk in chunks)
-    assert 'Heading 1' in text
-    assert 'test paragraph' in text
-    assert 'List item' in text
+    assert [phrase for phrase in expected_text if phrase not in text] == []
 
-def test_word_processor(test_files):
-    """Test Word processor."""
-    processor = WordProcessor()
-    
-    # Test file type detection
-    assert processor.can_process(test_files['word'])
-    assert not processor.can_process(test_files['markdown'])
-    assert not processor.can_process(test_files['pdf'])
-    
-    # Test processing
-    chunks = processor.process(test_files['word'])
-    assert len(chunks) > 0
-    
-    # Check metadata
-    assert chunks[0].metadata['type'] == 'word'
-    
-    # Check content
+@pytest.mark.asyncio
+@pytest.mark.parametrize("kind", ['word', 'pdf'])
+async def test_processor_runs_off_event_loop(test_files, kind, monkeypatch):
+    """Test CPU-bound processors parse on a worker thread."""
+    processor = _PROCESSORS[kind]
+    threads = []
+    process_file = processor._process_file
+    
+    def record_thread(file_path):
+        threads.append(threading.get_ident())
+        return process_file(file_path)
+    
+    monkeypatch.setattr(processor, "_process_file", record_thread)
+    await processor.process(test_files[kind])
+    assert threads and threads[0] != threading.get_ident()
+
+@pytest.mark.asyncio
+async def test_word_processor_keeps_short_text(tmp_path):
+    """Test text shorter than half a chunk survives headings and the end of file."""
+    from docx import Document
+    doc = Document()
+    doc.add_paragraph('Short intro.')
+    doc.add_heading('Details', 1)
+    doc.add_paragraph('Short body.')
+    path = tmp_path / "short.docx"
+    doc.save(str(path))
+    
+    chunks = await WordProcessor().process(path)
+    assert len(chunks) >= 1
     text = ' '.join(chunk.content for chunk in chunks)
-    assert 'Test Document' in text
-    assert 'test paragraph' in text
-    assert 'Section 1' in text
+    assert text.index('Short intro.') < text.index('Details') < text.index('Short body.')
 
-def test_pdf_processor(test_files):
-    """Test PDF processor."""
-    processor = PDFProcessor()
-    
-    # Test file type detection
-    assert processor.can_process(test_files['pdf'])
-    assert not processor.can_process(test_files['markdown'])
-    assert not processor.can_process(test_files['word'])
-    
-    # Test processing
-    chunks = processor.process(test_files['pdf'])
-    assert len(chunks) > 0
-    
-    # Check metadata
-    assert chunks[0].metadata['type'] == 'pdf'
+@pytest.mark.asyncio
+async def test_pdf_processor_keeps_short_text(tmp_path):
+    """Test text shorter than half a chunk survives headers and page breaks."""
+    import fitz
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((50, 50), "Short intro.")
+    page.insert_text((50, 100), "Details", fontsize=16)
+    page = doc.new_page()
+    page.insert_text((50, 50), "Short body.")
+    path = tmp_path / "short.pdf"
+    doc.save(str(path))
+    doc.close()
     
-    # Check content
+    chunks = await PDFProcessor().process(path)
+    assert len(chunks) >= 1
     text = ' '.join(chunk.content for chunk in chunks)
-    assert 'Test Document' in text
-    assert 'test paragraph' in text
+    assert text.index('Short intro.') < text.index('Details') < text.index('Short body.')
 
 def test_processor_factory(test_files):
     """Test processor factory."""
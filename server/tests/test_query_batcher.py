@@ -0,0 +1,89 @@
+"""Tests for query embedding micro-batching."""
+import asyncio
+import pytest
+import numpy as np
+from src.embeddings import QueryBatcher
+
+class FakeEmbeddingsManager:
+    """Embeds each text as a one-hot vector and records every batch."""
+
+    def __init__(self, error=None, release=None):
+        self.calls = []
+        self.error = error
+        self.release = release
+
+    async def get_embeddings(self, texts):
+        self.calls.append(list(texts))
+        if self.release is not None:
+            await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        embeddings = np.zeros((len(texts), 8), dtype=np.float32)
+        for i, text in enumerate(texts):
+            embeddings[i, int(text[-1])] = 1.0
+        return embeddings, [{} for _ in texts]
+
+@pytest.mark.asyncio
+async def test_concurrent_queries_coalesce():
+    """Test concurrent embed() calls share one get_embeddings call."""
+    manager = FakeEmbeddingsManager()
+    batcher = QueryBatcher(manager, max_wait=0.05)
+
+    results = await asyncio.gather(*(batcher.embed(f"query {i}") for i in range(4)))
+
+    assert manager.calls == [["query 0", "query 1", "query 2", "query 3"]]
+    for i, embedding in enumerate(results):
+        assert np.argmax(embedding) == i
+
+@pytest.mark.asyncio
+async def test_batches_split_at_max_batch_size():
+    """Test a burst larger than max_batch_size is embedded in several batches."""
+    manager = FakeEmbeddingsManager()
+    batcher = QueryBatcher(manager, max_batch_size=2, max_wait=0.05)
+
+    results = await asyncio.gather(*(batcher.embed(f"query {i}") for i in range(5)))
+
+    assert [len(call) for call in manager.calls] == [2, 2, 1]
+    assert [int(np.argmax(embedding)) for embedding in results] == list(range(5))
+
+@pytest.mark.asyncio
+async def test_encode_error_reaches_every_waiter():
+    """Test an embedding failure is raised to every caller in the batch."""
+    manager = FakeEmbeddingsManager(error=RuntimeError("encode failed"))
+    batcher = QueryBatcher(manager, max_wait=0.05)
+
+    results = await asyncio.gather(
+        *(batcher.embed(f"query {i}") for i in range(3)), return_exceptions=True
+    )
+
+    assert len(manager.calls) == 1
+    assert all(isinstance(r, RuntimeError) and str(r) == "encode failed" for r in results)
+
+    # The worker survives the failure and serves later queries
+    manager.error = None
+    embedding = await asyncio.wait_for(batcher.embed("query 5"), 1)
+    assert np.argmax(embedding) == 5
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_break_batch():
+    """Test cancelling one caller mid-batch leaves the other callers' results intact."""
+    release = asyncio.Event()
+    manager = FakeEmbeddingsManager(release=release)
+    batcher = QueryBatcher(manager, max_wait=0.05)
+
+    tasks = [asyncio.create_task(batcher.embed(f"query {i}")) for i in range(3)]
+    while not manager.calls:
+        await asyncio.sleep(0.01)
+    tasks[1].cancel()
+    release.set()
+
+    results = await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), 1)
+
+    assert len(manager.calls) == 1
+    assert isinstance(results[1], asyncio.CancelledError)
+    assert np.argmax(results[0]) == 0
+    assert np.argmax(results[2]) == 2
+    assert not batcher._worker.done()
+
+    embedding = await asyncio.wait_for(batcher.embed("query 4"), 1)
+    assert np.argmax(embedding) == 4
@@ -1,8 +1,6 @@
 """Tests for RAG service."""
 import pytest
 import os
-import tempfile
-import shutil
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 import numpy as np
@@ -10,17 +8,9 @@ from src.rag.rag_service import RAGService
 from src.llm.llm_manager import LLMManager
 
 @pytest.fixture
-def test_dir():
-    """Create a temporary directory for testing."""
-    temp_dir = tempfile.mkdtemp()
-    yield temp_dir
-    shutil.rmtree(temp_dir)
-
-@pytest.fixture
-def test_vault_dir(test_dir):
+def test_vault_dir(tmp_path_factory):
     """Create a test vault directory with sample files."""
-    vault_dir = Path(test_dir) / "test_vault"
-    vault_dir.mkdir()
+    vault_dir = tmp_path_factory.mktemp("vault")
     
     # Create a sample markdown file
     with open(vault_dir / "test.md", "w") as f:
@@ -28,9 +18,9 @@ def test_vault_dir(test_dir):
     
     yield str(vault_dir)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_llm_manager():
-    """Create mock LLM manager."""
+    """Create mock LLM manager shared by all tests."""
     mock = MagicMock(spec=LLMManager)
     mock.generate.return_value = "Test response"
     return mock
@@ -38,6 +28,8 @@ def mock_llm_manager():
 @pytest.fixture
 def rag_service(tmp_path, mock_llm_manager):
     """Create RAG service instance for testing."""
+    # Keeps return values but clears call counts from earlier tests
+    mock_llm_manager.reset_mock()
     with patch('src.rag.rag_service.LLMManager', return_value=mock_llm_manager):
         service = RAGService(
             base_dir=str(tmp_path),
@@ -122,6 +114,44 @@ async def test_querying(rag_service, tmp_path):
     assert "response" in response
     assert "sources" in response
 
+@pytest.mark.asyncio
+async def test_query_cache(rag_service, mock_llm_manager, tmp_path):
+    """Test that repeated queries reuse the cached response until the index changes."""
+    vault_path = tmp_path / "test_vault"
+    vault_path.mkdir()
+    test_file = vault_path / "test.md"
+    test_file.write_text("# Test\nThis is a unique test document for querying.")
+    
+    await rag_service.register_vault(
+        name="test_vault",
+        path=str(vault_path),
+        file_types=["md"],
+        enabled=True
+    )
+    await rag_service.process_vault("test_vault")
+    
+    first = await rag_service.query("unique test document")
+    second = await rag_service.query("unique test document")
+    assert second == first
+    assert mock_llm_manager.generate.call_count == 1
+    
+    # Changing a returned result leaves the cached one intact
+    second["sources"][0]["content"] = "changed"
+    second["sources"].clear()
+    third = await rag_service.query("unique test document")
+    assert third == first and third is not first
+    assert mock_llm_manager.generate.call_count == 1
+    
+    # A different result count is a different retrieval
+    await rag_service.query("unique test document", max_results=1)
+    assert mock_llm_manager.generate.call_count == 2
+    
+    # Reindexing changes the index files, which drops the cache
+    test_file.write_text("# Test\nThis document has been rewritten.")
+    await rag_service.process_vault("test_vault")
+    await rag_service.query("unique test document")
+    assert mock_llm_manager.generate.call_count == 3
+
 @pytest.mark.asyncio
 async def test_error_handling(rag_service):
     """Test error handling."""
@@ -0,0 +1,36 @@
+"""Tests for the semantic query cache."""
+import numpy as np
+from src.rag.semantic_cache import SemanticCache
+
+def _unit(*values):
+    vector = np.array(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+def test_similar_queries_hit():
+    """Test near-duplicate queries in the same scope return the cached response."""
+    cache = SemanticCache(size=4, threshold=0.95)
+    cache.put(_unit(1, 0), "scope", 1, {"response": "a"})
+    
+    assert cache.get(_unit(1, 0.1), "scope", 1) == {"response": "a"}
+    assert cache.get(_unit(1, 1), "scope", 1) is None
+    assert cache.get(_unit(1, 0), "other", 1) is None
+
+def test_version_change_clears_cache():
+    """Test responses are dropped once the index version changes."""
+    cache = SemanticCache(size=4)
+    cache.put(_unit(1, 0), "scope", 1, {"response": "a"})
+    
+    assert cache.get(_unit(1, 0), "scope", 2) is None
+    assert cache.get(_unit(1, 0), "scope", 1) is None
+
+def test_least_recently_used_is_evicted():
+    """Test a full cache evicts the entry used longest ago."""
+    cache = SemanticCache(size=2)
+    cache.put(_unit(1, 0, 0), "scope", 1, {"response": "a"})
+    cache.put(_unit(0, 1, 0), "scope", 1, {"response": "b"})
+    assert cache.get(_unit(1, 0, 0), "scope", 1) == {"response": "a"}
+    
+    cache.put(_unit(0, 0, 1), "scope", 1, {"response": "c"})
+    assert cache.get(_unit(0, 1, 0), "scope", 1) is None
+    assert cache.get(_unit(1, 0, 0), "scope", 1) == {"response": "a"}
+    assert cache.get(_unit(0, 0, 1), "scope", 1) == {"response": "c"}
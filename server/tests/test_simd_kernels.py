@@ -0,0 +1,145 @@
+"""Tests for the fused similarity + top-k search kernels."""
+import pytest
+import numpy as np
+from src.vault import _simd_kernels as kernels
+
+SIZES = [0, 1, 255, 256, 257, 1000]
+
+def make_data(n, d=32, seed=0):
+    """Random normalized rows and query."""
+    rng = np.random.default_rng(seed)
+    matrix = rng.standard_normal((n, d)).astype(np.float32)
+    matrix /= np.maximum(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12)
+    query = rng.standard_normal(d).astype(np.float32)
+    query /= np.linalg.norm(query)
+    return matrix, query
+
+def reference(matrix, query, k):
+    """Brute-force top-k the kernels must agree with."""
+    scores = matrix.astype(np.float32) @ query
+    order = np.argsort(-scores)[:k]
+    return order, scores[order]
+
+@pytest.fixture
+def numba_only(monkeypatch):
+    """Disable SimSIMD so float matrices go through the Numba kernel."""
+    if not kernels.NUMBA_AVAILABLE:
+        pytest.skip("numba not installed")
+    monkeypatch.setattr(kernels, "SIMSIMD_AVAILABLE", False)
+
+@pytest.fixture
+def numpy_only(monkeypatch):
+    """Disable both accelerators so only the BLAS + argpartition path runs."""
+    monkeypatch.setattr(kernels, "SIMSIMD_AVAILABLE", False)
+    monkeypatch.setattr(kernels, "NUMBA_AVAILABLE", False)
+
+@pytest.fixture
+def simsimd_only():
+    """Require SimSIMD for the float16 and int8 paths."""
+    if not kernels.SIMSIMD_AVAILABLE:
+        pytest.skip("simsimd not installed")
+
+@pytest.mark.parametrize("n", SIZES)
+@pytest.mark.parametrize("k", [1, 10, 64, 2000])
+def test_top_k_numba(numba_only, n, k):
+    """Test the fused kernel across block boundaries and k > N."""
+    matrix, query = make_data(n)
+    indices, scores = kernels.top_k(matrix, query, k)
+
+    expected_indices, expected_scores = reference(matrix, query, k)
+    np.testing.assert_array_equal(indices, expected_indices)
+    np.testing.assert_allclose(scores, expected_scores, rtol=1e-5, atol=1e-6)
+
+@pytest.mark.parametrize("n", SIZES)
+@pytest.mark.parametrize("k", [1, 10, 2000])
+def test_top_k_argpartition(numpy_only, n, k):
+    """Test the NumPy fallback matches a full sort."""
+    matrix, query = make_data(n)
+    indices, scores = kernels.top_k(matrix, query, k)
+
+    expected_indices, expected_scores = reference(matrix, query, k)
+    np.testing.assert_array_equal(indices, expected_indices)
+    np.testing.assert_allclose(scores, expected_scores, rtol=1e-5, atol=1e-6)
+
+@pytest.mark.parametrize("k", [kernels._MAX_FUSED_K + 1, 500])
+def test_top_k_large_k_skips_fused_kernel(numba_only, k):
+    """Test k above the fused-kernel limit still returns the exact top k."""
+    matrix, query = make_data(1000)
+    indices, scores = kernels.top_k(matrix, query, k)
+
+    expected_indices, expected_scores = reference(matrix, query, k)
+    np.testing.assert_array_equal(indices, expected_indices)
+    np.testing.assert_allclose(scores, expected_scores, rtol=1e-5, atol=1e-6)
+
+@pytest.mark.parametrize("n", SIZES)
+@pytest.mark.parametrize("k", [1, 10, 2000])
+def test_top_k_float16(simsimd_only, n, k):
+    """Test float16 matrices scored by SimSIMD match the float32 product."""
+    matrix, query = make_data(n)
+    matrix = matrix.astype(np.float16)
+    indices, scores = kernels.top_k(matrix, query, k)
+
+    # Half precision can reorder near-ties, so compare scores rather than ids
+    _, expected_scores = reference(matrix, query, k)
+    assert len(indices) == min(k, n)
+    np.testing.assert_allclose(scores, expected_scores, atol=2e-3)
+    np.testing.assert_allclose(matrix[indices].astype(np.float32) @ query, scores, atol=2e-3)
+
+@pytest.mark.parametrize("simsimd_on", [True, False])
+@pytest.mark.parametrize("n", SIZES)
+@pytest.mark.parametrize("k", [1, 10, 2000])
+def test_top_k_int8(monkeypatch, simsimd_on, n, k):
+    """Test int8 rows with per-row scales match the dequantized product."""
+    if simsimd_on and not kernels.SIMSIMD_AVAILABLE:
+        pytest.skip("simsimd not installed")
+    monkeypatch.setattr(kernels, "SIMSIMD_AVAILABLE", simsimd_on)
+    # Dequantize across several blocks on the NumPy path
+    monkeypatch.setattr(kernels, "_DEQUANT_BLOCK", 100)
+
+    matrix, query = make_data(n)
+    quantized, scales = kernels.quantize_int8(matrix)
+    indices, scores = kernels.top_k(quantized, query, k, scales)
+
+    dequantized = quantized.astype(np.float32) * scales[:, None]
+    _, expected_scores = reference(dequantized, query, k)
+    assert len(indices) == min(k, n)
+    np.testing.assert_allclose(scores, expected_scores, atol=2e-2)
+    np.testing.assert_allclose(dequantized[indices] @ query, scores, atol=2e-2)
+
+def test_top_k_non_contiguous(numba_only):
+    """Test strided and Fortran-order inputs give the same results."""
+    matrix, query = make_data(600)
+    expected_indices, _ = reference(matrix[::2], query, 10)
+
+    indices, _ = kernels.top_k(matrix[::2], query, 10)
+    np.testing.assert_array_equal(indices, expected_indices)
+
+    indices, _ = kernels.top_k(np.asfortranarray(matrix[::2]), query, 10)
+    np.testing.assert_array_equal(indices, expected_indices)
+
+def test_block_topk_pads_short_blocks():
+    """Test the raw kernel marks unused slots in short blocks with -1."""
+    if not kernels.NUMBA_AVAILABLE:
+        pytest.skip("numba not installed")
+    matrix, query = make_data(kernels._BLOCK_SIZE + 3)
+    indices, scores = kernels._block_topk(matrix, query, 5)
+
+    assert indices.shape == (10,)
+    np.testing.assert_array_equal(indices[5:8] >= kernels._BLOCK_SIZE, True)
+    np.testing.assert_array_equal(indices[8:], -1)
+    assert np.all(np.isneginf(scores[8:]))
+
+@pytest.mark.parametrize("n", [3, kernels._BLOCK_SIZE + 20])
+def test_top_k_fills_sentinel_slots(numba_only, n):
+    """Test k above a block's row count with every score negative."""
+    matrix, query = make_data(n)
+    # Flip every row against the query, so all scores are at most zero
+    # and have to displace the -inf sentinels
+    matrix *= -np.sign(matrix @ query)[:, None]
+    k = kernels._MAX_FUSED_K
+    indices, scores = kernels.top_k(matrix, query, k)
+
+    expected_indices, expected_scores = reference(matrix, query, k)
+    assert np.all(scores <= 0)
+    np.testing.assert_array_equal(indices, expected_indices)
+    np.testing.assert_allclose(scores, expected_scores, rtol=1e-5, atol=1e-6)
@@ -2,15 +2,24 @@
 import pytest
 from pathlib import Path
 import json
+import asyncio
+import threading
 import numpy as np
-from src.vault.vault_manager import VaultManager
+from unittest.mock import patch
+from watchdog.events import FileModifiedEvent, FileMovedEvent
+from src.vault.vault_manager import VaultEventHandler, VaultManager, iter_vault_files
 from src.embeddings.embeddings_manager import EmbeddingsManager
 
+@pytest.fixture(scope="session")
+def shared_embeddings_manager():
+    """Load the embedding model once for all vault tests."""
+    return EmbeddingsManager()
+
 @pytest.fixture
-def vault_manager(tmp_path):
+def vault_manager(tmp_path, shared_embeddings_manager):
     """Create vault manager for testing."""
     config_dir = tmp_path / "config"
-    return VaultManager(str(config_dir))
+    return VaultManager(str(config_dir), embeddings_manager=shared_embeddings_manager)
 
 @pytest.fixture
 def test_vault(tmp_path):
@@ -64,6 +73,9 @@ async def test_vault_indexing(vault_manager, test_vault):
         file_path = test_vault / f"test{i}.md"
         file_path.write_text(f"# Test {i}\nThis is test content {i}")
     
+    # The int8 copy is only written for vaults searched without an ANN index
+    vault_manager.faiss_index_type = None
+    
     # Configure vault
     vault_manager.add_vault(
         name="test_vault",
@@ -82,6 +94,113 @@ async def test_vault_indexing(vault_manager, test_vault):
     index_dir = vault_manager.config_dir / "indices" / "test_vault"
     assert (index_dir / "embeddings.npy").exists()
     assert (index_dir / "chunks.json").exists()
+    
+    # Embeddings are stored row-major in the dtype recorded in meta.json
+    stored = np.load(index_dir / "embeddings.npy", mmap_mode="r")
+    meta = json.loads((index_dir / "meta.json").read_text())
+    assert stored.flags["C_CONTIGUOUS"]
+    assert stored.dtype == np.float16
+    assert meta["dtype"] == str(stored.dtype)
+    
+    # int8 copy should match the float embeddings row for row
+    embeddings = np.asarray(stored, dtype=np.float32)
+    quantized = np.load(index_dir / "embeddings_i8.npy")
+    scales = np.load(index_dir / "scales.npy")
+    assert quantized.dtype == np.int8
+    np.testing.assert_allclose(quantized * scales[:, None], embeddings, atol=float(scales.max()))
+
+@pytest.mark.asyncio
+async def test_incremental_reindex(vault_manager, test_vault):
+    """Test reindexing only embeds content that is not already cached."""
+    for i in range(3):
+        (test_vault / f"test{i}.md").write_text(f"# Test {i}\nThis is test content {i}")
+    vault_manager.add_vault(
+        name="test_vault",
+        path=str(test_vault),
+        file_types=["md"],
+        enabled=True
+    )
+    await vault_manager.index_vault("test_vault")
+    
+    encode_batch = vault_manager.embeddings_manager.encode_batch
+    with patch.object(
+        vault_manager.embeddings_manager, "encode_batch", side_effect=encode_batch
+    ) as mock_encode:
+        stats = await vault_manager.index_vault("test_vault")
+        assert stats["unchanged_files"] == 3
+        mock_encode.assert_not_called()
+        
+        # Only the rewritten file's new content is embedded
+        (test_vault / "test1.md").write_text("# Test 1\nThis content has changed")
+        stats = await vault_manager.index_vault("test_vault")
+        assert stats["unchanged_files"] == 2
+        mock_encode.assert_called_once()
+        embedded = mock_encode.call_args.args[0]
+        assert all(chunk.metadata["source"].endswith("test1.md") for chunk in embedded)
+
+@pytest.mark.asyncio
+async def test_failed_commit_keeps_previous_index(vault_manager, test_vault):
+    """Test a failing ANN build leaves the previous index files untouched."""
+    pytest.importorskip("faiss")
+    for i in range(3):
+        (test_vault / f"test{i}.md").write_text(f"# Test {i}\nThis is test content {i}")
+    vault_manager.faiss_index_type = None
+    vault_manager.add_vault(
+        name="test_vault",
+        path=str(test_vault),
+        file_types=["md"],
+        enabled=True
+    )
+    await vault_manager.index_vault("test_vault")
+    index_dir = vault_manager.config_dir / "indices" / "test_vault"
+    before = {
+        name: (index_dir / name).read_bytes()
+        for name in ("embeddings.npy", "chunks.json", "state.json", "meta.json")
+    }
+    
+    (test_vault / "test1.md").write_text("# Test 1\nThis content has changed")
+    vault_manager.faiss_index_type = "flat"
+    with patch("src.vault.index_writer.build_ann_index", side_effect=ValueError("bad index")):
+        with pytest.raises(ValueError):
+            await vault_manager.index_vault("test_vault")
+            
+    for name, content in before.items():
+        assert (index_dir / name).read_bytes() == content
+    assert not list(index_dir.glob("*.tmp"))
+    
+    # The untouched state still lines up with the old rows
+    vault_manager.faiss_index_type = None
+    stats = await vault_manager.index_vault("test_vault")
+    assert stats["unchanged_files"] == 2
+
+@pytest.mark.asyncio
+async def test_reindex_after_model_change(vault_manager, test_vault):
+    """Test rows embedded by a different model are never reused."""
+    for i in range(3):
+        (test_vault / f"test{i}.md").write_text(f"# Test {i}\nThis is test content {i}")
+    vault_manager.add_vault(
+        name="test_vault",
+        path=str(test_vault),
+        file_types=["md"],
+        enabled=True
+    )
+    await vault_manager.index_vault("test_vault")
+    
+    # The embeddings manager is shared across tests, so only patch its name
+    with patch.object(vault_manager.embeddings_manager, "model_name", "other-model"):
+        stats = await vault_manager.index_vault("test_vault")
+        assert stats["unchanged_files"] == 0
+        assert stats["processed_files"] == 3
+        
+        # A watcher update re-embeds the files it did not list as well
+        (test_vault / "test0.md").write_text("# Test 0\nThis content has changed")
+        with patch.object(vault_manager.embeddings_manager, "model_name", "third-model"):
+            stats = await vault_manager.update_files("test_vault", [str(test_vault / "test0.md")])
+            assert stats["total_files"] == 3
+            assert stats["unchanged_files"] == 0
+    
+    index_dir = vault_manager.config_dir / "indices" / "test_vault"
+    assert json.loads((index_dir / "meta.json").read_text())["model"] == "third-model"
 
 @pytest.mark.asyncio
 async def test_vault_search(vault_manager, test_vault):
@@ -106,6 +225,203 @@ async def test_vault_search(vault_manager, test_vault):
     assert all("content" in r for r in results)
     assert all("vault" in r for r in results)
 
+@pytest.mark.asyncio
+async def test_vault_search_during_reindex(vault_manager, test_vault):
+    """Test a reindex finishing while a search embeds its query."""
+    test_file = test_vault / "test.md"
+    test_file.write_text("# Test\nThis is a unique test phrase for searching.")
+    vault_manager.add_vault(
+        name="test_vault",
+        path=str(test_vault),
+        file_types=["md"],
+        enabled=True
+    )
+    await vault_manager.index_vault("test_vault")
+    await vault_manager.search("unique test phrase")
+    
+    # The reindex lands inside the query batcher's wait, after any index
+    # state read before embedding would already be stale
+    embed_query = vault_manager.embed_query
+    async def embed_during_reindex(query):
+        test_file.write_text("# Test\nThis unique test phrase has been rewritten.")
+        await vault_manager.update_files("test_vault", [str(test_file)])
+        return await embed_query(query)
+    
+    with patch.object(vault_manager, "embed_query", side_effect=embed_during_reindex):
+        results = await vault_manager.search("unique test phrase")
+    assert [r["content"] for r in results] == ["# Test\nThis unique test phrase has been rewritten."]
+
+@pytest.mark.asyncio
+async def test_search_index_loads_off_event_loop(vault_manager, test_vault):
+    """Test reloading the search index does not block the event loop."""
+    (test_vault / "test.md").write_text("# Test\nThis is searchable test content")
+    vault_manager.add_vault(
+        name="test_vault",
+        path=str(test_vault),
+        file_types=["md"],
+        enabled=True
+    )
+    await vault_manager.index_vault("test_vault")
+    
+    started = threading.Event()
+    release = threading.Event()
+    load = vault_manager._load_vault_index
+    
+    def slow_load(*args):
+        started.set()
+        release.wait(1)
+        return load(*args)
+    
+    with patch.object(vault_manager, "_load_vault_index", side_effect=slow_load):
+        search = asyncio.create_task(vault_manager.search("searchable content"))
+        # Other coroutines keep running while the index loads
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+        assert not search.done()
+        release.set()
+        results = await asyncio.wait_for(search, 5)
+    assert [r["content"] for r in results] == ["# Test\nThis is searchable test content"]
+
+@pytest.mark.asyncio
+async def test_vault_search_memory_maps_index(vault_manager, test_vault):
+    """Test dense search scores the index files in place instead of loading them."""
+    for i in range(20):
+        (test_vault / f"test{i}.md").write_text(f"# Note {i}\nThis is searchable note number {i}.")
+    
+    # Without FAISS, search scans the stored int8 matrix itself
+    vault_manager.faiss_index_type = None
+    vault_manager.use_int8 = True
+    vault_manager.add_vault(
+        name="test_vault",
+        path=str(test_vault),
+        file_types=["md"],
+        enabled=True
+    )
+    await vault_manager.index_vault("test_vault")
+    
+    results = await vault_manager.search("searchable note", max_results=5)
+    assert len(results) == 5
+    similarities = [r["similarity"] for r in results]
+    assert similarities == sorted(similarities, reverse=True)
+    
+    matrix, scales = vault_manager._dense_indices["test_vault"]
+    assert isinstance(matrix, np.memmap) and isinstance(scales, np.memmap)
+
+@pytest.mark.asyncio
+async def test_vault_search_usearch(vault_manager, test_vault):
+    """Test search through a USearch HNSW index."""
+    pytest.importorskip("usearch")
+    for i in range(20):
+        (test_vault / f"test{i}.md").write_text(f"# Note {i}\nThis is searchable note number {i}.")
+    
+    vault_manager.faiss_index_type = "usearch"
+    vault_manager.add_vault(
+        name="test_vault",
+        path=str(test_vault),
+        file_types=["md"],
+        enabled=True
+    )
+    await vault_manager.index_vault("test_vault")
+    
+    index_dir = vault_manager.config_dir / "indices" / "test_vault"
+    assert (index_dir / "index.usearch").exists()
+    assert not (index_dir / "index.faiss").exists()
+    assert not (index_dir / "embeddings_i8.npy").exists()
+    
+    results = await vault_manager.search("searchable note", max_results=5)
+    assert 0 < len(results) <= 5
+    similarities = [r["similarity"] for r in results]
+    assert similarities == sorted(similarities, reverse=True)
+    assert "test_vault" in vault_manager._ann_indices
+
+@pytest.mark.asyncio
+async def test_legacy_index_normalized_on_load(vault_manager, test_vault):
+    """Test indices without the normalized flag are normalized before search."""
+    for i in range(5):
+        (test_vault / f"test{i}.md").write_text(f"# Note {i}\nThis is searchable note number {i}.")
+    # Exact scores to compare against
+    vault_manager.faiss_index_type = None
+    vault_manager.use_int8 = False
+    vault_manager.add_vault(
+        name="test_vault",
+        path=str(test_vault),
+        file_types=["md"],
+        enabled=True
+    )
+    await vault_manager.index_vault("test_vault")
+    expected = await vault_manager.search("searchable note", max_results=3)
+    
+    # Rewrite the index as an older version would have left it
+    index_dir = vault_manager.config_dir / "indices" / "test_vault"
+    stored = np.load(index_dir / "embeddings.npy")
+    np.save(index_dir / "embeddings.npy", stored * 3)
+    (index_dir / "meta.json").unlink()
+    
+    results = await vault_manager.search("searchable note", max_results=3)
+    np.testing.assert_allclose(
+        [r["similarity"] for r in results], [r["similarity"] for r in expected], atol=1e-2
+    )
+
+@pytest.mark.asyncio
+async def test_watcher_update_defers_ann_rebuild(vault_manager, test_vault):
+    """Test file updates are searched densely until the ANN index is rebuilt."""
+    pytest.importorskip("faiss")
+    for i in range(5):
+        (test_vault / f"test{i}.md").write_text(f"# Note {i}\nThis is searchable note number {i}.")
+    vault_manager.faiss_index_type = "flat"
+    vault_manager.add_vault(
+        name="test_vault",
+        path=str(test_vault),
+        file_types=["md"],
+        enabled=True
+    )
+    await vault_manager.index_vault("test_vault")
+    index_dir = vault_manager.config_dir / "indices" / "test_vault"
+    assert (index_dir / "index.faiss").exists()
+    
+    changed = test_vault / "test0.md"
+    changed.write_text("# Note 0\nThis searchable note has been edited.")
+    with patch("src.vault.vault_manager.ANN_REBUILD_DELAY", 0):
+        await vault_manager.update_files("test_vault", [str(changed)])
+        
+        # The stale index is gone and the update is scored densely meanwhile;
+        # checked without awaiting, before the rebuild gets to run
+        assert not (index_dir / "index.faiss").exists()
+        vault_manager._ensure_search_index()
+        assert "test_vault" in vault_manager._dense_indices
+        assert "test_vault" not in vault_manager._ann_indices
+        
+        await vault_manager._ann_rebuilds["test_vault"]
+    
+    assert (index_dir / "index.faiss").exists()
+    assert not (index_dir / "embeddings_i8.npy").exists()
+    assert json.loads((index_dir / "meta.json").read_text())["faiss_index"] == "flat"
+    results = await vault_manager.search("searchable note", max_results=5)
+    assert len(results) == 5
+    assert "test_vault" in vault_manager._ann_indices
+
+def test_pq_index_reranks_against_embeddings():
+    """Test PQ search returns exact scores for re-ranked candidates."""
+    pytest.importorskip("faiss")
+    from src.vault import faiss_index
+    
+    rng = np.random.default_rng(0)
+    embeddings = rng.standard_normal((10_000, 32)).astype(np.float32)
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+    
+    index = faiss_index.build_index(embeddings, "pq")
+    # Eight-dimension subvectors: one byte of code per 8 dimensions
+    assert index.sa_code_size() == 4
+    
+    query = embeddings[42]
+    indices, scores = faiss_index.search_index(index, query, 5, embeddings)
+    assert indices[0] == 42
+    np.testing.assert_allclose(scores, embeddings[indices] @ query, rtol=1e-5)
+    assert list(scores) == sorted(scores, reverse=True)
+    
+    # Too few rows to train codebooks falls back to scalar quantization
+    assert faiss_index.resolve_index_type("pq", 1_000) == "sq8"
+
 @pytest.mark.asyncio
 async def test_error_handling(vault_manager):
     """Test error handling."""
@@ -162,4 +478,43 @@ def test_file_watching(vault_manager, test_vault):
     
     # Test removing vault stops observer
     vault_manager.remove_vault("test_vault")
-    assert "test_vault" not in vault_manager.observers 
\ No newline at end of file
+    assert "test_vault" not in vault_manager.observers
+
+@pytest.mark.asyncio
+async def test_file_events_debounced():
+    """Test file events are coalesced into one sorted batch after a quiet period."""
+    batches = []
+    
+    async def on_change(paths):
+        batches.append(paths)
+    
+    loop = asyncio.get_running_loop()
+    handler = VaultEventHandler(on_change, get_loop=lambda: loop, delay=0.2)
+    
+    handler.on_modified(FileModifiedEvent("/vault/c.md"))
+    handler.on_moved(FileMovedEvent("/vault/a.md", "/vault/b.md"))
+    handler._debounce_file_event("/vault/c.md")
+    await asyncio.sleep(0.15)
+    assert batches == []
+    
+    # A later event pushes the flush back past the original deadline
+    handler._debounce_file_event("/vault/d.md")
+    await asyncio.sleep(0.15)
+    assert batches == []
+    
+    await asyncio.wait_for(handler._flush_task, 1)
+    assert batches == [["/vault/a.md", "/vault/b.md", "/vault/c.md", "/vault/d.md"]]
+
+
+def test_iter_vault_files_skips_hidden_dirs(test_vault):
+    """Test the vault walker prunes hidden and tooling directories."""
+    (test_vault / "notes").mkdir()
+    (test_vault / "notes" / "a.md").write_text("a")
+    (test_vault / "b.txt").write_text("b")
+    (test_vault / "c.pdf").write_text("c")
+    for skipped in [".obsidian", ".git", "node_modules"]:
+        (test_vault / skipped).mkdir()
+        (test_vault / skipped / "hidden.md").write_text("hidden")
+    
+    files = sorted(Path(p).name for p in iter_vault_files(str(test_vault), ["md", "txt"]))
+    assert files == ["a.md", "b.txt"]